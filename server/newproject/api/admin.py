@@ -1,3 +1,231 @@
-from django.contrib import admin
+from collections import Counter
 
-# Register your models here.
+from django.conf import settings
+from django.contrib import admin, messages
+from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.core.paginator import Paginator
+from django.db import connections, transaction
+from django.db.models import BooleanField, Q
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from . import audit, cdn
+from .models import AuditLog, College, Department, Partnerships, User
+from .signals import bump_partnership_counts
+
+
+# =========================================================
+# 🛠️ Django admin, sized for big tables
+# - changelists: every FK shown is in list_select_related (Department.__str__
+#   reads its college), no unfiltered COUNT(*) (see EstimatedCountPaginator)
+# - forms: autocomplete / raw id widgets instead of <select> with every row
+# - bulk actions: one UPDATE per batch, counters/CDN/audit adjusted by hand
+#   (QuerySet.update() skips the signals, like api/reconcile.py)
+# =========================================================
+
+def estimated_count(queryset):
+    """
+    PostgreSQL's row estimate (pg_class.reltuples, summed over partitions) for an
+    unfiltered queryset. None when it has a WHERE clause or isn't on PostgreSQL.
+    """
+    query = queryset.query
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql' or query.where or query.distinct:
+        return None
+
+    table = queryset.model._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT COALESCE(
+                -- partitioned: the partitions (ANALYZE also stores their total on the parent)
+                (SELECT SUM(GREATEST(reltuples, 0)) FROM pg_class
+                 WHERE oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = to_regclass(%s))),
+                (SELECT GREATEST(reltuples, 0) FROM pg_class WHERE oid = to_regclass(%s))
+            )
+            """,
+            [table, table],
+        )
+        value = cursor.fetchone()[0]
+    return int(value) if value is not None else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """Unfiltered changelists past ADMIN_EXACT_COUNT_LIMIT rows show an estimate instead of COUNT(*)."""
+
+    @cached_property
+    def count(self):
+        estimate = estimated_count(self.object_list)
+        if estimate is not None and estimate > getattr(settings, 'ADMIN_EXACT_COUNT_LIMIT', 10000):
+            return estimate
+        return super().count
+
+
+class LargeTableMixin:
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False   # "x of y selected" would COUNT(*) the whole table again
+    list_per_page = 50
+
+
+# =========================================================
+# 👤 Users
+# =========================================================
+
+@admin.register(User)
+class UserAdmin(LargeTableMixin, BaseUserAdmin):
+    list_display = ('username', 'email', 'role', 'college', 'department', 'is_active', 'is_staff')
+    list_select_related = ('college', 'department__college')
+    list_filter = ('role', 'is_active', 'is_staff')
+    # Exact, case-insensitive: user_username_upper_idx / user_email_upper_idx (the inherited
+    # icontains on four columns scans the whole table)
+    search_fields = ('=username', '=email')
+    autocomplete_fields = ('college', 'department')
+    fieldsets = BaseUserAdmin.fieldsets + (
+        ('Scope', {'fields': ('role', 'college', 'department')}),
+    )
+    add_fieldsets = BaseUserAdmin.add_fieldsets + (
+        ('Scope', {'fields': ('role', 'college', 'department')}),
+    )
+    actions = ('activate_users', 'deactivate_users')
+
+    def set_active(self, request, queryset, value):
+        users = User.objects.filter(pk__in=queryset.order_by().values('pk')).exclude(is_active=value)
+        if not value:
+            users = users.exclude(pk=request.user.pk)   # never lock yourself out
+
+        with transaction.atomic():
+            rows = list(users.select_for_update().values('pk', 'username', 'role'))
+            User.objects.filter(pk__in=[row['pk'] for row in rows]).update(is_active=value)
+
+        for row in rows:
+            audit.record(request.user, AuditLog.ACTION_UPDATE, User(pk=row['pk'], username=row['username'], role=row['role']),
+                         {'is_active': [not value, value]})
+        audit.flush()
+        return len(rows)
+
+    @admin.action(permissions=['change'], description='Activate selected users')
+    def activate_users(self, request, queryset):
+        changed = self.set_active(request, queryset, True)
+        self.message_user(request, f'{changed} user(s) activated.', messages.SUCCESS)
+
+    @admin.action(permissions=['change'], description='Deactivate selected users')
+    def deactivate_users(self, request, queryset):
+        changed = self.set_active(request, queryset, False)
+        self.message_user(request, f'{changed} user(s) deactivated.', messages.SUCCESS)
+
+
+# =========================================================
+# 🏫 Colleges / departments
+# Searched by exact code (college_code_upper_idx / department_code_upper_idx),
+# which also feeds the college / department autocompletes
+# =========================================================
+
+@admin.register(College)
+class CollegeAdmin(LargeTableMixin, admin.ModelAdmin):
+    list_display = ('code', 'name', 'admin', 'department_count', 'partnership_count', 'active_partnership_count')
+    list_select_related = ('admin',)
+    search_fields = ('=code',)
+    autocomplete_fields = ('admin',)
+    readonly_fields = ('department_count', 'partnership_count', 'active_partnership_count', 'created_at', 'updated_at')
+
+
+@admin.register(Department)
+class DepartmentAdmin(LargeTableMixin, admin.ModelAdmin):
+    list_display = ('name', 'code', 'college', 'admin', 'partnership_count', 'active_partnership_count')
+    list_select_related = ('college', 'admin')
+    list_filter = ('college',)
+    search_fields = ('=code', '=college__code')
+    autocomplete_fields = ('college', 'admin')
+    readonly_fields = ('partnership_count', 'active_partnership_count', 'created_at', 'updated_at')
+
+    def get_queryset(self, request):
+        # Also used by the department autocomplete, which prints __str__ (→ college.code)
+        return super().get_queryset(request).select_related('college')
+
+
+# =========================================================
+# 🤝 Partnerships
+# =========================================================
+
+def escape_like(value):
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+@admin.register(Partnerships)
+class PartnershipsAdmin(LargeTableMixin, admin.ModelAdmin):
+    list_display = ('title', 'department', 'college', 'status', 'date_started', 'date_ended', 'updated_at')
+    list_select_related = ('department__college', 'college')
+    # status → partnership_status_end_idx, college → partnership_college_start_idx,
+    # date_started → partnership_dates_idx (and partition pruning)
+    list_filter = ('status', 'college', 'date_started')
+    search_fields = ('title', '=contact_email')
+    # The default -created_at has no index; newest id first is an index scan
+    ordering = ('-pk',)
+    autocomplete_fields = ('department',)
+    raw_id_fields = ('created_by',)
+    readonly_fields = ('college', 'created_at', 'updated_at')
+    actions = ('mark_active', 'mark_inactive')
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        A number finds that id. On PostgreSQL the title is matched with ILIKE, which
+        the trigram index from migration 0022 answers (Django's icontains is
+        UPPER(title) LIKE ..., which it can't); contact_email goes through
+        partnership_email_upper_idx either way.
+        """
+        term = search_term.strip()
+        if term.isdigit():
+            return queryset.filter(pk=term), False
+        if term and connections[queryset.db].vendor == 'postgresql':
+            title = RawSQL(
+                f'"{Partnerships._meta.db_table}"."title" ILIKE %s',
+                [f'%{escape_like(term)}%'],
+                output_field=BooleanField(),
+            )
+            return queryset.filter(Q(title) | Q(contact_email__iexact=term)), False
+        return super().get_search_results(request, queryset, search_term)
+
+    def set_status(self, request, queryset, status, batch_size=1000):
+        """Set-based status change, one transaction per batch. Returns the number of rows changed."""
+        sign = 1 if status == Partnerships.STATUS_ACTIVE else -1
+        # Plain pk subquery: the changelist's outer joins can't be locked FOR UPDATE
+        pending = Partnerships.objects.filter(pk__in=queryset.order_by().values('pk')).exclude(status=status)
+        changed = 0
+
+        while True:
+            with transaction.atomic():
+                rows = list(
+                    pending.select_for_update()
+                    .order_by('pk')
+                    .values('pk', 'title', 'status', 'department_id')[:batch_size]
+                )
+                if not rows:
+                    break
+
+                Partnerships.objects.filter(pk__in=[row['pk'] for row in rows]).update(
+                    status=status,
+                    updated_at=timezone.now(),
+                )
+                for department_id, n in Counter(row['department_id'] for row in rows).items():
+                    bump_partnership_counts(department_id, 0, sign * n)
+
+            for row in rows:
+                audit.record(request.user, AuditLog.ACTION_UPDATE, Partnerships(pk=row['pk'], title=row['title']),
+                             {'status': [row['status'], status]})
+            changed += len(rows)
+
+        if changed:
+            cdn.purge(cdn.all_keys())
+            audit.flush()
+        return changed
+
+    @admin.action(permissions=['change'], description='Mark selected partnerships as active')
+    def mark_active(self, request, queryset):
+        changed = self.set_status(request, queryset, Partnerships.STATUS_ACTIVE)
+        self.message_user(request, f'{changed} partnership(s) marked active.', messages.SUCCESS)
+
+    @admin.action(permissions=['change'], description='Mark selected partnerships as inactive')
+    def mark_inactive(self, request, queryset):
+        changed = self.set_status(request, queryset, Partnerships.STATUS_INACTIVE)
+        self.message_user(request, f'{changed} partnership(s) marked inactive.', messages.SUCCESS)
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        from . import signals  # noqa: F401  (counter hooks)
+        from . import cdn  # noqa: F401  (CDN purge hooks)
+        from . import tasks  # noqa: F401  (registers background jobs)
+        from .schema import load_schema_url
+        load_schema_url()  # before WhiteNoise indexes STATIC_ROOT (see api/schema.py)
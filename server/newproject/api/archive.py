@@ -0,0 +1,128 @@
+from collections import Counter
+from datetime import timedelta
+
+from django.db import connections, transaction
+from django.utils import timezone
+
+from . import audit, cdn
+from .models import ArchivedPartnership, AuditLog, Partnerships
+from .signals import bump_partnership_counts
+
+
+# =========================================================
+# 🗄️ Archive tier: partnerships that ended long ago
+# `manage.py archive_partnerships` moves rows whose date_ended is older than
+# ARCHIVE_AFTER_DAYS into ArchivedPartnership (same id, same logo file), so
+# admin lists, growth and the counters only deal with the working set.
+# Read them back with /api/archive/partnerships/ or ?include_archived=true.
+# =========================================================
+
+# Copied as-is between the two tables
+FIELDS = (
+    'id', 'department_id', 'college_id', 'title', 'description', 'status',
+    'logo', 'logo_width', 'logo_height', 'logo_color', 'logo_placeholder',
+    'contact_person', 'contact_email', 'contact_phone', 'date_started', 'date_ended',
+    'created_by_id', 'created_at', 'updated_at',
+)
+
+
+def cutoff_for(today, days):
+    return today - timedelta(days=days)
+
+
+def archivable(cutoff):
+    """Partnerships that ended before `cutoff` (uses partnership_dates_idx / partnership_status_end_idx)."""
+    return Partnerships.objects.filter(date_ended__lt=cutoff)
+
+
+def _delete_partnerships(ids):
+    # A plain DELETE: QuerySet.delete() would fire the per-row counter/CDN signals,
+    # which the caller replaces with one adjustment per batch (nothing references these rows)
+    connection = connections[Partnerships.objects.db]
+    table = connection.ops.quote_name(Partnerships._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {table} WHERE id IN ({', '.join(['%s'] * len(ids))})", ids)
+
+
+def _bump_counts(rows, sign):
+    totals, active = Counter(), Counter()
+    for row in rows:
+        totals[row['department_id']] += 1
+        active[row['department_id']] += row['status'] == Partnerships.STATUS_ACTIVE
+    for department_id, total in totals.items():
+        bump_partnership_counts(department_id, sign * total, sign * active[department_id])
+
+
+def _audit(actor, rows, archived):
+    # One entry per row in the partnership's history, written once per batch (like the admin bulk actions)
+    for row in rows:
+        audit.record(actor, AuditLog.ACTION_UPDATE, Partnerships(pk=row['id'], title=row['title']),
+                     {'archived': [not archived, archived]})
+    audit.flush()
+
+
+def archive(cutoff, batch_size=500, actor=None):
+    """
+    Move every partnership that ended before `cutoff` to the archive, one
+    transaction per batch. Returns the ids that were moved.
+    """
+    moved = []
+
+    while True:
+        with transaction.atomic():
+            # Rows someone is editing right now are skipped; the next run picks them up
+            rows = list(
+                archivable(cutoff)
+                .select_for_update(skip_locked=True)
+                .order_by('pk')
+                .values(*FIELDS)[:batch_size]
+            )
+            if not rows:
+                break
+
+            archived_at = timezone.now()
+            ArchivedPartnership.objects.bulk_create([
+                ArchivedPartnership(archived_at=archived_at, **row) for row in rows
+            ])
+            ids = [row['id'] for row in rows]
+            _delete_partnerships(ids)
+
+            _bump_counts(rows, -1)
+            cdn.purge(cdn.all_keys())
+
+        _audit(actor, rows, True)
+        moved.extend(ids)
+
+    return moved
+
+
+def restore(ids, actor=None):
+    """
+    Move archived partnerships back to the hot table (same ids). Returns the ids
+    restored. ValueError if one of the ids is in use there: a partitioned table
+    only enforces unique ids within each partition (see api/partitioning.py).
+    """
+    with transaction.atomic():
+        rows = list(
+            ArchivedPartnership.objects.select_for_update()
+            .filter(pk__in=ids)
+            .order_by('pk')
+            .values(*FIELDS)
+        )
+        if not rows:
+            return []
+
+        taken = list(Partnerships.objects.filter(pk__in=[row['id'] for row in rows]).values_list('pk', flat=True))
+        if taken:
+            raise ValueError(f"Partnership ids already in use: {', '.join(map(str, sorted(taken)))}")
+
+        # bulk_create: no save() → the logo is not re-measured and updated_at becomes now
+        Partnerships.objects.bulk_create([Partnerships(**row) for row in rows])
+        restored = [row['id'] for row in rows]
+        ArchivedPartnership.objects.filter(pk__in=restored).delete()
+
+        _bump_counts(rows, 1)
+        cdn.purge(cdn.all_keys())
+
+    _audit(actor, rows, False)
+    return restored
@@ -0,0 +1,134 @@
+import atexit
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.db import connection
+from django.db.models.fields.files import FieldFile
+from django.utils import timezone
+
+from .models import AuditLog
+
+
+logger = logging.getLogger(__name__)
+
+# Recorded as changed, but the values never leave the database row
+SECRET_FIELDS = {'password'}
+
+
+# =========================================================
+# 📝 Field-level diffs
+# =========================================================
+
+def snapshot(instance):
+    """Editable field values of a model instance (FKs as ids, files as names)."""
+    data = {}
+    for field in instance._meta.concrete_fields:
+        if field.primary_key or not field.editable:
+            continue
+        value = field.value_from_object(instance)
+        if isinstance(value, FieldFile):
+            value = value.name or None
+        data[field.name] = value
+    return data
+
+
+def diff(before, after):
+    """{field: [old, new]} for every field that changed."""
+    changes = {}
+    for name in list(after) + [name for name in before if name not in after]:
+        old, new = before.get(name), after.get(name)
+        if old != new:
+            changes[name] = ['***', '***'] if name in SECRET_FIELDS else [old, new]
+    return changes
+
+
+# =========================================================
+# 🧺 Per-worker buffer, flushed with bulk_create
+# =========================================================
+
+class AuditBuffer:
+    """
+    Audit rows are appended in memory and written in one bulk_create when
+    AUDIT_BUFFER_SIZE rows are waiting or AUDIT_FLUSH_SECONDS have passed,
+    so a mutation never waits on an extra INSERT. Flushed on worker exit too.
+    """
+
+    def __init__(self):
+        self.size = getattr(settings, 'AUDIT_BUFFER_SIZE', 100)
+        self.interval = getattr(settings, 'AUDIT_FLUSH_SECONDS', 5)
+        self._reset()
+        atexit.register(self.flush)
+
+    def _reset(self):
+        self.pid = os.getpid()
+        self.lock = threading.Lock()
+        self.pending = []
+        self.wakeup = threading.Event()
+        self.thread = None
+
+    def add(self, entry):
+        if self.pid != os.getpid():
+            self._reset()  # forked worker: don't inherit the parent's rows or thread
+
+        with self.lock:
+            self.pending.append(entry)
+            full = len(self.pending) >= self.size
+
+        self._ensure_thread()
+        if full:
+            self.wakeup.set()
+
+    def _ensure_thread(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self._run, name='audit-flusher', daemon=True)
+            self.thread.start()
+
+    def _run(self):
+        while True:
+            self.wakeup.wait(self.interval)
+            self.wakeup.clear()
+            self.flush()
+            # This thread's own connection; don't keep it open between flushes
+            connection.close()
+
+    def flush(self):
+        with self.lock:
+            batch, self.pending = self.pending, []
+        if not batch:
+            return
+
+        try:
+            AuditLog.objects.bulk_create(batch, batch_size=500)
+        except Exception:
+            logger.exception("Could not write %s audit rows; will retry", len(batch))
+            with self.lock:
+                # Put them back (bounded, so a dead database can't eat all memory)
+                self.pending = (batch + self.pending)[-self.size * 10:]
+
+
+buffer = AuditBuffer()
+
+
+def describe(instance):
+    try:
+        return str(instance)[:255]
+    except Exception:  # e.g. Department without a college
+        return f'{instance._meta.model_name} #{instance.pk}'
+
+
+def record(user, action, instance, changes, object_id=None):
+    buffer.add(AuditLog(
+        actor_id=user.pk if user is not None and user.is_authenticated else None,
+        action=action,
+        model=instance._meta.model_name,
+        object_id=object_id if object_id is not None else instance.pk,
+        object_repr=describe(instance),
+        changes=changes,
+        created_at=timezone.now(),
+    ))
+
+
+def flush():
+    buffer.flush()
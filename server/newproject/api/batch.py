@@ -0,0 +1,168 @@
+import io
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.handlers.base import BaseHandler
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import connections
+from django.http import HttpResponse
+from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.views import APIView
+
+from .middleware import ENVELOPE_PATHS
+
+
+logger = logging.getLogger(__name__)
+
+
+# =========================================================
+# 📦 Batch endpoint: several API calls in one HTTP round trip
+#
+# POST /api/batch/
+#   {"requests": [
+#       {"id": "college", "method": "GET", "path": "/api/colleges/3/"},
+#       {"id": "departments", "method": "GET", "path": "/api/departments/?college=3"},
+#       {"method": "PATCH", "path": "/api/partnerships/9/", "body": {"status": "inactive"}}
+#   ]}
+# → {"responses": [{"id": "college", "status": 200, "body": {...}}, ...]}  (same order)
+#
+# Sub-requests run through the normal middleware + URL router as the caller
+# (authenticated once, for the whole batch). Consecutive GETs run concurrently;
+# a write waits for everything before it and blocks everything after it.
+# =========================================================
+
+READ_METHODS = ('GET', 'HEAD')
+WRITE_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+
+# Parent headers a sub-request must not inherit
+DROPPED_META = (
+    'CONTENT_LENGTH', 'CONTENT_TYPE', 'QUERY_STRING', 'PATH_INFO',
+    'HTTP_ACCEPT_ENCODING',                            # body is embedded, not compressed
+    'HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE',    # no 304s inside a batch
+)
+
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'BATCH_MAX_WORKERS', 4),
+    thread_name_prefix='batch',
+)
+
+
+@lru_cache(maxsize=None)
+def handler():
+    """The project's middleware chain + URL resolver, without the WSGI layer (no request signals)."""
+    handler = BaseHandler()
+    handler.load_middleware()
+    return handler
+
+
+def build_request(parent, method, path, body=None):
+    url = urlsplit(path)
+    payload = json.dumps(body).encode() if body is not None else b''
+
+    environ = {key: value for key, value in parent.META.items() if key not in DROPPED_META}
+    environ.update({
+        'REQUEST_METHOD': method,
+        'PATH_INFO': url.path,
+        'QUERY_STRING': url.query,
+        'CONTENT_TYPE': 'application/json',
+        'CONTENT_LENGTH': str(len(payload)),
+        'wsgi.input': io.BytesIO(payload),
+    })
+
+    request = WSGIRequest(environ)
+    # DRF uses these instead of re-running JWT authentication for every sub-request
+    request._force_auth_user = parent.user
+    request._force_auth_token = parent.auth
+    return request
+
+
+def dispatch(request):
+    """Run one sub-request; returns (status, JSON bytes of the body)."""
+    try:
+        response = handler().get_response(request)
+        if response.streaming:
+            content = b''.join(response.streaming_content)
+        else:
+            content = response.content
+        response.close()
+
+        if not content:
+            return response.status_code, b'null'
+        if response.get('Content-Type', '').startswith('application/json'):
+            return response.status_code, content
+        return response.status_code, json.dumps(content.decode('utf-8', 'replace')).encode()
+    except Exception:
+        logger.exception("Batch sub-request %s %s failed", request.method, request.path)
+        return 500, b'{"detail": "Internal server error."}'
+
+
+def dispatch_in_thread(request):
+    try:
+        return dispatch(request)
+    finally:
+        connections.close_all()   # this worker thread's connections only
+
+
+def parse(data):
+    items = data.get('requests') if isinstance(data, dict) else None
+    if not isinstance(items, list) or not items:
+        raise ValidationError({'requests': 'A non-empty list of {"method", "path"} objects.'})
+
+    limit = getattr(settings, 'BATCH_MAX_REQUESTS', 20)
+    if len(items) > limit:
+        raise ValidationError({'requests': f'At most {limit} sub-requests per batch.'})
+
+    parsed = []
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            raise ValidationError({'requests': f'[{i}] must be an object.'})
+
+        method = str(item.get('method', 'GET')).upper()
+        path = item.get('path')
+        if method not in READ_METHODS + WRITE_METHODS:
+            raise ValidationError({'requests': f'[{i}] method {method} is not allowed.'})
+        if not isinstance(path, str) or not path.startswith('/api/') or urlsplit(path).path in ENVELOPE_PATHS:
+            raise ValidationError({'requests': f'[{i}] path must be an /api/ URL (and not the batch endpoint).'})
+
+        parsed.append((item.get('id', i), method, path, item.get('body')))
+    return parsed
+
+
+class BatchView(APIView):
+    """POST /api/batch/ (format above). Each sub-request checks its own permissions."""
+    permission_classes = [permissions.AllowAny]
+    schema = None  # envelope only; the sub-requests are documented on their own endpoints
+
+    def post(self, request):
+        items = parse(request.data)
+        results = [None] * len(items)
+        reads = []
+
+        def run_reads():
+            futures = [(i, _executor.submit(dispatch_in_thread, req)) for i, req in reads]
+            for i, future in futures:
+                results[i] = future.result()
+            reads.clear()
+
+        for i, (_, method, path, body) in enumerate(items):
+            sub = build_request(request, method, path, body)
+            if method in READ_METHODS:
+                reads.append((i, sub))
+                continue
+
+            run_reads()                      # writes see everything before them...
+            results[i] = dispatch(sub)       # ...and run in this thread, in order
+
+        run_reads()
+
+        parts = [
+            b'{"id":' + json.dumps(item_id).encode() + b',"status":' + str(status).encode() + b',"body":' + body + b'}'
+            for (item_id, _, _, _), (status, body) in zip(items, results)
+        ]
+        # Bodies are already-rendered JSON: splice them in instead of parsing and re-rendering
+        return HttpResponse(b'{"responses":[' + b','.join(parts) + b']}', content_type='application/json')
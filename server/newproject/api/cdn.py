@@ -0,0 +1,223 @@
+import logging
+import threading
+from collections import deque
+from functools import lru_cache
+
+import requests
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.cache import patch_cache_control
+from django.utils.module_loading import import_string
+
+from .models import College, Department, Partnerships
+
+
+logger = logging.getLogger(__name__)
+
+
+# =========================================================
+# 🌐 CDN caching for the public viewing endpoints
+# Anonymous GETs get `Cache-Control: public, s-maxage=..., stale-while-revalidate=...`
+# and are tagged with surrogate keys ("partnerships", "partnership-12", ...).
+# When a row changes, its keys are purged through CDN_PURGER after commit.
+# =========================================================
+
+# model → (collection key, item key prefix)
+KEYS = {
+    College: ('colleges', 'college'),
+    Department: ('departments', 'department'),
+    Partnerships: ('partnerships', 'partnership'),
+}
+
+
+def item_key(model, pk):
+    return f'{KEYS[model][1]}-{pk}'
+
+
+def response_keys(model, data):
+    """Collection key + one key per row in a list/detail response (capped, see CDN_MAX_SURROGATE_KEYS)."""
+    collection = KEYS[model][0]
+    rows = data if isinstance(data, list) else [data]
+    ids = [row['id'] for row in rows if isinstance(row, dict) and 'id' in row]
+
+    if len(ids) > getattr(settings, 'CDN_MAX_SURROGATE_KEYS', 1000):
+        return [collection]   # huge partnership lists: purged via the collection key
+    return [collection] + [item_key(model, pk) for pk in ids]
+
+
+def instance_keys(instance):
+    """Keys to purge when `instance` changes (its own + the parents whose counters moved)."""
+    model = type(instance)
+    keys = {KEYS[model][0], item_key(model, instance.pk)}
+
+    if model is Partnerships:
+        keys.add(item_key(Department, instance.department_id))
+        if instance.college_id:
+            keys.add(item_key(College, instance.college_id))
+    elif model is Department and instance.college_id:
+        keys.add(item_key(College, instance.college_id))
+
+    return keys
+
+
+def all_keys():
+    """Every cached viewing response (bulk UPDATEs: reconcile_status, recount, backfills)."""
+    return [collection for collection, _ in KEYS.values()]
+
+
+# =========================================================
+# 🧹 Purgers (CDN_PURGER = {"BACKEND": ..., "OPTIONS": {...}})
+# =========================================================
+
+class NullPurger:
+    """No CDN (local dev/tests): keeps the last purges in memory so they can be inspected."""
+
+    def __init__(self):
+        self.purged = deque(maxlen=100)
+
+    def purge(self, keys):
+        self.purged.append(list(keys))
+        logger.debug("CDN purge (no-op): %s", ' '.join(keys))
+
+
+class HttpPurger:
+    """
+    One request per purge with the keys in a header — Varnish (xkey), nginx or
+    any local caching proxy:  {"url": "http://cache:6081/", "method": "PURGE", "header": "xkey"}
+    """
+
+    def __init__(self, url, method='PURGE', header='Surrogate-Key', timeout=5):
+        self.url, self.method, self.header, self.timeout = url, method, header, timeout
+
+    def purge(self, keys):
+        response = requests.request(self.method, self.url, headers={self.header: ' '.join(keys)}, timeout=self.timeout)
+        response.raise_for_status()
+
+
+class FastlyPurger:
+    API = 'https://api.fastly.com/service/{service_id}/purge'
+    BATCH = 256   # keys per request
+
+    def __init__(self, service_id, api_token, soft=True, timeout=5):
+        self.url = self.API.format(service_id=service_id)
+        self.headers = {'Fastly-Key': api_token}
+        if soft:
+            self.headers['Fastly-Soft-Purge'] = '1'   # mark stale → stale-while-revalidate still applies
+        self.timeout = timeout
+
+    def purge(self, keys):
+        for i in range(0, len(keys), self.BATCH):
+            response = requests.post(
+                self.url,
+                headers={**self.headers, 'Surrogate-Key': ' '.join(keys[i:i + self.BATCH])},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+
+
+class CloudflarePurger:
+    API = 'https://api.cloudflare.com/client/v4/zones/{zone_id}/purge_cache'
+    BATCH = 30    # tags per request
+
+    def __init__(self, zone_id, api_token, timeout=5):
+        self.url = self.API.format(zone_id=zone_id)
+        self.headers = {'Authorization': f'Bearer {api_token}'}
+        self.timeout = timeout
+
+    def purge(self, keys):
+        for i in range(0, len(keys), self.BATCH):
+            response = requests.post(self.url, headers=self.headers, json={'tags': keys[i:i + self.BATCH]}, timeout=self.timeout)
+            response.raise_for_status()
+
+
+@lru_cache(maxsize=None)
+def get_purger():
+    config = getattr(settings, 'CDN_PURGER', None) or {'BACKEND': 'api.cdn.NullPurger'}
+    return import_string(config['BACKEND'])(**config.get('OPTIONS', {}))
+
+
+# ---------- batching: one purge per transaction, sent off the request thread ----------
+
+_pending = threading.local()
+
+
+def purge(keys):
+    """Purge `keys` once the current transaction commits (immediately in autocommit)."""
+    pending = getattr(_pending, 'keys', None)
+    if pending is None:
+        pending = _pending.keys = set()
+    pending.update(keys)
+    # Every call schedules a flush; the first one after commit takes all the keys
+    transaction.on_commit(_flush)
+
+
+def _flush():
+    keys = sorted(getattr(_pending, 'keys', None) or ())
+    if not keys:
+        return
+    _pending.keys = set()
+
+    purger = get_purger()
+    if isinstance(purger, NullPurger):
+        purger.purge(keys)
+    else:
+        threading.Thread(target=_send, args=(purger, keys), name='cdn-purge', daemon=True).start()
+
+
+def _send(purger, keys):
+    try:
+        purger.purge(keys)
+    except Exception:
+        # Cached copies expire on their own (s-maxage); nothing else to do
+        logger.exception("CDN purge failed for %s key(s)", len(keys))
+
+
+@receiver(post_save, sender=College)
+@receiver(post_save, sender=Department)
+@receiver(post_save, sender=Partnerships)
+@receiver(post_delete, sender=College)
+@receiver(post_delete, sender=Department)
+@receiver(post_delete, sender=Partnerships)
+def purge_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        purge(instance_keys(instance))
+
+
+# =========================================================
+# 🏷️ Response headers (viewsets)
+# =========================================================
+
+class CdnCacheMixin:
+    """
+    Cache headers for read-only public viewsets. The policy comes from
+    CDN_CACHE_POLICIES[<route basename>], falling back to CDN_CACHE_POLICIES['default']:
+      {"max_age": browsers, "s_maxage": CDN, "stale_while_revalidate": serve stale while refetching}
+    """
+
+    def cache_policy(self):
+        policies = getattr(settings, 'CDN_CACHE_POLICIES', {})
+        return policies.get(getattr(self, 'basename', None)) or policies.get('default')
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        policy = self.cache_policy()
+        if not policy or request.method not in ('GET', 'HEAD') or response.status_code != 200:
+            return response
+
+        if 'HTTP_AUTHORIZATION' in request.META:
+            # Same data, but shared caches must never store a request that carried credentials
+            patch_cache_control(response, private=True, max_age=policy.get('max_age', 0))
+            return response
+
+        directives = {'max_age': policy.get('max_age', 0), 's_maxage': policy.get('s_maxage', policy.get('max_age', 0))}
+        for name in ('stale_while_revalidate', 'stale_if_error'):
+            if policy.get(name):
+                directives[name] = policy[name]
+        patch_cache_control(response, public=True, **directives)
+
+        keys = response_keys(self.get_queryset().model, response.data)
+        response['Surrogate-Key'] = ' '.join(keys)   # Fastly, Varnish
+        response['Cache-Tag'] = ','.join(keys)       # Cloudflare
+        return response
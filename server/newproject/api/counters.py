@@ -0,0 +1,76 @@
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from . import cdn
+from .models import ArchivedPartnership, College, Department, Partnerships
+
+
+def count_of(queryset, outer_field):
+    """Correlated COUNT(*) of `queryset` rows whose `outer_field` is the outer row."""
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{outer_field: OuterRef('pk')})
+            .order_by()
+            .values(outer_field)
+            .annotate(n=Count('pk'))
+            .values('n')
+        ),
+        0,
+    )
+
+
+def expected_counts():
+    """The true counter values, as expressions (one per counter field)."""
+    active = Partnerships.objects.filter(status=Partnerships.STATUS_ACTIVE)
+    department = {
+        'partnership_count': count_of(Partnerships.objects.all(), 'department'),
+        'active_partnership_count': count_of(active, 'department'),
+    }
+    college = {
+        'department_count': count_of(Department.objects.all(), 'college'),
+        'partnership_count': count_of(Partnerships.objects.all(), 'college'),
+        'active_partnership_count': count_of(active, 'college'),
+    }
+    return {Department: department, College: college}
+
+
+def college_of_department():
+    """The true Partnerships.college_id: its department's college."""
+    return Subquery(Department.objects.filter(pk=OuterRef('department_id')).values('college_id')[:1])
+
+
+def recount(dry_run=False):
+    """
+    Re-sync Partnerships.college_id, then recompute every counter with one
+    set-based UPDATE per table. Returns {name: number of rows that had drifted}.
+    """
+    drifted = {}
+
+    # First: the college counters below are counted through college_id
+    for model in (Partnerships, ArchivedPartnership):
+        name = f'{model.__name__}.college'
+        mismatch = (
+            Q(college__isnull=True, expected_college__isnull=False)
+            | Q(college__isnull=False, expected_college__isnull=True)
+            | (Q(college__isnull=False, expected_college__isnull=False) & ~Q(college_id=F('expected_college')))
+        )
+        drifted[name] = model.objects.annotate(expected_college=college_of_department()).filter(mismatch).count()
+
+        if not dry_run and drifted[name]:
+            model.objects.update(college_id=college_of_department())
+
+    for model, fields in expected_counts().items():
+        expected = {f'expected_{name}': expr for name, expr in fields.items()}
+        mismatch = Q()
+        for name in fields:
+            mismatch |= ~Q(**{name: F(f'expected_{name}')})
+
+        drifted[model.__name__] = model.objects.annotate(**expected).filter(mismatch).count()
+
+        if not dry_run and drifted[model.__name__]:
+            model.objects.update(**fields)
+
+    if not dry_run and any(drifted.values()):
+        cdn.purge(cdn.all_keys())
+
+    return drifted
@@ -0,0 +1,94 @@
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+
+
+REPLICA_ALIAS = 'replica'
+
+# Set per request by ReplicaRoutingMiddleware, read by ReplicaRouter
+_use_replica = ContextVar('use_replica', default=False)
+
+# Replication lag is checked at most once every LAG_CHECK_INTERVAL seconds per worker
+LAG_CHECK_INTERVAL = 5
+_lag_cache = {'checked_at': 0.0, 'healthy': False}
+
+
+def replica_configured():
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+def use_replica(enabled):
+    """Turn replica reads on/off for the current request. Returns a token for reset."""
+    return _use_replica.set(enabled)
+
+
+def reset_replica(token):
+    _use_replica.reset(token)
+
+
+def replica_lag_seconds():
+    """
+    How far behind the primary the replica is, in seconds.
+
+    Replaying everything it has received counts as caught up: the time since
+    the last replayed transaction keeps growing while the primary is idle, so
+    it's only used while WAL is still waiting to be replayed. 0.0 for a
+    non-PostgreSQL replica (no way to tell; treated as in sync), None if the
+    server returned nothing.
+    """
+    connection = connections[REPLICA_ALIAS]
+    if connection.vendor != 'postgresql':
+        return 0.0
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT CASE "
+            "WHEN NOT pg_is_in_recovery() THEN 0 "
+            "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+            "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+            "END"
+        )
+        row = cursor.fetchone()
+    return float(row[0]) if row and row[0] is not None else None
+
+
+def replica_is_healthy():
+    """True when the replica is reachable and within DATABASE_REPLICA_MAX_LAG."""
+    now = time.monotonic()
+    if now - _lag_cache['checked_at'] < LAG_CHECK_INTERVAL:
+        return _lag_cache['healthy']
+
+    try:
+        lag = replica_lag_seconds()
+    except Exception:
+        lag = None
+
+    max_lag = getattr(settings, 'DATABASE_REPLICA_MAX_LAG', 10)
+    _lag_cache['healthy'] = lag is not None and lag <= max_lag
+    _lag_cache['checked_at'] = now
+    return _lag_cache['healthy']
+
+
+class ReplicaRouter:
+    """
+    Sends reads to the 'replica' database only when the current request
+    was marked as replica-safe by ReplicaRoutingMiddleware.
+    Everything else (writes, migrations, background commands) uses 'default'.
+    """
+
+    def db_for_read(self, model, **hints):
+        if _use_replica.get() and replica_configured():
+            return REPLICA_ALIAS
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases point at the same data
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == 'default'
@@ -0,0 +1,126 @@
+import re
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import BooleanField, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+from .models import Partnerships
+
+
+# =========================================================
+# 👯 Near-duplicate partnerships (same organisation, slightly different title)
+# PostgreSQL: pg_trgm — the `%` operator is answered by the GIN trigram index
+# from migration 0022, then ranked by similarity(). `%` compares against
+# pg_trgm.similarity_threshold, set to ours for the query's transaction.
+# Other databases (local dev): the same trigram similarity computed in Python
+# over rows sharing at least one word with the title.
+# =========================================================
+
+def threshold():
+    return getattr(settings, 'DUPLICATE_SIMILARITY_THRESHOLD', 0.4)
+
+
+def trigrams(text):
+    """pg_trgm's trigrams: lower-cased words, each padded with two spaces in front and one behind."""
+    grams = set()
+    for word in re.findall(r'\w+', (text or '').lower()):
+        padded = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a, b):
+    """Same result as pg_trgm's similarity(a, b)."""
+    a, b = trigrams(a), trigrams(b)
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _title_matches_postgres(queryset, title, limit):
+    from django.contrib.postgres.search import TrigramSimilarity
+
+    connection = connections[queryset.db]
+    table = connection.ops.quote_name(Partnerships._meta.db_table)
+    with transaction.atomic(using=queryset.db):
+        with connection.cursor() as cursor:
+            # SET LOCAL: the session default (0.3) would drop matches below it;
+            # ends with the transaction, so pooled connections keep their default
+            cursor.execute("SELECT set_config('pg_trgm.similarity_threshold', %s, true)", [str(threshold())])
+        return list(
+            queryset
+            .filter(RawSQL(f'{table}.title %% %s', (title,), output_field=BooleanField()))
+            .annotate(similarity=TrigramSimilarity('title', title))
+            .filter(similarity__gte=threshold())
+            .order_by('-similarity', 'pk')[:limit]
+        )
+
+
+def _title_matches_python(queryset, title, limit):
+    words = [word for word in re.findall(r'\w+', title.lower()) if len(word) >= 3]
+    if not words:
+        return []
+
+    candidates = Q()
+    for word in words:
+        candidates |= Q(title__icontains=word)
+
+    matches = []
+    for partnership in queryset.filter(candidates):
+        partnership.similarity = similarity(title, partnership.title)
+        if partnership.similarity >= threshold():
+            matches.append(partnership)
+
+    matches.sort(key=lambda p: (-p.similarity, p.pk))
+    return matches[:limit]
+
+
+def find_similar(title=None, email=None, exclude_id=None, limit=5, queryset=None):
+    """
+    Likely duplicates of a partnership: titles at least DUPLICATE_SIMILARITY_THRESHOLD
+    similar, or the same contact email (any department). Best matches first.
+    """
+    queryset = Partnerships.objects.all() if queryset is None else queryset
+    queryset = queryset.order_by()
+    if exclude_id is not None:
+        queryset = queryset.exclude(pk=exclude_id)
+
+    found = {}
+
+    if email:
+        # contact_email__iexact → UPPER(contact_email) = UPPER(%s), see partnership_email_upper_idx
+        for partnership in queryset.filter(contact_email__iexact=email).annotate(
+            similarity=Value(1.0, output_field=FloatField())
+        )[:limit]:
+            partnership.match = 'email'
+            found[partnership.pk] = partnership
+
+    if title and title.strip():
+        if connections[queryset.db].vendor == 'postgresql':
+            matches = _title_matches_postgres(queryset, title, limit)
+        else:
+            matches = _title_matches_python(queryset, title, limit)
+
+        for partnership in matches:
+            if partnership.pk in found:
+                found[partnership.pk].match = 'title+email'
+            else:
+                partnership.match = 'title'
+                found[partnership.pk] = partnership
+
+    return sorted(found.values(), key=lambda p: (-p.similarity, p.pk))[:limit]
+
+
+def describe(partnerships):
+    return [
+        {
+            'id': p.pk,
+            'title': p.title,
+            'department': p.department_id,
+            'contact_email': p.contact_email,
+            'match': p.match,
+            'similarity': round(p.similarity, 3),
+        }
+        for p in partnerships
+    ]
@@ -0,0 +1,77 @@
+import base64
+import io
+
+from PIL import Image, ImageOps
+
+
+# =========================================================
+# 🖼️ Logo metadata, computed once when a logo is uploaded
+# Lets the frontend reserve the right box (width/height), paint the dominant
+# colour and a ~16px blurred preview before the real logo has loaded.
+# =========================================================
+
+PLACEHOLDER_SIZE = 16      # px, longest side of the LQIP
+PLACEHOLDER_QUALITY = 50   # JPEG quality; the preview is blurred by the browser anyway
+PALETTE_COLORS = 5         # colours considered when picking the dominant one
+ORIENTATION = 0x0112       # EXIF tag
+
+# Fields filled by image_metadata() (same names on College, Department and Partnerships)
+FIELDS = ('logo_width', 'logo_height', 'logo_color', 'logo_placeholder')
+
+
+def flatten(image):
+    """RGB copy with any transparency composited onto white (logos sit on white cards)."""
+    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+        image = image.convert('RGBA')
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        return background
+    return image.convert('RGB')
+
+
+def dominant_color(image):
+    small = image.copy()
+    small.thumbnail((64, 64))
+    quantized = small.quantize(colors=PALETTE_COLORS, method=Image.Quantize.MEDIANCUT)
+    _, index = max(quantized.getcolors())
+    r, g, b = quantized.getpalette()[index * 3:index * 3 + 3]
+    return f'#{r:02x}{g:02x}{b:02x}'
+
+
+def placeholder(image):
+    small = image.copy()
+    small.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE))
+    buffer = io.BytesIO()
+    small.save(buffer, 'JPEG', quality=PLACEHOLDER_QUALITY, optimize=True)
+    return 'data:image/jpeg;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def image_metadata(file):
+    """{'logo_width', 'logo_height', 'logo_color', 'logo_placeholder'} for an image file."""
+    file.seek(0)
+    with Image.open(file) as image:
+        width, height = image.size
+        if image.getexif().get(ORIENTATION) in (5, 6, 7, 8):   # stored rotated by 90°
+            width, height = height, width
+
+        image.draft('RGB', (PLACEHOLDER_SIZE * 8, PLACEHOLDER_SIZE * 8))   # JPEG: decode at reduced size
+        rgb = flatten(ImageOps.exif_transpose(image))
+        metadata = {
+            'logo_width': width,
+            'logo_height': height,
+            'logo_color': dominant_color(rgb),
+            'logo_placeholder': placeholder(rgb),
+        }
+    file.seek(0)
+    return metadata
+
+
+def measure(name):
+    """(name, metadata, error) for a stored file — run in worker processes by `manage.py backfill_logos`."""
+    from django.core.files.storage import default_storage
+
+    try:
+        with default_storage.open(name, 'rb') as file:
+            return name, image_metadata(io.BytesIO(file.read())), None
+    except Exception as exc:  # missing/corrupt file: reported, not fatal
+        return name, None, f'{type(exc).__name__}: {exc}'
@@ -0,0 +1,182 @@
+import inspect
+import logging
+import random
+import threading
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Job
+
+
+logger = logging.getLogger(__name__)
+
+
+# =========================================================
+# 🧵 Background jobs in the app's own database (no broker)
+#
+#   @task('recount')
+#   def recount(job, dry_run=False):
+#       job.set_progress(50, "Departments done")   # see Job.set_progress
+#       return {...}                               # stored as job.result
+#
+#   enqueue('recount', created_by=request.user, dry_run=True)
+#
+# `manage.py run_workers` claims due jobs with FOR UPDATE SKIP LOCKED, so any
+# number of workers can poll the same table without handing out a job twice.
+# Failures are retried with exponential backoff up to max_attempts. While a job
+# runs its worker refreshes heartbeat_at, so a dead worker's job is noticed
+# after JOB_STALE_SECONDS of silence rather than of runtime.
+# =========================================================
+
+TASKS = {}
+
+
+def task(name):
+    def register(fn):
+        TASKS[name] = fn
+        return fn
+    return register
+
+
+def check_kwargs(name, kwargs):
+    """TypeError if the task can't be called with these kwargs (caught at enqueue, not after max_attempts retries)."""
+    try:
+        inspect.signature(TASKS[name]).bind(None, **kwargs)
+    except TypeError as exc:
+        raise TypeError(f'{name}: {exc}') from None
+
+
+def enqueue(name, created_by=None, max_attempts=None, run_at=None, **kwargs):
+    if name not in TASKS:
+        raise KeyError(f'Unknown job {name!r}')
+    check_kwargs(name, kwargs)
+    return Job.objects.create(
+        name=name,
+        kwargs=kwargs,
+        created_by=created_by if created_by is not None and created_by.is_authenticated else None,
+        max_attempts=max_attempts or getattr(settings, 'JOB_MAX_ATTEMPTS', 3),
+        run_at=run_at or timezone.now(),
+    )
+
+
+def backoff(attempts):
+    """Seconds before retry number `attempts`: base * 2^(n-1), capped, ±25% jitter."""
+    base = getattr(settings, 'JOB_BACKOFF_SECONDS', 30)
+    cap = getattr(settings, 'JOB_BACKOFF_MAX_SECONDS', 3600)
+    delay = min(cap, base * 2 ** max(0, attempts - 1))
+    return delay * random.uniform(0.75, 1.25)
+
+
+def claim(worker):
+    """Lock and mark running the next due job, or None. Skips rows other workers hold."""
+    now = timezone.now()
+    with transaction.atomic():
+        job = (
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(status=Job.STATUS_QUEUED, run_at__lte=now)
+            .order_by('run_at', 'pk')
+            .first()
+        )
+        if job is None:
+            return None
+
+        # Compare-and-set as well: databases without row locks (SQLite) can't hand it out twice either
+        claimed = Job.objects.filter(pk=job.pk, status=Job.STATUS_QUEUED).update(
+            status=Job.STATUS_RUNNING,
+            attempts=F('attempts') + 1,
+            locked_by=worker,
+            started_at=now,
+            heartbeat_at=now,
+        )
+        if not claimed:
+            return None
+
+    job.refresh_from_db()
+    return job
+
+
+def requeue_stale():
+    """
+    Jobs left 'running' by a worker that died (killed, OOM, deploy) go back in
+    the queue — or fail, if that was their last attempt. Stale means no heartbeat
+    for JOB_STALE_SECONDS, so long jobs on a live worker are left alone.
+    Returns how many were requeued.
+    """
+    cutoff = timezone.now() - timedelta(seconds=getattr(settings, 'JOB_STALE_SECONDS', 300))
+    stale = Job.objects.filter(status=Job.STATUS_RUNNING).filter(
+        Q(heartbeat_at__lt=cutoff) | Q(heartbeat_at__isnull=True, started_at__lt=cutoff)
+    )
+    message = 'Worker stopped while running this job'
+
+    stale.filter(attempts__gte=F('max_attempts')).update(
+        status=Job.STATUS_FAILED, locked_by='', finished_at=timezone.now(), error=message,
+    )
+    return stale.update(status=Job.STATUS_QUEUED, locked_by='', run_at=timezone.now(), error=message)
+
+
+class Heartbeat(threading.Thread):
+    """Touches job.heartbeat_at every JOB_HEARTBEAT_SECONDS until stopped."""
+
+    def __init__(self, job):
+        super().__init__(name=f'job-heartbeat-{job.pk}', daemon=True)
+        self.job = job
+        self.interval = getattr(settings, 'JOB_HEARTBEAT_SECONDS', 30)
+        self.stopped = threading.Event()
+
+    def run(self):
+        try:
+            while not self.stopped.wait(self.interval):
+                try:
+                    Job.objects.filter(pk=self.job.pk, status=Job.STATUS_RUNNING).update(heartbeat_at=timezone.now())
+                except DatabaseError:
+                    # A missed beat is fine; the next one (or the job's own progress) makes up for it
+                    logger.warning("Job %s: heartbeat failed", self.job, exc_info=True)
+                    connections.close_all()
+        finally:
+            connections.close_all()   # this thread's own connection
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+def run(job):
+    """Execute a claimed job and record the outcome. Never raises."""
+    fn = TASKS.get(job.name)
+    try:
+        if fn is None:
+            raise KeyError(f'Unknown job {job.name!r}')
+        heartbeat = Heartbeat(job)
+        heartbeat.start()
+        try:
+            result = fn(job, **job.kwargs)
+        finally:
+            heartbeat.stop()
+    except Exception:
+        error = traceback.format_exc()
+        logger.warning("Job %s attempt %s/%s failed", job, job.attempts, job.max_attempts)
+
+        if fn is not None and job.attempts < job.max_attempts:
+            job.status = Job.STATUS_QUEUED
+            job.run_at = timezone.now() + timedelta(seconds=backoff(job.attempts))
+        else:
+            job.status = Job.STATUS_FAILED
+            job.finished_at = timezone.now()
+        job.error = error[-5000:]
+        job.locked_by = ''
+        job.save(update_fields=['status', 'run_at', 'finished_at', 'error', 'locked_by'])
+        return job
+
+    job.status = Job.STATUS_DONE
+    job.result = result
+    job.progress = 100
+    job.error = ''
+    job.locked_by = ''
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'result', 'progress', 'error', 'locked_by', 'finished_at'])
+    return job
@@ -0,0 +1,45 @@
+# api/management/commands/archive_partnerships.py
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from api import archive
+
+
+class Command(BaseCommand):
+    help = (
+        "Moves partnerships that ended more than ARCHIVE_AFTER_DAYS ago into the archive "
+        "table, in batches. Run it from cron (e.g. weekly). --restore moves rows back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--older-than-days', type=int, default=None,
+                            help='Archive rows whose date_ended is older than this (default: ARCHIVE_AFTER_DAYS).')
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows per transaction (default: 500).')
+        parser.add_argument('--dry-run', action='store_true', help='Only count what would be archived.')
+        parser.add_argument('--restore', type=int, nargs='+', metavar='ID', help='Move these archived ids back.')
+
+    def handle(self, *args, **options):
+        if options['restore']:
+            try:
+                restored = archive.restore(options['restore'])
+            except ValueError as exc:
+                raise CommandError(str(exc))
+            missing = sorted(set(options['restore']) - set(restored))
+            self.stdout.write(self.style.SUCCESS(f"✅ {len(restored)} partnership(s) restored"))
+            if missing:
+                self.stdout.write(self.style.WARNING(f"⚠️ Not in the archive: {', '.join(map(str, missing))}"))
+            return
+
+        days = options['older_than_days']
+        if days is None:
+            days = getattr(settings, 'ARCHIVE_AFTER_DAYS', 1095)
+        cutoff = archive.cutoff_for(timezone.localdate(), days)
+
+        if options['dry_run']:
+            count = archive.archivable(cutoff).count()
+            self.stdout.write(f"🗄️ {count} partnership(s) ended before {cutoff} would be archived")
+            return
+
+        moved = archive.archive(cutoff, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"✅ {len(moved)} partnership(s) ended before {cutoff} archived"))
@@ -0,0 +1,66 @@
+# api/management/commands/backfill_logos.py
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections, transaction
+
+from api import cdn
+from api.images import measure
+from api.models import College, Department, Partnerships
+
+
+MODELS = (College, Department, Partnerships)
+
+
+class Command(BaseCommand):
+    help = (
+        "Fills logo_width/logo_height/logo_color/logo_placeholder for logos uploaded "
+        "before they were measured. Images are decoded in a process pool; each "
+        "distinct file is measured once, however many rows share it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 2, help='Worker processes (default: CPU count).')
+        parser.add_argument('--force', action='store_true', help='Re-measure logos that already have metadata.')
+
+    def handle(self, *args, **options):
+        names = set()
+        for model in MODELS:
+            queryset = model.objects.exclude(logo='').exclude(logo__isnull=True)
+            if not options['force']:
+                queryset = queryset.filter(logo_width__isnull=True)
+            names.update(queryset.values_list('logo', flat=True).distinct())
+
+        if not names:
+            self.stdout.write(self.style.SUCCESS("✅ All logos already have metadata"))
+            return
+
+        self.stdout.write(f"🖼️ Measuring {len(names)} logo file(s) with {options['workers']} worker(s)...")
+
+        # Workers only read files; don't hand them this process's DB connections
+        connections.close_all()
+
+        measured, failed = {}, 0
+        with ProcessPoolExecutor(max_workers=options['workers'], initializer=django.setup) as pool:
+            for name, metadata, error in pool.map(measure, sorted(names), chunksize=8):
+                if error:
+                    failed += 1
+                    self.stdout.write(self.style.WARNING(f"⚠️ {name}: {error}"))
+                else:
+                    measured[name] = metadata
+
+        updated = 0
+        with transaction.atomic():
+            for model in MODELS:
+                for name, metadata in measured.items():
+                    # .update(): no save() signals, no audit entries for a backfill
+                    updated += model.objects.filter(logo=name).update(**metadata)
+            if updated:
+                cdn.purge(cdn.all_keys())
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {len(measured)} file(s) measured, {updated} row(s) updated"
+            + (f", {failed} failed" if failed else "")
+        ))
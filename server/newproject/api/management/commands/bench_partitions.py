@@ -0,0 +1,121 @@
+# api/management/commands/bench_partitions.py
+import datetime
+import json
+import random
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from api import partitioning, timeline
+from api.models import College, Department, Partnerships
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks partition pruning (PostgreSQL) on the growth and ?year= list queries with "
+        "EXPLAIN ANALYZE. Test rows are created in a transaction and rolled back. On a plain table "
+        "it also rebuilds it partitioned inside that transaction (exclusive lock: not on a busy database)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=200000, help='Partnerships to create (default: 200000).')
+        parser.add_argument('--years', type=int, default=10, help='Start years to spread them over (default: 10).')
+        parser.add_argument('--repeat', type=int, default=3, help='Best of N runs (default: 3).')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError("Table partitioning needs PostgreSQL.")
+
+        self.repeat = options['repeat']
+        last = datetime.date.today().year
+        years = list(range(last - options['years'] + 1, last + 1))
+
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                self.cursor = cursor
+                partitioned = partitioning.is_partitioned(cursor)
+                if partitioned:
+                    partitioning.create_partitions(cursor, years)
+                college = self.seed(options['rows'], years)
+                year = years[len(years) // 2]
+
+                queries = [
+                    (f'growth ?year={year}', lambda: timeline.started_per_month(
+                        Partnerships.objects.filter(date_started__year=year))),
+                    (f'growth ?year={year}&college', lambda: timeline.started_per_month(
+                        Partnerships.objects.filter(college=college, date_started__year=year))),
+                    (f'list ?year={year}', lambda: list(
+                        Partnerships.objects.filter(date_started__year=year).values_list('id', 'title'))),
+                    ('growth (all years)', lambda: timeline.started_per_month(Partnerships.objects.all())),
+                ]
+                sql = [(label, self.capture(fn)) for label, fn in queries]
+
+                if partitioned:
+                    before_label, after_label = 'pruning off', 'pruning on'
+                    before = [self.explain(query, pruning=False) for _, query in sql]
+                else:
+                    before_label, after_label = 'plain table', 'partitioned'
+                    before = [self.explain(query) for _, query in sql]
+                    partitioning.rebuild(cursor, partitioned=True)
+                after = [self.explain(query) for _, query in sql]
+
+                self.stdout.write(f"  {options['rows']} rows over {years[0]}-{years[-1]}: {before_label} → {after_label}")
+                for (label, _), (b_ms, b_tables), (a_ms, a_tables) in zip(sql, before, after):
+                    self.stdout.write(
+                        f"  {label:<28} {b_tables:>3} table(s) {b_ms:>8.2f} ms  →  "
+                        f"{a_tables:>3} table(s) {a_ms:>8.2f} ms   ({b_ms / max(a_ms, 0.001):.1f}x)"
+                    )
+                raise Rollback
+        except Rollback:
+            pass
+
+    def seed(self, rows, years):
+        college = College.objects.create(code='BENCH', name='Benchmark College')
+        departments = [
+            Department.objects.create(college=college, code=f'B{i}', name=f'Bench Department {i}')
+            for i in range(20)
+        ]
+        rng = random.Random(0)
+        Partnerships.objects.bulk_create([
+            Partnerships(
+                department=departments[i % len(departments)],
+                college=college,   # bulk_create skips save()
+                title=f'Partner organisation #{i}',
+                description='Memorandum of agreement covering internships and research.',
+                date_started=None if i % 50 == 0 else datetime.date(rng.choice(years), rng.randint(1, 12), rng.randint(1, 28)),
+            )
+            for i in range(rows)
+        ], batch_size=5000)
+        self.cursor.execute(f"ANALYZE {partitioning.TABLE}")
+        return college
+
+    def capture(self, fn):
+        """The SQL (parameters bound) that `fn` runs — the same query the endpoint sends."""
+        with CaptureQueriesContext(connection) as queries:
+            fn()
+        return queries.captured_queries[-1]['sql']
+
+    def explain(self, sql, pruning=True):
+        """(best execution ms, tables scanned) over --repeat runs."""
+        self.cursor.execute(f"SET LOCAL enable_partition_pruning = {'on' if pruning else 'off'}")
+        best, tables = None, 0
+        for _ in range(self.repeat):
+            self.cursor.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}")
+            plan = self.cursor.fetchone()[0]
+            plan = (json.loads(plan) if isinstance(plan, str) else plan)[0]
+            elapsed = plan['Execution Time']
+            best = elapsed if best is None else min(best, elapsed)
+            tables = len(self.relations(plan['Plan']) - {Department._meta.db_table, College._meta.db_table})
+        self.cursor.execute("SET LOCAL enable_partition_pruning = on")
+        return best, tables
+
+    def relations(self, node):
+        names = {node['Relation Name']} if 'Relation Name' in node else set()
+        for child in node.get('Plans', ()):
+            names |= self.relations(child)
+        return names
@@ -0,0 +1,71 @@
+# api/management/commands/bench_render.py
+import datetime
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from api.models import Partnerships
+from api.renderers import FastJSONRenderer, orjson
+from api.serializers import PartnershipsSerializer
+
+
+class Command(BaseCommand):
+    help = "Benchmarks JSON rendering of PartnershipsSerializer rows: DRF's JSONRenderer vs FastJSONRenderer."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000, help='Rows to render (default: 10000).')
+        parser.add_argument('--repeat', type=int, default=5, help='Best of N runs (default: 5).')
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            raise CommandError("orjson is not installed; FastJSONRenderer would just use DRF's renderer.")
+
+        # Unsaved instances: no database needed, same field values a real list would have
+        now = timezone.now()
+        rows = [
+            Partnerships(
+                id=i,
+                department_id=i % 40 + 1,
+                title=f"Partner organisation #{i} — Davao City",
+                description="Memorandum of agreement covering internships, research and outreach. " * 4,
+                status=Partnerships.STATUS_ACTIVE if i % 3 else Partnerships.STATUS_INACTIVE,
+                contact_person="Juan dela Cruz",
+                contact_email=f"partner{i}@example.com",
+                contact_phone="+63 912 345 6789",
+                date_started=datetime.date(2020, i % 12 + 1, i % 28 + 1),
+                date_ended=None,
+                created_by_id=1,
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(options['rows'])
+        ]
+        data = PartnershipsSerializer(rows, many=True).data
+
+        results = {}
+        for name, renderer in (('JSONRenderer', JSONRenderer()), ('FastJSONRenderer', FastJSONRenderer())):
+            best = None
+            for _ in range(options['repeat']):
+                started = time.perf_counter()
+                body = renderer.render(data)
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            results[name] = (best, body)
+
+        base_time, base_body = results['JSONRenderer']
+        fast_time, fast_body = results['FastJSONRenderer']
+
+        for name, (elapsed, body) in results.items():
+            self.stdout.write(
+                f"  {name:<18} {elapsed * 1000:>8.1f} ms  "
+                f"{len(rows) / elapsed:>10,.0f} rows/s  {len(body):,} bytes"
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"⚡ {base_time / fast_time:.1f}x faster"))
+
+        if fast_body == base_body:
+            self.stdout.write(self.style.SUCCESS("✅ Output is byte-for-byte identical"))
+        else:
+            raise CommandError("Output differs from DRF's JSONRenderer")
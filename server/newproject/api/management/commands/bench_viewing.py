@@ -0,0 +1,89 @@
+# api/management/commands/bench_viewing.py
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+
+from api.models import College, Department, Partnerships
+from api.projections import Projection
+from api.serializers import CollegeSerializer, DepartmentSerializer, PartnershipsSerializer
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks the viewing list endpoints: ModelSerializer per row vs the "
+        "values_list() projection. Test rows are created in a transaction and rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000, help='Partnerships to create (default: 5000).')
+        parser.add_argument('--repeat', type=int, default=3, help='Best of N runs (default: 3).')
+
+    def handle(self, *args, **options):
+        self.repeat = options['repeat']
+        self.request = RequestFactory().get('/api/viewing/partnerships/', HTTP_HOST='localhost')
+
+        try:
+            with transaction.atomic():
+                self.seed(options['rows'])
+                for label, queryset, serializer_class in (
+                    ('colleges', College.objects.all(), CollegeSerializer),
+                    ('departments', Department.objects.all(), DepartmentSerializer),
+                    ('partnerships', Partnerships.objects.all(), PartnershipsSerializer),
+                ):
+                    self.compare(label, queryset, serializer_class)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def seed(self, rows):
+        college = College.objects.create(code='BENCH', name='Benchmark College')
+        departments = [
+            Department.objects.create(college=college, code=f'B{i}', name=f'Bench Department {i}')
+            for i in range(20)
+        ]
+        Partnerships.objects.bulk_create([
+            Partnerships(
+                department=departments[i % len(departments)],
+                college=college,   # bulk_create skips save()
+                title=f'Partner organisation #{i}',
+                description='Memorandum of agreement covering internships and research. ' * 3,
+                contact_person='Juan dela Cruz',
+                contact_email=f'partner{i}@example.com',
+                logo='partnership_logos/bench.png' if i % 2 else None,
+            )
+            for i in range(rows)
+        ], batch_size=1000)
+
+    def timed(self, fn):
+        best, result = None, None
+        for _ in range(self.repeat):
+            started = time.perf_counter()
+            result = fn()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
+
+    def compare(self, label, queryset, serializer_class):
+        projection = Projection.for_serializer(serializer_class)
+        context = {'request': self.request}
+
+        before, expected = self.timed(lambda: serializer_class(queryset, many=True, context=context).data)
+        after, actual = self.timed(lambda: projection.rows(queryset, self.request))
+
+        if JSONRenderer().render(expected) != JSONRenderer().render(actual):
+            raise CommandError(f"{label}: projection output differs from {serializer_class.__name__}")
+
+        count = max(len(actual), 1)
+        self.stdout.write(
+            f"  {label:<13} {len(actual):>6} rows  "
+            f"serializer {before * 1e6 / count:>7.1f} µs/row   "
+            f"projection {after * 1e6 / count:>7.1f} µs/row   "
+            f"({before / after:.1f}x)"
+        )
@@ -0,0 +1,46 @@
+# api/management/commands/build_schema.py
+import gzip
+import hashlib
+import json
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.schema import MANIFEST_NAME, SCHEMA_DIR, schema_root
+
+
+class Command(BaseCommand):
+    help = "Generates the OpenAPI schema once and writes it as a versioned static file (run at build/deploy time, before the server starts)."
+
+    def handle(self, *args, **options):
+        from drf_spectacular.renderers import OpenApiJsonRenderer
+        from drf_spectacular.settings import spectacular_settings
+
+        generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+        schema = generator.get_schema(request=None, public=True)
+        content = OpenApiJsonRenderer().render(schema, renderer_context={})
+
+        # API version + content hash → a new URL whenever the schema changes,
+        # so the file can be cached "forever".
+        version = settings.SPECTACULAR_SETTINGS.get('VERSION', '0')
+        digest = hashlib.sha256(content).hexdigest()[:12]
+        filename = f'openapi-{version}-{digest}.json'
+
+        root = schema_root()
+        os.makedirs(root, exist_ok=True)
+
+        path = os.path.join(root, filename)
+        with open(path, 'wb') as f:
+            f.write(content)
+
+        # whitenoise serves the pre-compressed copy to clients that accept gzip
+        with gzip.open(path + '.gz', 'wb', compresslevel=9) as f:
+            f.write(content)
+
+        with open(os.path.join(root, MANIFEST_NAME), 'w') as f:
+            json.dump({'current': filename}, f)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Schema written to {settings.STATIC_URL}{SCHEMA_DIR}/{filename} ({len(content)} bytes)"
+        ))
@@ -0,0 +1,56 @@
+# api/management/commands/partition_partnerships.py
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from api import partitioning
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates the yearly api_partnerships partitions for this year and the next "
+        "PARTITION_YEARS_AHEAD years (PostgreSQL). Run it from cron, e.g. every month. "
+        "--enable / --disable convert an existing table."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--years-ahead', type=int, default=None,
+                            help='Partitions to keep ahead of this year (default: PARTITION_YEARS_AHEAD).')
+        group = parser.add_mutually_exclusive_group()
+        group.add_argument('--enable', action='store_true', help='Rebuild the table as a partitioned table.')
+        group.add_argument('--disable', action='store_true', help='Rebuild it as a plain table again.')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError("Table partitioning needs PostgreSQL.")
+
+        ahead = options['years_ahead']
+        if ahead is None:
+            ahead = getattr(settings, 'PARTITION_YEARS_AHEAD', 2)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            partitioned = partitioning.is_partitioned(cursor)
+
+            if options['disable']:
+                if partitioned:
+                    partitioning.rebuild(cursor, partitioned=False)
+                self.stdout.write(self.style.SUCCESS(f"✅ {partitioning.TABLE} is a plain table"))
+                return
+
+            if options['enable'] and not partitioned:
+                self.stdout.write(f"🗂️ Rebuilding {partitioning.TABLE} as a partitioned table...")
+                partitioning.rebuild(cursor, partitioned=True, ahead=ahead)
+            elif not partitioned:
+                raise CommandError(
+                    f"{partitioning.TABLE} is not partitioned. Set PARTITION_PARTNERSHIPS=True before "
+                    "migrating a new database, or run this command with --enable."
+                )
+
+            created = partitioning.create_partitions(cursor, partitioning.wanted_years(cursor, ahead))
+            for name in created:
+                self.stdout.write(self.style.SUCCESS(f"➕ {name}"))
+
+            for name, rows in partitioning.row_counts(cursor).items():
+                self.stdout.write(f"  {name:<32} {rows:>8} rows")
+
+        self.stdout.write(self.style.SUCCESS(f"✅ {len(created)} partition(s) created"))
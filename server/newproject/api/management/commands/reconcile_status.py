@@ -0,0 +1,42 @@
+# api/management/commands/reconcile_status.py
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.reconcile import reconcile
+
+
+class Command(BaseCommand):
+    help = (
+        "Marks partnerships whose date_ended has passed as inactive and prints an "
+        "'expiring soon' digest. Run it daily from cron, or keep it running with --every."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows per UPDATE (default: 500).')
+        parser.add_argument('--expiring-days', type=int, default=30,
+                            help='Digest window in days (default: 30).')
+        parser.add_argument('--every', type=int, default=None, metavar='SECONDS',
+                            help='Local scheduler: run again every SECONDS instead of exiting.')
+
+    def handle(self, *args, **options):
+        while True:
+            self.run_once(options['batch_size'], options['expiring_days'])
+
+            if not options['every']:
+                break
+            time.sleep(options['every'])
+
+    def run_once(self, batch_size, expiring_days):
+        today = timezone.localdate()
+        record, expiring = reconcile(today, batch_size=batch_size, expiring_days=expiring_days)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {today}: {record.deactivated_count} expired partnership(s) set to inactive"
+        ))
+
+        self.stdout.write(f"\n📅 Ending within {expiring_days} days: {len(expiring)}")
+        for p in expiring:
+            college = p.department.college.code if p.department.college else '-'
+            self.stdout.write(f"  {p.date_ended}  {college} / {p.department.code}  {p.title}")
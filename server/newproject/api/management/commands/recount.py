@@ -0,0 +1,23 @@
+# api/management/commands/recount.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api.counters import recount
+
+
+class Command(BaseCommand):
+    help = "Recomputes the partnership/department counters on College and Department and re-syncs Partnerships.college (repairs drift)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Only report rows that drifted.')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            drifted = recount(dry_run=options['dry_run'])
+
+        for model, rows in drifted.items():
+            if rows:
+                verb = "would be fixed" if options['dry_run'] else "fixed"
+                self.stdout.write(self.style.WARNING(f"⚠️ {model}: {rows} row(s) {verb}"))
+            else:
+                self.stdout.write(self.style.SUCCESS(f"✅ {model}: in sync"))
@@ -0,0 +1,84 @@
+# api/management/commands/run_workers.py
+import os
+import signal
+import socket
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections, connections
+
+from api import jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs queued background jobs (api.jobs). Start as many of these as you like, "
+        "on any machine that can reach the database: jobs are claimed with SKIP LOCKED."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=2, help='Jobs run at the same time (threads, default: 2).')
+        parser.add_argument('--poll', type=float, default=2.0, help='Seconds to wait when the queue is empty (default: 2).')
+        parser.add_argument('--burst', action='store_true', help='Exit once the queue is empty instead of waiting.')
+
+    def handle(self, *args, **options):
+        self.stop = threading.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, self.shutdown)
+
+        requeued = jobs.requeue_stale()
+        if requeued:
+            self.stdout.write(self.style.WARNING(f"⚠️ Requeued {requeued} job(s) left running by a dead worker"))
+
+        prefix = f'{socket.gethostname()}:{os.getpid()}'
+        threads = [
+            threading.Thread(target=self.work, args=(f'{prefix}:{i}', options), name=f'job-worker-{i}')
+            for i in range(options['concurrency'])
+        ]
+        self.stdout.write(self.style.SUCCESS(f"🧵 {len(threads)} worker(s) started ({prefix})"))
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.stdout.write(self.style.SUCCESS("✅ Workers stopped"))
+
+    def shutdown(self, signum, frame):
+        self.stdout.write("⏹️ Finishing running jobs, then stopping...")
+        self.stop.set()
+
+    def work(self, worker, options):
+        try:
+            while not self.stop.is_set():
+                close_old_connections()
+                try:
+                    job = jobs.claim(worker)
+                except DatabaseError as exc:
+                    # Lost connection / lock timeout: back off and try again with a fresh connection
+                    self.stderr.write(f"⚠️ {worker}: could not claim a job ({exc})")
+                    connections.close_all()
+                    self.stop.wait(options['poll'])
+                    continue
+
+                if job is None:
+                    if options['burst']:
+                        return
+                    self.stop.wait(options['poll'])
+                    continue
+
+                started = time.monotonic()
+                job = jobs.run(job)
+                elapsed = time.monotonic() - started
+
+                if job.status == job.STATUS_DONE:
+                    self.stdout.write(self.style.SUCCESS(f"✅ {job} in {elapsed:.1f}s"))
+                elif job.status == job.STATUS_QUEUED:
+                    self.stdout.write(self.style.WARNING(
+                        f"🔁 {job}: attempt {job.attempts}/{job.max_attempts} failed, retry at {job.run_at:%H:%M:%S}"
+                    ))
+                else:
+                    self.stdout.write(self.style.ERROR(f"❌ {job}: gave up after {job.attempts} attempt(s)"))
+        finally:
+            connections.close_all()
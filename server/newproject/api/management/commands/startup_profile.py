@@ -0,0 +1,97 @@
+# api/management/commands/startup_profile.py
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Reports where worker start-up time goes, using python -X importtime."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--target', default='newproject.wsgi',
+                            help='Module a worker imports on boot (default: newproject.wsgi).')
+        parser.add_argument('--urls', action='store_true',
+                            help='Also load the URLconf, i.e. the cost of the first request.')
+        parser.add_argument('--limit', type=int, default=20, help='Rows per table.')
+        parser.add_argument('--json', action='store_true', help='Print machine-readable output (for CI).')
+
+    def handle(self, *args, **options):
+        code = f"import {options['target']}"
+        if options['urls']:
+            code += "; from django.urls import get_resolver; get_resolver().url_patterns"
+
+        # Fresh interpreter so nothing is already imported
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            cwd=settings.BASE_DIR,
+            env=os.environ.copy(),
+            capture_output=True,
+            text=True,
+        )
+        wall_ms = (time.perf_counter() - started) * 1000
+
+        if result.returncode != 0:
+            raise CommandError(result.stderr.strip().splitlines()[-1] if result.stderr else 'Import failed')
+
+        modules = self.parse(result.stderr)
+        by_package = defaultdict(int)
+        for module in modules:
+            by_package[module['name'].split('.')[0]] += module['self_us']
+
+        limit = options['limit']
+        report = {
+            'target': options['target'],
+            'urls': options['urls'],
+            'wall_ms': round(wall_ms, 1),
+            'import_ms': round(sum(m['self_us'] for m in modules) / 1000, 1),
+            'modules': len(modules),
+            'packages': [
+                {'package': name, 'ms': round(us / 1000, 1)}
+                for name, us in sorted(by_package.items(), key=lambda item: -item[1])[:limit]
+            ],
+            'slowest': [
+                {'module': m['name'], 'cumulative_ms': round(m['cumulative_us'] / 1000, 1)}
+                for m in sorted(modules, key=lambda m: -m['cumulative_us'])[:limit]
+            ],
+        }
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(self.style.SUCCESS(
+            f"⏱️ {report['target']}: {report['wall_ms']} ms wall, "
+            f"{report['import_ms']} ms in {report['modules']} imports"
+        ))
+
+        self.stdout.write("\nBy package (self time):")
+        for row in report['packages']:
+            self.stdout.write(f"  {row['ms']:>9.1f} ms  {row['package']}")
+
+        self.stdout.write("\nSlowest imports (cumulative):")
+        for row in report['slowest']:
+            self.stdout.write(f"  {row['cumulative_ms']:>9.1f} ms  {row['module']}")
+
+    @staticmethod
+    def parse(stderr):
+        """Parse `import time: self [us] | cumulative | imported package` lines."""
+        modules = []
+        for line in stderr.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            parts = line[len('import time:'):].split('|')
+            if len(parts) != 3 or not parts[0].strip().isdigit():
+                continue  # header line
+            modules.append({
+                'name': parts[2].strip(),
+                'self_us': int(parts[0]),
+                'cumulative_us': int(parts[1]),
+            })
+        return modules
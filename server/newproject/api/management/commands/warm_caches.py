@@ -0,0 +1,105 @@
+# api/management/commands/warm_caches.py
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client
+
+from api import rankings
+from api.models import College, Department
+from api.throttling import WARMUP_HEADER, warmup_token
+
+
+# Caches that live inside one process: warming them from here helps nobody else
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+# Compressed bodies are cached per encoding (CompressionMiddleware.compress_body)
+ENCODINGS = ('br', 'gzip')
+
+
+class Command(BaseCommand):
+    help = "Requests the hot read endpoints once so the first real visitors hit warm caches (run after deploy)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=8, help='Requests run in parallel (default: 8).')
+        parser.add_argument('--base-url', default=None,
+                            help='Hit a running server over HTTP (e.g. http://127.0.0.1:10000) instead of '
+                                 'the in-process test client, to also warm its workers.')
+
+    def handle(self, *args, **options):
+        self.base_url = (options['base_url'] or '').rstrip('/')
+        # Not throttled (see api.throttling.is_warmup): every request comes from this one IP
+        self.headers = {WARMUP_HEADER: warmup_token()}
+
+        if settings.CACHES['default']['BACKEND'] in PROCESS_LOCAL_CACHES:
+            # The database (and, with --base-url, the workers' connections) still get warm
+            self.stdout.write(self.style.WARNING(
+                "⚠️ The cache is per process (no REDIS_URL): "
+                + ("only the workers that answer these requests get warm." if self.base_url
+                   else "the server's cache stays cold, only the database is warmed.")
+            ))
+
+        paths = ['/api/viewing/colleges/', '/api/viewing/departments/']
+        paths += [
+            f'/api/viewing/partnerships/?department={dept_id}'
+            for dept_id in Department.objects.values_list('id', flat=True)
+        ]
+        paths += ['/api/partnerships/growth/']
+        paths += [
+            f'/api/partnerships/growth/?college={college_id}'
+            for college_id in College.objects.values_list('id', flat=True)
+        ]
+        # Anonymous leaderboards, then the college-scoped ones admins see
+        paths += [
+            f'/api/partnerships/rankings/?level={level}&period={period}'
+            for level in rankings.LEVELS for period in rankings.PERIODS
+        ]
+        paths += [
+            f'/api/partnerships/rankings/?level=department&period={period}&college={college_id}'
+            for college_id in College.objects.values_list('id', flat=True) for period in rankings.PERIODS
+        ]
+        fetches = [(path, encoding) for path in paths for encoding in ENCODINGS]
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, options['workers'])) as pool:
+            results = list(pool.map(self.fetch, fetches))
+        total_ms = (time.perf_counter() - started) * 1000
+
+        failed = 0
+        for path, encoding, status, ms in sorted(results, key=lambda row: -row[3]):
+            ok = isinstance(status, int) and 200 <= status < 300
+            failed += not ok
+            line = f"  {ms:>8.1f} ms  {status}  {encoding:<4}  {path}"
+            self.stdout.write(line if ok else self.style.ERROR(line))
+
+        if failed:
+            raise CommandError(f"{failed} of {len(fetches)} requests did not answer 2xx (see above)")
+        self.stdout.write(self.style.SUCCESS(
+            f"🔥 Warmed {len(paths)} endpoints ({len(fetches)} requests) in {total_ms:.0f} ms"
+        ))
+
+    def fetch(self, request):
+        path, encoding = request
+        # One request per encoding: browsers ask for br, older clients and proxies for gzip
+        headers = {**self.headers, 'Accept-Encoding': encoding}
+        started = time.perf_counter()
+        try:
+            if self.base_url:
+                import requests
+                status = requests.get(self.base_url + path, headers=headers, timeout=30).status_code
+            else:
+                # One client per request: the test client isn't thread-safe
+                client = Client(HTTP_HOST='localhost', raise_request_exception=False)
+                status = client.get(path, headers=headers).status_code
+        except Exception as exc:
+            status = type(exc).__name__
+        finally:
+            # Each thread opened its own DB connection
+            connections.close_all()
+
+        return path, encoding, status, (time.perf_counter() - started) * 1000
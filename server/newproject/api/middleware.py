@@ -0,0 +1,272 @@
+import hashlib
+import math
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence, compress_string
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+from .db_router import replica_configured, replica_is_healthy, use_replica, reset_replica
+from .throttling import SCOPES, client_ip, count_throttled, is_warmup, parse_rate, scope_for, take_token
+
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# POST /api/batch/ only carries sub-requests, and each of those goes through
+# the middleware again (api/batch.py) — throttle/route them, not the envelope.
+ENVELOPE_PATHS = ('/api/batch/',)
+
+
+def client_key(request):
+    """
+    Identify the caller without touching the database.
+    JWT auth runs inside DRF (after middleware), so we key on the raw
+    Authorization header, falling back to the client IP for guests.
+    """
+    auth = request.META.get('HTTP_AUTHORIZATION', '')
+    if auth:
+        return 'auth:' + hashlib.sha256(auth.encode()).hexdigest()[:32]
+
+    return 'ip:' + (client_ip(request) or '')
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Routes safe requests on read-heavy endpoints (public viewing pages,
+    growth analytics) to the read replica.
+
+    - Writes always go to the primary.
+    - After a write, the same client is pinned to the primary for
+      DATABASE_REPLICA_PIN_SECONDS so it reads its own changes. The pin is
+      kept in the cache, which must be shared by every worker (settings
+      refuse DATABASE_REPLICA_URL without REDIS_URL).
+    - If the replica is down or lagging, reads fall back to the primary.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefixes = tuple(getattr(settings, 'DATABASE_REPLICA_PATHS', ()))
+        self.pin_seconds = getattr(settings, 'DATABASE_REPLICA_PIN_SECONDS', 15)
+
+    def __call__(self, request):
+        if not replica_configured() or request.path in ENVELOPE_PATHS:
+            return self.get_response(request)
+
+        key = 'replica-pin:' + client_key(request)
+
+        if request.method not in SAFE_METHODS:
+            response = self.get_response(request)
+            if response.status_code < 400:
+                cache.set(key, True, self.pin_seconds)
+            return response
+
+        eligible = (
+            request.path.startswith(self.prefixes)
+            and not cache.get(key)
+            and replica_is_healthy()
+        )
+
+        token = use_replica(eligible)
+        try:
+            return self.get_response(request)
+        finally:
+            reset_replica(token)
+
+
+# =========================================================
+# 🗜️ Response compression (brotli / gzip)
+# =========================================================
+
+COMPRESSIBLE_TYPES = (
+    'application/json',
+    'application/javascript',
+    'application/xml',
+    'image/svg+xml',
+    'text/',
+)
+
+
+def accepted_encodings(header):
+    """Parse Accept-Encoding into {encoding: q}."""
+    accepted = {}
+    for part in header.split(','):
+        name, _, params = part.strip().partition(';')
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+    return accepted
+
+
+def choose_encoding(request):
+    """
+    The encoding with the highest q that we can produce, or None. Equal q values
+    go by our preference, br before gzip.
+    """
+    accepted = accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+    supported = ('br', 'gzip') if brotli is not None else ('gzip',)
+    # max() keeps the first of equal candidates, i.e. the server's order
+    encoding = max(supported, key=lambda name: accepted.get(name, accepted.get('*', 0)))
+    if accepted.get(encoding, accepted.get('*', 0)) <= 0:
+        return None
+    return encoding
+
+
+def brotli_sequence(sequence, quality):
+    compressor = brotli.Compressor(quality=quality)
+    for chunk in sequence:
+        # flush() so every chunk reaches the client as soon as it's produced
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+class CompressionMiddleware:
+    """
+    Compresses API responses with brotli or gzip, whichever the client prefers.
+
+    - Only text/JSON bodies of at least COMPRESSION_MIN_SIZE bytes.
+    - Streaming responses are compressed chunk by chunk.
+    - Anonymous GETs on COMPRESSION_CACHE_PATHS reuse a cached compressed body
+      when the uncompressed body is identical (same content → same bytes).
+    - Strong ETags (ConditionalGetMiddleware) are weakened, as Django's GZipMiddleware does.
+    """
+
+    # Same BREACH mitigation as django.middleware.gzip.GZipMiddleware
+    max_random_bytes = 100
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_size = getattr(settings, 'COMPRESSION_MIN_SIZE', 500)
+        self.brotli_quality = getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 5)
+        self.cache_paths = tuple(getattr(settings, 'COMPRESSION_CACHE_PATHS', ()))
+        self.cache_seconds = getattr(settings, 'COMPRESSION_CACHE_SECONDS', 300)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if not self.should_compress(response):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = choose_encoding(request)
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                return response  # not used by this (WSGI) project
+            if encoding == 'br':
+                response.streaming_content = brotli_sequence(response.streaming_content, self.brotli_quality)
+            else:
+                response.streaming_content = compress_sequence(
+                    response.streaming_content, max_random_bytes=self.max_random_bytes
+                )
+            del response.headers['Content-Length']
+        else:
+            if len(response.content) < self.min_size:
+                return response
+
+            compressed = self.compress_body(request, response.content, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+    @staticmethod
+    def should_compress(response):
+        if response.has_header('Content-Encoding'):
+            return False  # e.g. pre-compressed static files
+        if response.status_code in (204, 206, 304):
+            return False
+        if 'no-transform' in response.get('Cache-Control', ''):
+            return False
+        content_type = response.get('Content-Type', '').lower()
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    def compress(self, body, encoding):
+        if encoding == 'br':
+            return brotli.compress(body, quality=self.brotli_quality)
+        return compress_string(body, max_random_bytes=self.max_random_bytes)
+
+    def compress_body(self, request, body, encoding):
+        cacheable = (
+            request.method == 'GET'
+            and not request.META.get('HTTP_AUTHORIZATION')
+            and request.path.startswith(self.cache_paths)
+        )
+        if not cacheable:
+            return self.compress(body, encoding)
+
+        key = f'compressed:{encoding}:' + hashlib.md5(body).hexdigest()
+        compressed = cache.get(key)
+        if compressed is None:
+            compressed = self.compress(body, encoding)
+            cache.set(key, compressed, self.cache_seconds)
+        return compressed
+
+
+# =========================================================
+# 🚦 Throttling (token buckets in the cache, see api/throttling.py)
+# =========================================================
+
+class ThrottleMiddleware:
+    """
+    Rate limits before authentication, routing or any DB work.
+
+    - viewing / login / registration → per client IP
+    - admin_write → per access token (≈ per user; decoding the JWT would cost
+      a DB lookup), or per IP without one
+
+    Rates come from REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']. Rejected requests
+    get 429 + Retry-After, and are counted per scope (see throttled_counts).
+    Requests carrying the warm-up token (manage.py warm_caches) aren't limited.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        rates = settings.REST_FRAMEWORK.get('DEFAULT_THROTTLE_RATES', {})
+        self.rates = {scope: parse_rate(rates.get(scope)) for scope, _, _, _ in SCOPES}
+
+    def __call__(self, request):
+        scope = scope_for(request) if request.path not in ENVELOPE_PATHS else None
+        rate = self.rates.get(scope) if scope else None
+        if rate is None or is_warmup(request):
+            return self.get_response(request)
+
+        ident = client_key(request) if scope == 'admin_write' else client_ip(request)
+
+        allowed, wait = take_token(f'throttle:{scope}:{ident}', *rate)
+        if allowed:
+            return self.get_response(request)
+
+        count_throttled(scope)
+        retry_after = max(1, math.ceil(wait))
+        response = JsonResponse(
+            {'detail': f'Request was throttled. Expected available in {retry_after} seconds.'},
+            status=429,
+        )
+        response['Retry-After'] = str(retry_after)
+        return response
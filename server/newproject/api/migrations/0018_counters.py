@@ -0,0 +1,72 @@
+# Generated by Django 5.2.7 on 2026-10-19 17:41
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_of(queryset, outer_field):
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{outer_field: OuterRef('pk')})
+            .order_by()
+            .values(outer_field)
+            .annotate(n=Count('pk'))
+            .values('n')
+        ),
+        0,
+    )
+
+
+def backfill_counters(apps, schema_editor):
+    College = apps.get_model('api', 'College')
+    Department = apps.get_model('api', 'Department')
+    Partnerships = apps.get_model('api', 'Partnerships')
+
+    active = Partnerships.objects.filter(status='active')
+
+    Department.objects.update(
+        partnership_count=count_of(Partnerships.objects.all(), 'department'),
+        active_partnership_count=count_of(active, 'department'),
+    )
+    College.objects.update(
+        department_count=count_of(Department.objects.all(), 'college'),
+        partnership_count=count_of(Partnerships.objects.all(), 'department__college'),
+        active_partnership_count=count_of(active, 'department__college'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_alter_department_logo_alter_partnerships_logo'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='college',
+            name='active_partnership_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='college',
+            name='department_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='college',
+            name='partnership_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='department',
+            name='active_partnership_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='department',
+            name='partnership_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
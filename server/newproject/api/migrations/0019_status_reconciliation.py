@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-19 17:43
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0018_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatusReconciliation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ran_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('as_of', models.DateField()),
+                ('deactivated_count', models.PositiveIntegerField(default=0)),
+                ('deactivated_ids', models.JSONField(blank=True, default=list)),
+                ('expiring_days', models.PositiveIntegerField(default=30)),
+                ('expiring_ids', models.JSONField(blank=True, default=list)),
+            ],
+            options={
+                'ordering': ['-ran_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='partnerships',
+            index=models.Index(fields=['status', 'date_ended'], name='partnership_status_end_idx'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:02
+
+from django.db import migrations, models
+
+
+# PostgreSQL only: a stored daterange kept in step with date_started/date_ended
+# by the database itself, plus a GiST index for `&&` (overlap) queries.
+# Not a model field — api/timeline.py queries it directly.
+ADD_RANGE = [
+    """
+    ALTER TABLE api_partnerships ADD COLUMN active_range daterange
+    GENERATED ALWAYS AS (
+        CASE
+            WHEN date_started IS NULL THEN NULL
+            WHEN date_ended IS NOT NULL AND date_ended < date_started THEN NULL
+            ELSE daterange(date_started, date_ended, '[]')
+        END
+    ) STORED
+    """,
+    "CREATE INDEX partnership_active_range_gist ON api_partnerships USING gist (active_range)",
+]
+
+DROP_RANGE = [
+    "DROP INDEX IF EXISTS partnership_active_range_gist",
+    "ALTER TABLE api_partnerships DROP COLUMN IF EXISTS active_range",
+]
+
+
+def add_range(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        for sql in ADD_RANGE:
+            schema_editor.execute(sql)
+
+
+def drop_range(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        for sql in DROP_RANGE:
+            schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0020_auditlog'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='partnerships',
+            index=models.Index(fields=['date_started', 'date_ended'], name='partnership_dates_idx'),
+        ),
+        migrations.RunPython(add_range, drop_range),
+    ]
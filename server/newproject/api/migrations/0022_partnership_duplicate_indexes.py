@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:40
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+# PostgreSQL only: trigram GIN index so `title % 'query'` (api/duplicates.py)
+# is an index lookup. pg_trgm is a trusted extension (PostgreSQL 13+), so the
+# app's own database user can create it.
+ADD_TRGM = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX partnership_title_trgm ON api_partnerships USING gin (title gin_trgm_ops)",
+]
+
+DROP_TRGM = [
+    "DROP INDEX IF EXISTS partnership_title_trgm",
+]
+
+
+def add_trgm(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        for sql in ADD_TRGM:
+            schema_editor.execute(sql)
+
+
+def drop_trgm(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        for sql in DROP_TRGM:
+            schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0021_partnership_active_range'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='partnerships',
+            index=models.Index(django.db.models.functions.text.Upper('contact_email'), name='partnership_email_upper_idx'),
+        ),
+        migrations.RunPython(add_trgm, drop_trgm),
+    ]
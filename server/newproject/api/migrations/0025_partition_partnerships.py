@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-10-19 21:10
+
+from django.conf import settings
+from django.db import migrations
+
+from api import partitioning
+
+
+# PostgreSQL only, and only with PARTITION_PARTNERSHIPS=True: rebuild
+# api_partnerships as a table partitioned by date_started year (see
+# api/partitioning.py). No model changes — Django keeps querying the same table.
+# To switch an existing database later: `manage.py partition_partnerships --enable`.
+
+def partition(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql' or not getattr(settings, 'PARTITION_PARTNERSHIPS', False):
+        return
+    with schema_editor.connection.cursor() as cursor:
+        if not partitioning.is_partitioned(cursor):
+            partitioning.rebuild(cursor, partitioned=True, ahead=getattr(settings, 'PARTITION_YEARS_AHEAD', 2))
+
+
+def unpartition(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        if partitioning.is_partitioned(cursor):
+            partitioning.rebuild(cursor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0024_job'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition, unpartition),
+    ]
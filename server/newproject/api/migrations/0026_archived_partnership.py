@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:18
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0025_partition_partnerships'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedPartnership',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('description', models.TextField()),
+                ('status', models.CharField(choices=[('active', 'Active'), ('inactive', 'Inactive')], max_length=20)),
+                ('logo', models.ImageField(blank=True, null=True, upload_to='partnership_logos/')),
+                ('logo_width', models.PositiveIntegerField(blank=True, null=True)),
+                ('logo_height', models.PositiveIntegerField(blank=True, null=True)),
+                ('logo_color', models.CharField(blank=True, max_length=7, null=True)),
+                ('logo_placeholder', models.TextField(blank=True, null=True)),
+                ('contact_person', models.CharField(blank=True, max_length=255, null=True)),
+                ('contact_email', models.EmailField(blank=True, max_length=254, null=True)),
+                ('contact_phone', models.CharField(blank=True, max_length=20, null=True)),
+                ('date_started', models.DateField(blank=True, null=True)),
+                ('date_ended', models.DateField(blank=True, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_partnerships', to=settings.AUTH_USER_MODEL)),
+                ('department', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_partnerships', to='api.department')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['date_started', 'date_ended'], name='archived_dates_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_college(apps, schema_editor):
+    """college_id = department.college_id, one set-based UPDATE per table."""
+    Department = apps.get_model('api', 'Department')
+    college_of = Subquery(Department.objects.filter(pk=OuterRef('department_id')).values('college_id')[:1])
+    for name in ('Partnerships', 'ArchivedPartnership'):
+        apps.get_model('api', name).objects.update(college_id=college_of)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0026_archived_partnership'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedpartnership',
+            name='college',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='archived_partnerships', to='api.college'),
+        ),
+        migrations.AddField(
+            model_name='partnerships',
+            name='college',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='partnerships', to='api.college'),
+        ),
+        migrations.AddIndex(
+            model_name='partnerships',
+            index=models.Index(fields=['college', 'date_started'], name='partnership_college_start_idx'),
+        ),
+        migrations.RunPython(backfill_college, migrations.RunPython.noop),
+    ]
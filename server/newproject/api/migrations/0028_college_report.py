@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:35
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0027_partnership_college'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CollegeReport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=10)),
+                ('fingerprint', models.CharField(max_length=64)),
+                ('name', models.CharField(max_length=500)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('college', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reports', to='api.college')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('college', 'kind'), name='college_report_unique')],
+            },
+        ),
+    ]
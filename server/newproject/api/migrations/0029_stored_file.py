@@ -0,0 +1,51 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:36
+
+import os
+import re
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+DIGEST = re.compile(r'^[0-9a-f]{32}')
+
+
+def backfill_stored_files(apps, schema_editor):
+    """Index the content-addressed files already referenced by a FileField (digest → stored name)."""
+    StoredFile = apps.get_model('api', 'StoredFile')
+    found = {}
+    for model in apps.get_app_config('api').get_models():
+        for field in model._meta.concrete_fields:
+            if not isinstance(field, models.FileField) or not isinstance(field.upload_to, str):
+                continue
+            directory = field.upload_to.strip('/')
+            names = model._default_manager.exclude(**{field.name: ''}).exclude(**{f'{field.name}__isnull': True})
+            for name in names.values_list(field.name, flat=True).distinct().iterator():
+                digest = DIGEST.match(os.path.basename(name))
+                if digest:
+                    found.setdefault(f'{directory}/{digest.group()}' if directory else digest.group(), name)
+
+    StoredFile.objects.bulk_create(
+        [StoredFile(key=key, name=name) for key, name in found.items()],
+        batch_size=1000, ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0028_college_report'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoredFile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255, unique=True)),
+                ('name', models.CharField(db_index=True, max_length=500)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.RunPython(backfill_stored_files, migrations.RunPython.noop),
+    ]
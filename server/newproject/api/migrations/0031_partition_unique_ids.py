@@ -0,0 +1,47 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:55
+
+from django.db import migrations
+
+from api import partitioning
+
+
+# PostgreSQL only, and only if api_partnerships is partitioned (migration 0025):
+# the partitioned table had just a plain index on id, so nothing stopped two
+# rows sharing an id. A partitioned table can't have a unique index without
+# the partition key (date_started, nullable), so each partition gets a UNIQUE
+# index on id instead and the plain one goes. The same id in two different
+# years' partitions is still possible in principle; ids come from one sequence,
+# and archive.restore (the only code inserting explicit ids) checks for them.
+# Fails if a partition already holds duplicate ids — resolve those first.
+
+def add_unique_ids(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        if not partitioning.is_partitioned(cursor):
+            return
+        for partition in partitioning.partitions(cursor):
+            partitioning.unique_id(cursor, partition)
+        cursor.execute(f"DROP INDEX IF EXISTS {partitioning.ID_INDEX}")
+
+
+def remove_unique_ids(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        if not partitioning.is_partitioned(cursor):
+            return
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {partitioning.ID_INDEX} ON {partitioning.TABLE} (id)")
+        for partition in partitioning.partitions(cursor):
+            cursor.execute(f"DROP INDEX IF EXISTS {partition}_id_key")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0030_job_heartbeat'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_unique_ids, remove_unique_ids),
+    ]
@@ -1,8 +1,9 @@
 from django.db import models
+from django.db.models.functions import Upper
+from django.core.serializers.json import DjangoJSONEncoder
 from django.contrib.auth.models import AbstractUser
 from django.utils import timezone
 from django.conf import settings
-from cloudinary_storage.storage import MediaCloudinaryStorage
 
 class User(AbstractUser):
     SUPERADMIN = 'SUPERADMIN'
@@ -20,11 +21,66 @@ class User(AbstractUser):
     college = models.ForeignKey('College', on_delete= models.SET_NULL, null = True, blank = True)
     department = models.ForeignKey('Department', on_delete= models.SET_NULL, null = True, blank = True)
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Admin search (=username / =email → UPPER(col) = UPPER(%s), see api/admin.py)
+            models.Index(Upper('username'), name='user_username_upper_idx'),
+            models.Index(Upper('email'), name='user_email_upper_idx'),
+        ]
+
     def __str__(self):
         return f"{self.username} ({self.role})"
 
 
-class College(models.Model):
+class CounterFieldsMixin:
+    """
+    Counter fields are only ever changed with F() updates (see api/signals.py).
+    A regular save() of a loaded instance must not write its stale copies back.
+    """
+    COUNTER_FIELDS = ()
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+
+class LogoMetadataMixin:
+    """
+    Measures a newly uploaded logo before it is saved: logo_width/logo_height,
+    logo_color and logo_placeholder (tiny JPEG data URI) — see api/images.py.
+    Existing logos are filled in by `manage.py backfill_logos`.
+    """
+
+    def save(self, *args, **kwargs):
+        self.update_logo_metadata()
+        super().save(*args, **kwargs)
+
+    def update_logo_metadata(self):
+        from .images import FIELDS, image_metadata
+
+        if not self.logo:
+            for name in FIELDS:
+                setattr(self, name, None)
+            return
+
+        if self.logo._committed:
+            return   # same file as before, already measured
+
+        try:
+            metadata = image_metadata(self.logo.file)
+        except Exception:
+            return   # unreadable image: leave it unmeasured, never block the save
+        for name, value in metadata.items():
+            setattr(self, name, value)
+
+
+class College(CounterFieldsMixin, LogoMetadataMixin, models.Model):
+    COUNTER_FIELDS = ('department_count', 'partnership_count', 'active_partnership_count')
+
     id = models.BigAutoField(primary_key= True)
     code = models.CharField(max_length=20, unique=True)
     name = models.CharField(max_length=255)
@@ -39,17 +95,32 @@ class College(models.Model):
         blank=True,
         related_name='managed_colleges'
     )
+    # 🖼️ Filled from the logo on upload (LogoMetadataMixin)
+    logo_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    logo_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    logo_color = models.CharField(max_length=7, null=True, blank=True, editable=False)
+    logo_placeholder = models.TextField(null=True, blank=True, editable=False)
     created_at = models.DateTimeField(default= timezone.now)
     updated_at = models.DateTimeField(auto_now= True)
 
+    # 🔢 Denormalized counters, kept in sync by api/signals.py (repair with `manage.py recount`)
+    department_count = models.PositiveIntegerField(default=0, editable=False)
+    partnership_count = models.PositiveIntegerField(default=0, editable=False)
+    active_partnership_count = models.PositiveIntegerField(default=0, editable=False)
+
     class Meta:
         ordering = ['name']
+        indexes = [
+            # Admin search and the college autocomplete (=code, see api/admin.py)
+            models.Index(Upper('code'), name='college_code_upper_idx'),
+        ]
     
     def __str__(self):
         return f'{self.code} - {self.name}'
 
 
-class Department(models.Model):
+class Department(CounterFieldsMixin, LogoMetadataMixin, models.Model):
+    COUNTER_FIELDS = ('partnership_count', 'active_partnership_count')
     id = models.BigAutoField(primary_key = True )
     college = models.ForeignKey(
         College, 
@@ -69,18 +140,31 @@ class Department(models.Model):
         null=True, blank=True,
         related_name='managed_departments'
     )
+    # 🖼️ Filled from the logo on upload (LogoMetadataMixin)
+    logo_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    logo_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    logo_color = models.CharField(max_length=7, null=True, blank=True, editable=False)
+    logo_placeholder = models.TextField(null=True, blank=True, editable=False)
     created_at = models.DateTimeField(default= timezone.now)
     updated_at = models.DateTimeField(auto_now= True)
 
+    # 🔢 Denormalized counters, kept in sync by api/signals.py (repair with `manage.py recount`)
+    partnership_count = models.PositiveIntegerField(default=0, editable=False)
+    active_partnership_count = models.PositiveIntegerField(default=0, editable=False)
+
     class Meta:
         ordering = ['college__name', 'name']
         unique_together = ('college', 'code')
+        indexes = [
+            # Admin search and the department autocomplete (=code, see api/admin.py)
+            models.Index(Upper('code'), name='department_code_upper_idx'),
+        ]
 
     def __str__(self):
         return f'{self.name} ({self.college.code})'
 
 
-class Partnerships(models.Model):
+class Partnerships(LogoMetadataMixin, models.Model):
     STATUS_ACTIVE = 'active'
     STATUS_INACTIVE = 'inactive'
     STATUS_CHOICES = [
@@ -96,6 +180,18 @@ class Partnerships(models.Model):
         related_name='partnerships'
     )
 
+    # 🏫 Copy of department.college_id, so college-level filters and counts skip the Department join.
+    # Set in save(), moved along with its department by api/signals.py, repaired by `manage.py recount`.
+    college = models.ForeignKey(
+        College,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=False,   # partnership_college_start_idx starts with it
+        related_name='partnerships'
+    )
+
     title = models.CharField(max_length=255)
     description = models.TextField()
 
@@ -111,6 +207,12 @@ class Partnerships(models.Model):
         blank=True
     )
 
+    # 🖼️ Filled from the logo on upload (LogoMetadataMixin)
+    logo_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    logo_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    logo_color = models.CharField(max_length=7, null=True, blank=True, editable=False)
+    logo_placeholder = models.TextField(null=True, blank=True, editable=False)
+
     # 🔹 NEW FIELDS
     contact_person = models.CharField(
         max_length=255,
@@ -157,13 +259,229 @@ class Partnerships(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # "active" filters and the expired / expiring-soon scans (reconcile_status)
+            models.Index(fields=['status', 'date_ended'], name='partnership_status_end_idx'),
+            # Timeline / as-of queries where there is no `active_range` column (see api/timeline.py)
+            models.Index(fields=['date_started', 'date_ended'], name='partnership_dates_idx'),
+            # Duplicate check by contact email (contact_email__iexact, see api/duplicates.py)
+            models.Index(Upper('contact_email'), name='partnership_email_upper_idx'),
+            # College scoping, plus college growth / rankings by start date
+            models.Index(fields=['college', 'date_started'], name='partnership_college_start_idx'),
+        ]
+
+    def __str__(self):
+        return self.title
+
+    def save(self, *args, **kwargs):
+        self.college_id = self.department.college_id if self.department_id else None
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'department' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'college'}
+        super().save(*args, **kwargs)
+
+
+class ArchivedPartnership(models.Model):
+    """
+    A partnership that ended long ago, moved out of the hot table by
+    `manage.py archive_partnerships` (see api/archive.py). Same fields and the
+    same id as the original row, so it can be restored as it was.
+    """
+    id = models.BigIntegerField(primary_key=True)   # the original Partnerships id
+
+    department = models.ForeignKey(
+        Department,
+        on_delete=models.CASCADE,
+        related_name='archived_partnerships'
+    )
+    college = models.ForeignKey(
+        College,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='archived_partnerships'
+    )
+    title = models.CharField(max_length=255)
+    description = models.TextField()
+    status = models.CharField(max_length=20, choices=Partnerships.STATUS_CHOICES)
+
+    # Same stored file as the original (nothing is copied or deleted)
+    logo = models.ImageField(upload_to='partnership_logos/', null=True, blank=True)
+    logo_width = models.PositiveIntegerField(null=True, blank=True)
+    logo_height = models.PositiveIntegerField(null=True, blank=True)
+    logo_color = models.CharField(max_length=7, null=True, blank=True)
+    logo_placeholder = models.TextField(null=True, blank=True)
+
+    contact_person = models.CharField(max_length=255, null=True, blank=True)
+    contact_email = models.EmailField(null=True, blank=True)
+    contact_phone = models.CharField(max_length=20, null=True, blank=True)
+    date_started = models.DateField(null=True, blank=True)
+    date_ended = models.DateField(null=True, blank=True)
+
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='archived_partnerships'
+    )
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()          # as it was when archived
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['date_started', 'date_ended'], name='archived_dates_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
 
+class StoredFile(models.Model):
+    """
+    Content-addressed media (api/storage.py): "<upload_to>/<digest of the bytes>"
+    → the name the backend stored them under (Cloudinary decorates it).
+    """
+    key = models.CharField(max_length=255, unique=True)
+    name = models.CharField(max_length=500, db_index=True)
+    created_at = models.DateTimeField(default=timezone.now)
 
+    def __str__(self):
+        return self.name
+
+
+class CollegeReport(models.Model):
+    """
+    The stored XLSX/PDF report of a college (api/reports.py): the newest one per
+    format, with the name the storage returned (Cloudinary adds a prefix/suffix).
+    """
+    college = models.ForeignKey(College, on_delete=models.CASCADE, related_name='reports')
+    kind = models.CharField(max_length=10)           # "xlsx" / "pdf"
+    fingerprint = models.CharField(max_length=64)    # of the data it was built from (reports.fingerprint)
+    name = models.CharField(max_length=500)          # as returned by storage.save()
+    created_at = models.DateTimeField(default=timezone.now)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['college', 'kind'], name='college_report_unique'),
+        ]
 
+    def __str__(self):
+        return f'{self.college_id}: {self.kind} {self.fingerprint[:8]}'
 
 
+class StatusReconciliation(models.Model):
+    """One run of `manage.py reconcile_status`: what was switched off and what ends soon."""
+    ran_at = models.DateTimeField(default=timezone.now)
+    as_of = models.DateField()
+    deactivated_count = models.PositiveIntegerField(default=0)
+    deactivated_ids = models.JSONField(default=list, blank=True)
+    expiring_days = models.PositiveIntegerField(default=30)
+    expiring_ids = models.JSONField(default=list, blank=True)
+
+    class Meta:
+        ordering = ['-ran_at']
+
+    def __str__(self):
+        return f'{self.as_of}: {self.deactivated_count} deactivated'
+
+
+class AuditLog(models.Model):
+    """Who changed what on a partnership, college, department or user (written in batches by api/audit.py)."""
+    ACTION_CREATE = 'create'
+    ACTION_UPDATE = 'update'
+    ACTION_DELETE = 'delete'
+    ACTION_CHOICES = [
+        (ACTION_CREATE, 'Create'),
+        (ACTION_UPDATE, 'Update'),
+        (ACTION_DELETE, 'Delete'),
+    ]
+
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='audit_entries'
+    )
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    model = models.CharField(max_length=50)         # e.g. "partnerships"
+    object_id = models.BigIntegerField()
+    object_repr = models.CharField(max_length=255, blank=True)
+    # {"field": [old, new]}
+    changes = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-created_at', '-id']
+        indexes = [
+            models.Index(fields=['model', 'object_id', '-created_at'], name='audit_object_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.action} {self.model}#{self.object_id}'
+
+
+class Job(models.Model):
+    """
+    Background work, run by `manage.py run_workers` (see api/jobs.py).
+    Workers claim queued rows with SELECT ... FOR UPDATE SKIP LOCKED.
+    """
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    name = models.CharField(max_length=100)          # registered task, e.g. "recount"
+    kwargs = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_at = models.DateTimeField(default=timezone.now)   # not before (retries back off)
+
+    progress = models.PositiveSmallIntegerField(default=0)   # 0-100
+    progress_message = models.CharField(max_length=255, blank=True)
+    result = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    error = models.TextField(blank=True)
+
+    locked_by = models.CharField(max_length=100, blank=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='jobs'
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+    started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)   # refreshed by the worker while it runs
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at', '-id']
+        indexes = [
+            # The claim query: next queued job that is due
+            models.Index(fields=['status', 'run_at'], name='job_claim_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.name} #{self.pk} ({self.status})'
+
+    def set_progress(self, percent, message=''):
+        """Called from inside a task; its own UPDATE, so the status endpoint sees it right away."""
+        self.progress = max(0, min(100, int(percent)))
+        self.progress_message = message[:255]
+        Job.objects.filter(pk=self.pk).update(
+            progress=self.progress,
+            progress_message=self.progress_message,
+            heartbeat_at=timezone.now(),
+        )
@@ -0,0 +1,218 @@
+import datetime
+
+
+# =========================================================
+# 🗂️ Optional PostgreSQL partitioning of api_partnerships by start year
+#
+#   api_partnerships              PARTITION BY RANGE (date_started)
+#   ├── api_partnerships_y2023    FOR VALUES FROM ('2023-01-01') TO ('2024-01-01')
+#   ├── api_partnerships_y2024    ...
+#   └── api_partnerships_default  DEFAULT (no date_started, years without a partition)
+#
+# Queries bounded on date_started (growth ?year=, list ?year=, timeline ranges)
+# only touch the matching partitions. Switched on by PARTITION_PARTNERSHIPS
+# (migration 0025) or `manage.py partition_partnerships --enable`.
+#
+# A primary key (or any unique index) on a partitioned table must include the
+# partition key, and date_started is nullable — so every partition gets its own
+# UNIQUE index on id instead (see unique_id), with ids handed out by a single
+# sequence. Nothing in PostgreSQL stops the same id in two different years'
+# partitions: code inserting explicit ids (archive.restore) checks first.
+# =========================================================
+
+TABLE = 'api_partnerships'
+DEFAULT_PARTITION = f'{TABLE}_default'
+# Plain index on the parent, used before the per-partition unique ones (dropped by migration 0031)
+ID_INDEX = 'partnership_id_idx'
+
+
+def partition_name(year):
+    return f'{TABLE}_y{year}'
+
+
+def year_range(year):
+    return datetime.date(year, 1, 1), datetime.date(year + 1, 1, 1)
+
+
+def unique_id(cursor, partition):
+    """UNIQUE index on id for one partition (also serves lookups by id)."""
+    cursor.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {partition}_id_key ON {partition} (id)")
+
+
+def is_partitioned(cursor):
+    cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [TABLE])
+    row = cursor.fetchone()
+    return bool(row) and row[0] == 'p'
+
+
+def partitions(cursor):
+    """{partition name: (from, to) or None for the default partition}"""
+    cursor.execute(
+        """
+        SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+        FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass(%s)
+        ORDER BY c.relname
+        """,
+        [TABLE],
+    )
+    return {name: None if bound == 'DEFAULT' else bound for name, bound in cursor.fetchall()}
+
+
+def copied_columns(cursor, table):
+    """Columns to copy between tables (generated ones, like active_range, are recomputed)."""
+    cursor.execute(
+        """
+        SELECT column_name FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = %s AND is_generated = 'NEVER'
+        ORDER BY ordinal_position
+        """,
+        [table],
+    )
+    return ', '.join(f'"{name}"' for name, in cursor.fetchall())
+
+
+def years_with_rows(cursor, table=TABLE):
+    cursor.execute(
+        f"SELECT DISTINCT EXTRACT(YEAR FROM date_started)::int FROM {table} WHERE date_started IS NOT NULL"
+    )
+    return sorted(year for year, in cursor.fetchall())
+
+
+def wanted_years(cursor, ahead, table=TABLE):
+    """Every year that has rows, plus this year and `ahead` more."""
+    today = datetime.date.today()
+    return sorted(set(years_with_rows(cursor, table)) | set(range(today.year, today.year + ahead + 1)))
+
+
+def next_id(cursor):
+    """First id the rebuilt table must hand out (past both MAX(id) and the old sequence)."""
+    cursor.execute(f"SELECT COALESCE(MAX(id), 0) + 1, pg_get_serial_sequence(%s, 'id') FROM {TABLE}", [TABLE])
+    value, sequence = cursor.fetchone()
+    if sequence:
+        cursor.execute(f"SELECT last_value + CASE WHEN is_called THEN 1 ELSE 0 END FROM {sequence}")
+        value = max(value, cursor.fetchone()[0])
+    return value
+
+
+def rebuild(cursor, partitioned, ahead=2):
+    """
+    Replace api_partnerships with a partitioned (or, going back, a plain) copy:
+    same columns, check constraints, indexes and foreign keys. Copies every row
+    under an exclusive lock — run it in a maintenance window on big tables.
+    """
+    old = f'{TABLE}_old'
+    # Rows written earlier in this transaction have deferred FK checks queued; the DROP below would refuse
+    cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+
+    cursor.execute(
+        """
+        SELECT i.relname, pg_get_indexdef(i.oid), x.indisprimary, x.indisunique
+        FROM pg_index x JOIN pg_class i ON i.oid = x.indexrelid
+        WHERE x.indrelid = to_regclass(%s)
+        """,
+        [TABLE],
+    )
+    indexes = cursor.fetchall()
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+        [TABLE],
+    )
+    foreign_keys = cursor.fetchall()
+
+    if partitioned and any(unique and not primary for _, _, primary, unique in indexes):
+        raise RuntimeError(f"{TABLE} has UNIQUE indexes; they can't be kept on a table partitioned by date_started")
+
+    pk_name = next((name for name, _, primary, _ in indexes if primary), f'{TABLE}_pkey')
+    first_id = next_id(cursor)
+    years = wanted_years(cursor, ahead) if partitioned else []
+
+    cursor.execute(f"ALTER TABLE {TABLE} RENAME TO {old}")
+    cursor.execute(
+        f"CREATE TABLE {TABLE} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING GENERATED "
+        f"INCLUDING STORAGE INCLUDING COMMENTS)" + (" PARTITION BY RANGE (date_started)" if partitioned else "")
+    )
+    # The copied default (if any) points at the old table's sequence, which goes with it
+    cursor.execute(f"ALTER TABLE {TABLE} ALTER COLUMN id DROP DEFAULT")
+
+    if partitioned:
+        cursor.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT")
+        for year in years:
+            start, end = year_range(year)
+            cursor.execute(
+                f"CREATE TABLE {partition_name(year)} PARTITION OF {TABLE} FOR VALUES FROM (%s) TO (%s)",
+                [start, end],
+            )
+
+    columns = copied_columns(cursor, old)
+    cursor.execute(f"INSERT INTO {TABLE} ({columns}) SELECT {columns} FROM {old}")
+    cursor.execute(f"DROP TABLE {old}")
+
+    if partitioned:
+        cursor.execute(f"CREATE SEQUENCE {TABLE}_id_seq OWNED BY {TABLE}.id")
+        cursor.execute(f"SELECT setval('{TABLE}_id_seq', %s, false)", [first_id])
+        cursor.execute(f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{TABLE}_id_seq')")
+        # Built after the copy: one pass per partition instead of per-row index updates
+        for partition in partitions(cursor):
+            unique_id(cursor, partition)
+    else:
+        cursor.execute(f"ALTER TABLE {TABLE} ADD CONSTRAINT {pk_name} PRIMARY KEY (id)")
+        cursor.execute(f"ALTER TABLE {TABLE} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY (START WITH {first_id})")
+
+    # Definitions were read before the rename, so they already name the new table
+    for name, definition, primary, _ in indexes:
+        if not primary and name != ID_INDEX:
+            cursor.execute(definition)
+    for name, definition in foreign_keys:
+        cursor.execute(f"ALTER TABLE {TABLE} ADD CONSTRAINT {name} {definition}")
+
+    cursor.execute(f"ANALYZE {TABLE}")
+
+
+def create_partitions(cursor, years):
+    """
+    Add yearly partitions that don't exist yet; returns their names. Rows already
+    sitting in the default partition for such a year are moved into it.
+    """
+    existing = partitions(cursor)
+    created = []
+
+    for year in years:
+        name = partition_name(year)
+        if name in existing:
+            continue
+
+        start, end = year_range(year)
+        cursor.execute(
+            f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE date_started >= %s AND date_started < %s)",
+            [start, end],
+        )
+        if cursor.fetchone()[0]:
+            # Postgres refuses a new partition while the default one holds its rows
+            columns = copied_columns(cursor, TABLE)
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            cursor.execute(f"ALTER TABLE {TABLE} DETACH PARTITION {DEFAULT_PARTITION}")
+            cursor.execute(f"CREATE TABLE {name} PARTITION OF {TABLE} FOR VALUES FROM (%s) TO (%s)", [start, end])
+            cursor.execute(
+                f"INSERT INTO {TABLE} ({columns}) SELECT {columns} FROM {DEFAULT_PARTITION} "
+                f"WHERE date_started >= %s AND date_started < %s",
+                [start, end],
+            )
+            cursor.execute(
+                f"DELETE FROM {DEFAULT_PARTITION} WHERE date_started >= %s AND date_started < %s",
+                [start, end],
+            )
+            cursor.execute(f"ALTER TABLE {TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
+        else:
+            cursor.execute(f"CREATE TABLE {name} PARTITION OF {TABLE} FOR VALUES FROM (%s) TO (%s)", [start, end])
+        unique_id(cursor, name)
+        created.append(name)
+
+    return created
+
+
+def row_counts(cursor):
+    """{partition name: rows} — exact counts, for the management command's report."""
+    cursor.execute(f"SELECT tableoid::regclass::text, COUNT(*) FROM {TABLE} GROUP BY 1")
+    counts = dict(cursor.fetchall())
+    return {name: counts.get(name, 0) for name in partitions(cursor)}
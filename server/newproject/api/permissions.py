@@ -1,6 +1,6 @@
 from rest_framework import permissions
 from rest_framework.permissions import BasePermission, SAFE_METHODS
-from api.models import Department
+from api.models import College, Department, User
 
 class IsGuestOrReadOnly(permissions.BasePermission):
     def has_permission(self, request, view):
@@ -16,16 +16,50 @@ class IsCollegeAdmin(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.user.role != 'COLLEGE_ADMIN':
             return False
-        if hasattr(obj, 'college'):
-            return obj.college == request.user.college
+        if hasattr(obj, 'college_id'):   # departments, and partnerships (denormalized)
+            return obj.college_id == request.user.college_id
         if hasattr(obj, 'department'):
-            return obj.department.college == request.user.college
+            return obj.department.college_id == request.user.college_id
         return False  
 
 class IsSuperAdmin(permissions.BasePermission):
     def has_permission(self, request, view):
         return request.user.is_authenticated and request.user.role == 'SUPERADMIN' 
 
+class CanViewHistory(BasePermission):
+    """
+    Audit history of one object (field diffs, actors): SUPERADMIN, or the
+    college/department admin the object belongs to. Users: only their own.
+    """
+    def has_permission(self, request, view):
+        return request.user.is_authenticated and request.user.role in ('SUPERADMIN', 'COLLEGE_ADMIN', 'DEPARTMENT_ADMIN')
+
+    def has_object_permission(self, request, view, obj):
+        user = request.user
+        if user.role == 'SUPERADMIN':
+            return True
+        if isinstance(obj, User):
+            return obj.pk == user.pk
+
+        if isinstance(obj, College):
+            college_id, department_id = obj.pk, None
+        elif isinstance(obj, Department):
+            college_id, department_id = obj.college_id, obj.pk
+        else:   # partnerships
+            college_id, department_id = obj.college_id, obj.department_id
+
+        if user.role == 'COLLEGE_ADMIN':
+            return college_id is not None and college_id == user.college_id
+        return department_id is not None and department_id == user.department_id
+
+class CanViewReports(BasePermission):
+    """College reports list contact details: SUPERADMIN, or the COLLEGE_ADMIN of that college."""
+    def has_permission(self, request, view):
+        return request.user.is_authenticated and request.user.role in ('SUPERADMIN', 'COLLEGE_ADMIN')
+
+    def has_object_permission(self, request, view, obj):
+        return request.user.role == 'SUPERADMIN' or obj.pk == request.user.college_id
+
 class CanManageUsers(BasePermission):
     """
     SUPERADMIN → Full access
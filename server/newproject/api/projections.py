@@ -0,0 +1,146 @@
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.response import Response
+
+
+# =========================================================
+# ⚡ Serializer-free read path
+# A Projection is compiled once from a ModelSerializer: it knows which columns
+# to fetch with .values_list() and how to turn each row into the exact dict
+# the serializer would have produced — without building a field tree per row.
+# =========================================================
+
+def datetime_converter(tz):
+    # Same as serializers.DateTimeField.to_representation
+    def convert(value):
+        if value is None:
+            return None
+        if value.tzinfo is not None:
+            value = value.astimezone(tz)
+        value = value.isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+
+    return convert
+
+
+def date_to_json(value):
+    return value.isoformat() if value is not None else None
+
+
+def file_url_converter(storage, request):
+    # Same as serializers.ImageField.to_representation (use_url=True)
+    urls = {}
+
+    def convert(name):
+        if not name:
+            return None
+        if name not in urls:
+            url = storage.url(name)
+            urls[name] = request.build_absolute_uri(url) if request is not None else url
+        return urls[name]
+
+    return convert
+
+
+# Serializer field → how its value comes out of .values_list()
+PLAIN = None
+DATETIME = 'datetime'
+DATE = 'date'
+FILE = 'file'
+
+_PLAIN_FIELDS = (
+    serializers.IntegerField,
+    serializers.CharField,      # also EmailField, SlugField, ...
+    serializers.BooleanField,
+    serializers.ChoiceField,
+    serializers.PrimaryKeyRelatedField,
+)
+
+
+class Projection:
+    """
+    projection = Projection.for_serializer(PartnershipsSerializer)
+    data = projection.rows(queryset, request)   # == PartnershipsSerializer(queryset, many=True).data
+    """
+
+    def __init__(self, model, fields):
+        # fields: [(output name, model column, kind)]
+        self.names = [name for name, _, _ in fields]
+        self.columns = [column for _, column, _ in fields]
+        self.kinds = {name: kind for name, _, kind in fields if kind is not PLAIN}
+        self.storages = {
+            name: model._meta.get_field(column).storage
+            for name, column, kind in fields if kind == FILE
+        }
+
+    @classmethod
+    def for_serializer(cls, serializer_class):
+        """Compile from a serializer's readable fields, in the serializer's own order."""
+        fields = []
+        for name, field in serializer_class().fields.items():
+            if field.write_only:
+                continue
+
+            column = field.source
+            if isinstance(field, serializers.FileField):
+                kind = FILE
+            elif isinstance(field, serializers.DateTimeField):
+                kind = DATETIME
+            elif isinstance(field, serializers.DateField):
+                kind = DATE
+            elif isinstance(field, _PLAIN_FIELDS):
+                kind = PLAIN
+            else:
+                raise TypeError(f'{serializer_class.__name__}.{name}: {type(field).__name__} has no projection')
+
+            if '.' in column or column == '*':
+                raise TypeError(f'{serializer_class.__name__}.{name}: dotted/"*" sources are not supported')
+
+            fields.append((name, column, kind))
+        return cls(serializer_class.Meta.model, fields)
+
+    def converters(self, request):
+        tz = timezone.get_current_timezone()
+        converters = []
+        for name, kind in self.kinds.items():
+            if kind == FILE:
+                converters.append((name, file_url_converter(self.storages[name], request)))
+            elif kind == DATETIME:
+                converters.append((name, datetime_converter(tz)))
+            else:
+                converters.append((name, date_to_json))
+        return converters
+
+    def rows(self, queryset, request=None):
+        names = self.names
+        converters = self.converters(request)
+
+        data = []
+        for row in queryset.values_list(*self.columns):
+            item = dict(zip(names, row))
+            for name, convert in converters:
+                item[name] = convert(item[name])
+            data.append(item)
+        return data
+
+
+class ProjectedListMixin:
+    """
+    list() for read-only viewsets that returns the same JSON as the serializer,
+    built straight from .values_list() rows (see Projection).
+    """
+
+    def get_projection(self):
+        cls = type(self)
+        if cls.__dict__.get('_projection') is None:
+            cls._projection = Projection.for_serializer(self.get_serializer_class())
+        return cls._projection
+
+    def list(self, request, *args, **kwargs):
+        if self.paginator is not None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(self.get_projection().rows(queryset, request))
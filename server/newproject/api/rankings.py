@@ -0,0 +1,114 @@
+import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, F, Q, Window
+from django.db.models.functions import PercentRank, Rank
+from django.utils import timezone
+
+from .models import College, Department, Partnerships
+
+
+# =========================================================
+# 🏆 Rankings — ranks, deltas and percentiles in one query
+# Each college/department row gets its counts for the period via conditional
+# COUNTs, and RANK() / PERCENT_RANK() window functions over those counts.
+# Groups without any partnerships are included (LEFT JOIN from the group side).
+# =========================================================
+
+PERIODS = ('month', 'quarter', 'year')
+
+# level → (model, path from the model to its partnerships)
+LEVELS = {
+    'department': (Department, 'partnerships'),
+    'college': (College, 'partnerships'),   # Partnerships.college: no Department join
+}
+
+
+def period_bounds(period, day):
+    """(start, end, previous start) of the month/quarter/year containing `day`; end is exclusive."""
+    if period == 'year':
+        start = day.replace(month=1, day=1)
+        return start, start.replace(year=start.year + 1), start.replace(year=start.year - 1)
+
+    months = 3 if period == 'quarter' else 1
+    start = day.replace(month=(day.month - 1) // months * months + 1, day=1)
+
+    def shift(date, n):
+        index = date.year * 12 + date.month - 1 + n
+        return date.replace(year=index // 12, month=index % 12 + 1)
+
+    return start, shift(start, months), shift(start, -months)
+
+
+def compute(level, period, start, college_id=None):
+    """
+    Every college (or department, optionally within one college) ranked for
+    the period starting at `start`:
+
+      active              partnerships with status=active right now
+      started             partnerships that started in the period
+      previous            ... in the period before it
+      delta               started - previous
+      rank                by active (1 = most), ties share a rank
+      growth_rank         by delta
+      percentile          share of peers with fewer active partnerships (0-100)
+    """
+    model, path = LEVELS[level]
+    start, end, previous_start = period_bounds(period, start)
+
+    queryset = model.objects.all()
+    if level == 'department' and college_id:
+        queryset = queryset.filter(college_id=college_id)
+
+    fields = ['id', 'code', 'name'] + (['college_id'] if level == 'department' else [])
+
+    rows = (
+        queryset
+        .values(*fields)
+        .annotate(
+            active=Count(path, filter=Q(**{f'{path}__status': Partnerships.STATUS_ACTIVE})),
+            started=Count(path, filter=Q(**{
+                f'{path}__date_started__gte': start,
+                f'{path}__date_started__lt': end,
+            })),
+            previous=Count(path, filter=Q(**{
+                f'{path}__date_started__gte': previous_start,
+                f'{path}__date_started__lt': start,
+            })),
+        )
+        .annotate(delta=F('started') - F('previous'))
+        .annotate(
+            rank=Window(Rank(), order_by=F('active').desc()),
+            growth_rank=Window(Rank(), order_by=F('delta').desc()),
+            percentile=Window(PercentRank(), order_by=F('active').asc()),
+        )
+        .order_by('rank', 'name')
+    )
+
+    results = []
+    for row in rows:
+        row['percentile'] = round(row['percentile'] * 100, 1)
+        results.append(row)
+
+    return {
+        'level': level,
+        'period': period,
+        'start': start.isoformat(),
+        'end': (end - datetime.timedelta(days=1)).isoformat(),
+        'previous_start': previous_start.isoformat(),
+        'results': results,
+    }
+
+
+def rankings(level, period, day=None, college_id=None):
+    """compute(), cached per level/period/scope for RANKINGS_CACHE_SECONDS."""
+    day = day or timezone.localdate()
+    start, _, _ = period_bounds(period, day)
+
+    key = f'rankings:{level}:{period}:{start.isoformat()}:{college_id or "all"}'
+    data = cache.get(key)
+    if data is None:
+        data = compute(level, period, start, college_id)
+        cache.set(key, data, getattr(settings, 'RANKINGS_CACHE_SECONDS', 300))
+    return data
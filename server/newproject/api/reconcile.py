@@ -0,0 +1,85 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from . import cdn
+from .models import Partnerships, StatusReconciliation
+from .signals import bump_partnership_counts
+
+
+def expired_partnerships(today):
+    """Still marked active but already ended (uses partnership_status_end_idx)."""
+    return Partnerships.objects.filter(
+        status=Partnerships.STATUS_ACTIVE,
+        date_ended__lt=today,
+    )
+
+
+def expiring_partnerships(today, days):
+    """Active partnerships ending in the next `days` days, soonest first."""
+    return Partnerships.objects.filter(
+        status=Partnerships.STATUS_ACTIVE,
+        date_ended__gte=today,
+        date_ended__lte=today + timedelta(days=days),
+    ).order_by('date_ended', 'pk')
+
+
+def deactivate_expired(today, batch_size=500):
+    """
+    Flip every expired partnership to inactive, one set-based UPDATE per batch.
+    Returns the ids that were changed.
+    """
+    changed = []
+
+    while True:
+        with transaction.atomic():
+            # Lock the batch so the counter adjustment below matches what we update
+            ids = list(
+                expired_partnerships(today)
+                .select_for_update(skip_locked=True)
+                .order_by('pk')
+                .values_list('pk', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+
+            per_department = (
+                Partnerships.objects.filter(pk__in=ids)
+                .order_by()
+                .values('department_id')
+                .annotate(n=Count('pk'))
+            )
+
+            # QuerySet.update() skips signals → keep the counters in step by hand
+            for row in per_department:
+                bump_partnership_counts(row['department_id'], 0, -row['n'])
+
+            Partnerships.objects.filter(pk__in=ids).update(
+                status=Partnerships.STATUS_INACTIVE,
+                updated_at=timezone.now(),
+            )
+            cdn.purge(cdn.all_keys())
+
+        changed.extend(ids)
+
+    return changed
+
+
+def reconcile(today, batch_size=500, expiring_days=30):
+    """deactivate_expired() + the expiring-soon digest, recorded as a StatusReconciliation."""
+    changed = deactivate_expired(today, batch_size=batch_size)
+    expiring = list(
+        expiring_partnerships(today, expiring_days)
+        .select_related('department__college')
+    )
+
+    record = StatusReconciliation.objects.create(
+        as_of=today,
+        deactivated_count=len(changed),
+        deactivated_ids=changed,
+        expiring_days=expiring_days,
+        expiring_ids=[p.id for p in expiring],
+    )
+    return record, expiring
@@ -0,0 +1,267 @@
+import hashlib
+import io
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+from django.db import transaction
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+from django.utils.html import escape
+
+from .models import College, CollegeReport, Department, Partnerships
+from .timeline import started_per_month
+
+
+# =========================================================
+# 📊 Per-college partnership reports (XLSX / PDF)
+# Summary counts, departments, monthly growth (same series as
+# /api/partnerships/growth/) and partnerships by status with contact details.
+#
+# Each stored file is recorded in CollegeReport with a fingerprint of the data
+# it was built from (latest updated_at + row counts of the college, its
+# departments and partnerships): while nothing changes every download is the
+# same stored file. A change means a new fingerprint, which a background job
+# ("college_report") builds on first request.
+#
+# openpyxl / reportlab are imported by the writers only: web workers that
+# never render a report don't load them (see api/lazy.py).
+# =========================================================
+
+VERSION = 1   # bump when the layout changes, so old files are not served
+
+FORMATS = {
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'pdf': 'application/pdf',
+}
+
+PARTNERSHIP_COLUMNS = (
+    ('title', 'Title'),
+    ('department', 'Department'),
+    ('contact_person', 'Contact person'),
+    ('contact_email', 'Email'),
+    ('contact_phone', 'Phone'),
+    ('date_started', 'Started'),
+    ('date_ended', 'Ended'),
+)
+
+
+def storage():
+    return storages['reports']
+
+
+def fingerprint(college):
+    """Changes whenever a row of the report could have changed (edits, inserts, deletes)."""
+    departments = Department.objects.filter(college=college).aggregate(latest=Max('updated_at'), count=Count('id'))
+    partnerships = Partnerships.objects.filter(college=college).aggregate(
+        latest=Max('updated_at'), count=Count('id'),
+    )
+    raw = '|'.join(str(part) for part in (
+        VERSION, college.pk, college.updated_at,
+        departments['latest'], departments['count'],
+        partnerships['latest'], partnerships['count'],
+    ))
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+def report_name(college, kind, key):
+    """Name asked of the storage; the one it returns (and we keep) may differ."""
+    return f'reports/college-{college.pk}/{kind}-{key}.{kind}'
+
+
+def current(college, kind, key):
+    """The stored report built from exactly this data (fingerprint `key`), or None."""
+    return CollegeReport.objects.filter(college=college, kind=kind, fingerprint=key).first()
+
+
+def download_name(college, kind):
+    return f'{college.code}-partnerships-{timezone.localdate():%Y-%m-%d}.{kind}'
+
+
+# =========================================================
+# 🧮 Data
+# =========================================================
+
+def report_data(college):
+    partnerships = Partnerships.objects.filter(college=college)
+    active = Q(partnerships__status=Partnerships.STATUS_ACTIVE)
+
+    departments = list(
+        Department.objects.filter(college=college)
+        .annotate(total=Count('partnerships'), active=Count('partnerships', filter=active))
+        .order_by('name')
+        .values('code', 'name', 'total', 'active')
+    )
+    for row in departments:
+        row['inactive'] = row['total'] - row['active']
+
+    rows = (
+        partnerships.select_related('department')
+        .order_by('department__name', 'title')
+        .values('status', 'title', 'department__name', 'contact_person', 'contact_email',
+                'contact_phone', 'date_started', 'date_ended')
+    )
+    by_status = {value: [] for value, _ in Partnerships.STATUS_CHOICES}
+    for row in rows:
+        row['department'] = row.pop('department__name')
+        by_status.setdefault(row.pop('status'), []).append(row)
+
+    return {
+        'college': {'code': college.code, 'name': college.name},
+        'generated_at': timezone.localtime(),
+        'totals': {
+            'departments': len(departments),
+            'partnerships': sum(len(items) for items in by_status.values()),
+            **{status: len(items) for status, items in by_status.items()},
+        },
+        'departments': departments,
+        'growth': started_per_month(partnerships),
+        'by_status': by_status,
+    }
+
+
+def status_label(status):
+    return dict(Partnerships.STATUS_CHOICES).get(status, status.title())
+
+
+# =========================================================
+# 🖨️ Writers: data → bytes
+# =========================================================
+
+def render_xlsx(data):
+    from openpyxl import Workbook
+    from openpyxl.styles import Font
+
+    bold = Font(bold=True)
+    workbook = Workbook()
+
+    def sheet(title, header, rows, first=False):
+        ws = workbook.active if first else workbook.create_sheet()
+        ws.title = title
+        ws.append(header)
+        for cell in ws[1]:
+            cell.font = bold
+        for row in rows:
+            ws.append(row)
+        ws.freeze_panes = 'A2'
+        for column in ws.columns:
+            width = max(len(str(cell.value or '')) for cell in column)
+            ws.column_dimensions[column[0].column_letter].width = min(60, max(10, width + 2))
+        return ws
+
+    college = data['college']
+    summary = [
+        ('College', f"{college['code']} - {college['name']}"),
+        ('Generated', data['generated_at'].strftime('%Y-%m-%d %H:%M')),
+        ('Departments', data['totals']['departments']),
+        ('Partnerships', data['totals']['partnerships']),
+    ] + [(status_label(status), len(items)) for status, items in data['by_status'].items()]
+    sheet('Summary', ('Field', 'Value'), summary, first=True)
+
+    sheet('Departments', ('Code', 'Department', 'Partnerships', 'Active', 'Inactive'), (
+        (row['code'], row['name'], row['total'], row['active'], row['inactive']) for row in data['departments']
+    ))
+    sheet('Growth', ('Month', 'Started'), ((row['month'], row['count']) for row in data['growth']))
+
+    for status, items in data['by_status'].items():
+        sheet(status_label(status), [label for _, label in PARTNERSHIP_COLUMNS], (
+            [item[field] for field, _ in PARTNERSHIP_COLUMNS] for item in items
+        ))
+
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def render_pdf(data):
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import mm
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+    styles = getSampleStyleSheet()
+    cell = styles['BodyText'].clone('cell', fontSize=8, leading=10)
+    grid = TableStyle([
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e8e8e8')),
+        ('GRID', (0, 0), (-1, -1), 0.25, colors.grey),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ])
+
+    def table(header, rows, widths=None):
+        # Paragraph text is markup: escape titles like "R&D"
+        body = [[Paragraph(escape(value if value is not None else ''), cell) for value in row] for row in rows]
+        result = Table([list(header)] + body, colWidths=widths, repeatRows=1)
+        result.setStyle(grid)
+        return result
+
+    college = data['college']
+    story = [
+        Paragraph(escape(f"{college['code']} - {college['name']}: partnerships"), styles['Title']),
+        Paragraph(f"Generated {data['generated_at']:%Y-%m-%d %H:%M}", styles['Normal']),
+        Spacer(0, 6 * mm),
+        table(('Field', 'Value'), [
+            ('Departments', data['totals']['departments']),
+            ('Partnerships', data['totals']['partnerships']),
+        ] + [(status_label(status), len(items)) for status, items in data['by_status'].items()], (50 * mm, 30 * mm)),
+        Spacer(0, 6 * mm),
+        Paragraph('Departments', styles['Heading2']),
+        table(('Code', 'Department', 'Partnerships', 'Active', 'Inactive'), (
+            (row['code'], row['name'], row['total'], row['active'], row['inactive']) for row in data['departments']
+        )),
+    ]
+
+    if data['growth']:
+        story += [
+            Paragraph('Growth (partnerships started per month)', styles['Heading2']),
+            table(('Month', 'Started'), ((row['month'], row['count']) for row in data['growth']), (30 * mm, 25 * mm)),
+        ]
+
+    for status, items in data['by_status'].items():
+        story.append(Paragraph(f'{status_label(status)} partnerships ({len(items)})', styles['Heading2']))
+        if items:
+            story.append(table([label for _, label in PARTNERSHIP_COLUMNS], (
+                [item[field] for field, _ in PARTNERSHIP_COLUMNS] for item in items
+            )))
+
+    buffer = io.BytesIO()
+    SimpleDocTemplate(
+        buffer, pagesize=landscape(A4), title=f"{college['code']} partnerships",
+        leftMargin=12 * mm, rightMargin=12 * mm, topMargin=12 * mm, bottomMargin=12 * mm,
+    ).build(story)
+    return buffer.getvalue()
+
+
+RENDERERS = {'xlsx': render_xlsx, 'pdf': render_pdf}
+
+
+def generate(college_id, kind):
+    """Build and store the report for the college's current data; returns the stored name."""
+    college = College.objects.get(pk=college_id)
+    key = fingerprint(college)
+    report = current(college, kind, key)
+    if report is not None:
+        return report.name
+
+    content = RENDERERS[kind](report_data(college))
+    # Keep whatever name the storage picked (Cloudinary: "media/..." + a unique suffix)
+    saved = storage().save(report_name(college, kind, key), ContentFile(content))
+
+    with transaction.atomic():
+        previous = CollegeReport.objects.select_for_update().filter(college=college, kind=kind).first()
+        if previous is not None and previous.fingerprint == key:
+            # Another job built the same data meanwhile (and may be streaming it): keep theirs
+            if previous.name != saved:
+                storage().delete(saved)
+            return previous.name
+
+        CollegeReport.objects.update_or_create(
+            college=college, kind=kind,
+            defaults={'fingerprint': key, 'name': saved, 'created_at': timezone.now()},
+        )
+
+    # Only the newest file per college/format is ever served: drop the one it replaces
+    if previous is not None and previous.name != saved:
+        storage().delete(previous.name)
+    return saved
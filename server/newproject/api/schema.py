@@ -0,0 +1,59 @@
+import json
+import os
+
+from django.conf import settings
+from django.http import HttpResponseRedirect
+from django.templatetags.static import static
+from django.views.decorators.csrf import csrf_exempt
+
+from .lazy import lazy_view
+
+
+# Where `manage.py build_schema` writes the pre-built schema, inside STATIC_ROOT
+SCHEMA_DIR = 'schema'
+MANIFEST_NAME = 'manifest.json'
+
+_dynamic_schema_view = lazy_view('drf_spectacular.views.SpectacularAPIView')
+
+
+def schema_root():
+    return os.path.join(settings.STATIC_ROOT, SCHEMA_DIR)
+
+
+_schema_url = None
+
+
+def load_schema_url():
+    """
+    Read the manifest written by `manage.py build_schema`. Called once from
+    ApiConfig.ready(), i.e. before WhiteNoiseMiddleware indexes STATIC_ROOT:
+    a schema built after the process started isn't in that index, so it is
+    only used from the next restart.
+    """
+    global _schema_url
+    try:
+        with open(os.path.join(schema_root(), MANIFEST_NAME)) as manifest:
+            filename = json.load(manifest)['current']
+    except (OSError, ValueError, KeyError):
+        _schema_url = None
+    else:
+        _schema_url = static(f'{SCHEMA_DIR}/{filename}')
+
+
+def current_schema_url():
+    """Static URL of the schema built for this deploy, or None if it wasn't built before start-up."""
+    return _schema_url
+
+
+@csrf_exempt
+def schema_view(request, *args, **kwargs):
+    """
+    OpenAPI schema.
+    Built at deploy time → redirect to the file, which whitenoise serves with
+    long-lived cache headers.
+    DEBUG, or not built before this process started → generated on the request.
+    """
+    url = None if settings.DEBUG else current_schema_url()
+    if url is None:
+        return _dynamic_schema_view(request, *args, **kwargs)
+    return HttpResponseRedirect(url)
@@ -1,7 +1,6 @@
 from rest_framework import serializers
-from .models import College, Department, Partnerships, User
+from .models import College, Department, Partnerships, ArchivedPartnership, User, AuditLog, Job
 from django.contrib.auth.password_validation import validate_password
-from cloudinary.utils import cloudinary_url
 
 
 class UserMiniSerializer(serializers.ModelSerializer):
@@ -87,3 +86,49 @@ class PartnershipsSerializer(serializers.ModelSerializer):
     class Meta:
         model = Partnerships
         fields = '__all__'
+
+
+class ArchivedPartnershipSerializer(serializers.ModelSerializer):
+    """Same shape as PartnershipsSerializer, plus archived/archived_at (read-only)."""
+    archived = serializers.BooleanField(default=True, read_only=True)
+
+    class Meta:
+        model = ArchivedPartnership
+        fields = '__all__'
+
+
+class AuditLogSerializer(serializers.ModelSerializer):
+    actor_username = serializers.CharField(source='actor.username', read_only=True, default=None)
+
+    class Meta:
+        model = AuditLog
+        fields = ['id', 'action', 'model', 'object_id', 'object_repr', 'changes', 'actor', 'actor_username', 'created_at']
+
+
+class JobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Job
+        fields = [
+            'id', 'name', 'kwargs', 'status', 'progress', 'progress_message', 'result', 'error',
+            'attempts', 'max_attempts', 'run_at', 'created_by', 'created_at', 'started_at', 'heartbeat_at', 'finished_at',
+        ]
+        read_only_fields = [f for f in fields if f not in ('name', 'kwargs')]
+
+    def validate_name(self, value):
+        from .jobs import TASKS
+        if value not in TASKS:
+            raise serializers.ValidationError(f"Unknown job. Available: {', '.join(sorted(TASKS))}")
+        return value
+
+    def validate_kwargs(self, value):
+        if not isinstance(value, dict):
+            raise serializers.ValidationError("Must be an object of keyword arguments.")
+        return value
+
+    def validate(self, attrs):
+        from .jobs import check_kwargs
+        try:
+            check_kwargs(attrs['name'], attrs.get('kwargs', {}))
+        except TypeError as exc:
+            raise serializers.ValidationError({'kwargs': str(exc)})
+        return attrs
@@ -0,0 +1,141 @@
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from . import cdn
+from .models import ArchivedPartnership, College, Department, Partnerships
+
+
+# =========================================================
+# 🔢 Denormalized counters on College / Department
+# Every change is a single UPDATE ... SET x = x + n (no read-modify-write).
+# QuerySet.update()/bulk_create skip signals → `manage.py recount` repairs drift
+# (of the counters and of Partnerships.college_id).
+# =========================================================
+
+def _is_active(status):
+    return 1 if status == Partnerships.STATUS_ACTIVE else 0
+
+
+def _plus(field, n):
+    # Never go below zero, even if the counters already drifted
+    return Greatest(F(field) + n, 0)
+
+
+def bump_partnership_counts(department_id, total, active):
+    """Add `total` partnerships (`active` of them active) to a department and its college."""
+    if not department_id or not (total or active):
+        return
+
+    changes = {
+        'partnership_count': _plus('partnership_count', total),
+        'active_partnership_count': _plus('active_partnership_count', active),
+    }
+    Department.objects.filter(pk=department_id).update(**changes)
+    College.objects.filter(departments=department_id).update(**changes)
+
+
+def bump_college_counts(college_id, departments, total, active):
+    if not college_id or not (departments or total or active):
+        return
+
+    College.objects.filter(pk=college_id).update(
+        department_count=_plus('department_count', departments),
+        partnership_count=_plus('partnership_count', total),
+        active_partnership_count=_plus('active_partnership_count', active),
+    )
+
+
+# ---------- Partnerships ----------
+
+@receiver(pre_save, sender=Partnerships)
+def remember_partnership(sender, instance, raw=False, **kwargs):
+    instance._previous = None
+    if instance.pk and not raw:
+        instance._previous = (
+            Partnerships.objects.filter(pk=instance.pk)
+            .values('department_id', 'college_id', 'status')
+            .first()
+        )
+
+
+@receiver(post_save, sender=Partnerships)
+def count_saved_partnership(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    previous = getattr(instance, '_previous', None)
+    active = _is_active(instance.status)
+
+    if created or previous is None:
+        bump_partnership_counts(instance.department_id, 1, active)
+        return
+
+    was_active = _is_active(previous['status'])
+
+    if previous['department_id'] == instance.department_id:
+        # Status flip only
+        bump_partnership_counts(instance.department_id, 0, active - was_active)
+    else:
+        # Moved to another department (maybe another college)
+        bump_partnership_counts(previous['department_id'], -1, -was_active)
+        bump_partnership_counts(instance.department_id, 1, active)
+        # The CDN purge of this save covers the new parents; the old ones' counters moved too
+        cdn.purge(cdn.instance_keys(Department(pk=previous['department_id'], college_id=previous['college_id'])))
+
+
+@receiver(post_delete, sender=Partnerships)
+def count_deleted_partnership(sender, instance, **kwargs):
+    bump_partnership_counts(instance.department_id, -1, -_is_active(instance.status))
+
+
+# ---------- Department ----------
+
+@receiver(pre_save, sender=Department)
+def remember_department(sender, instance, raw=False, **kwargs):
+    instance._previous_college_id = None
+    if instance.pk and not raw:
+        instance._previous_college_id = (
+            Department.objects.filter(pk=instance.pk)
+            .values_list('college_id', flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Department)
+def count_saved_department(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    if created:
+        bump_college_counts(instance.college_id, 1, 0, 0)
+        return
+
+    old_college_id = getattr(instance, '_previous_college_id', None)
+    if old_college_id == instance.college_id:
+        return
+
+    # Department moved college: take its partnerships along (their denormalized college_id too)
+    Partnerships.objects.filter(department_id=instance.pk).update(college_id=instance.college_id)
+    ArchivedPartnership.objects.filter(department_id=instance.pk).update(college_id=instance.college_id)
+
+    counts = (
+        Department.objects.filter(pk=instance.pk)
+        .values('partnership_count', 'active_partnership_count')
+        .first()
+    )
+    if counts is None:
+        return
+
+    total, active = counts['partnership_count'], counts['active_partnership_count']
+    bump_college_counts(old_college_id, -1, -total, -active)
+    bump_college_counts(instance.college_id, 1, total, active)
+    if old_college_id:
+        cdn.purge(cdn.instance_keys(College(pk=old_college_id)))
+
+
+@receiver(post_delete, sender=Department)
+def count_deleted_department(sender, instance, **kwargs):
+    # Its partnerships were cascade-deleted first and already decremented the college
+    bump_college_counts(instance.college_id, -1, 0, 0)
@@ -0,0 +1,134 @@
+import hashlib
+import os
+
+from django.apps import apps
+from django.core.files.storage import Storage
+from django.db import models, transaction
+from django.utils.deconstruct import deconstructible
+from django.utils.module_loading import import_string
+
+
+# =========================================================
+# 🖼️ Content-addressed media storage
+# Uploads are stored as "<upload_to>/<sha256 of the bytes><ext>", so an
+# identical logo (another partnership with the same partner, or the edit modal
+# re-submitting the unchanged file) reuses the stored object instead of
+# uploading it again. Which digest was stored under which name is kept in
+# StoredFile (one unique-index lookup, shared by every worker).
+# =========================================================
+
+DIGEST_LENGTH = 32   # hex chars of sha256 kept in the name
+
+
+def content_digest(content):
+    sha = hashlib.sha256()
+    for chunk in content.chunks():
+        sha.update(chunk)
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    return sha.hexdigest()[:DIGEST_LENGTH]
+
+
+def stem_for(directory, digest):
+    return f'{directory}/{digest}' if directory else digest
+
+
+def stored_files():
+    # Resolved lazily: storages are set up before the app registry is ready
+    return apps.get_model('api', 'StoredFile').objects
+
+
+@deconstructible
+class ContentAddressedStorage(Storage):
+    """
+    Wraps the real media backend:
+
+        "default": {
+            "BACKEND": "api.storage.ContentAddressedStorage",
+            "OPTIONS": {"backend": "cloudinary_storage.storage.MediaCloudinaryStorage"},
+        }
+
+    The backend may still decorate the name it stores (Cloudinary prefixes
+    "media/" and appends a random suffix): the name it returns is recorded in
+    StoredFile under "<upload_to>/<digest>".
+    """
+
+    def __init__(self, backend='django.core.files.storage.FileSystemStorage', backend_options=None):
+        self.backend_path = backend
+        self.backend_options = backend_options or {}
+        self.backend = import_string(backend)(**self.backend_options)
+
+    # ---- saving ----
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is decided in _save (and by the backend); don't probe it here
+        return name[:max_length] if max_length else name
+
+    def _save(self, name, content):
+        ext = os.path.splitext(name)[1].lower()
+        stem = stem_for(os.path.dirname(name), content_digest(content))
+
+        existing = self.find(stem)
+        if existing:
+            return existing
+
+        stored = self.backend.save(stem + ext, content)
+        with transaction.atomic():
+            record, created = stored_files().get_or_create(key=stem, defaults={'name': stored})
+        if not created and record.name != stored:
+            # Another worker uploaded the same bytes meanwhile: keep theirs
+            self.backend.delete(stored)
+        return record.name
+
+    def find(self, stem):
+        """Stored name of content with this digest, or None if it has never been saved."""
+        return stored_files().filter(key=stem).values_list('name', flat=True).first()
+
+    def delete(self, name):
+        """
+        Stored objects are shared by every row with the same bytes: only delete
+        one that no row references any more (FieldFile.delete() runs before its
+        own row lets go of the name, so that file is kept).
+        """
+        if self.in_use(name):
+            return
+        stored_files().filter(name=name).delete()
+        return self.backend.delete(name)
+
+    @staticmethod
+    def in_use(name):
+        """Whether any row of a file field in the api app (logos, archived logos...) holds `name`."""
+        for model in apps.get_app_config('api').get_models():
+            for field in model._meta.concrete_fields:
+                if isinstance(field, models.FileField) and model._base_manager.filter(**{field.name: name}).exists():
+                    return True
+        return False
+
+    # ---- everything else is the backend's ----
+
+    def _open(self, name, mode='rb'):
+        return self.backend.open(name, mode)
+
+    def exists(self, name):
+        return self.backend.exists(name)
+
+    def url(self, name):
+        return self.backend.url(name)
+
+    def size(self, name):
+        return self.backend.size(name)
+
+    def path(self, name):
+        return self.backend.path(name)
+
+    def listdir(self, path):
+        return self.backend.listdir(path)
+
+    def get_accessed_time(self, name):
+        return self.backend.get_accessed_time(name)
+
+    def get_created_time(self, name):
+        return self.backend.get_created_time(name)
+
+    def get_modified_time(self, name):
+        return self.backend.get_modified_time(name)
@@ -0,0 +1,58 @@
+import io
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import transaction
+from django.utils import timezone
+
+from . import archive, reports
+from .counters import recount
+from .jobs import task
+from .reconcile import reconcile
+
+
+# =========================================================
+# 🧵 Jobs that can be queued (POST /api/jobs/ or jobs.enqueue)
+# =========================================================
+
+@task('recount')
+def recount_counters(job, dry_run=False):
+    with transaction.atomic():
+        return {'drifted': recount(dry_run=dry_run)}
+
+
+@task('reconcile_status')
+def reconcile_status(job, batch_size=500, expiring_days=30):
+    record, expiring = reconcile(timezone.localdate(), batch_size=batch_size, expiring_days=expiring_days)
+    return {
+        'reconciliation': record.pk,
+        'deactivated': record.deactivated_count,
+        'expiring': len(expiring),
+    }
+
+
+@task('backfill_logos')
+def backfill_logos(job, force=False, workers=2):
+    output = io.StringIO()
+    call_command('backfill_logos', force=force, workers=workers, stdout=output)
+    return {'output': output.getvalue()}
+
+
+@task('archive_partnerships')
+def archive_partnerships(job, older_than_days=None, batch_size=500):
+    days = older_than_days if older_than_days is not None else getattr(settings, 'ARCHIVE_AFTER_DAYS', 1095)
+    cutoff = archive.cutoff_for(timezone.localdate(), days)
+    return {'cutoff': cutoff, 'archived': len(archive.archive(cutoff, batch_size=batch_size, actor=job.created_by))}
+
+
+@task('college_report')
+def college_report(job, college, kind, fingerprint=None):
+    # `fingerprint` is what the requester saw; only used to spot duplicate requests
+    return {'name': reports.generate(college, kind)}
+
+
+@task('partition_partnerships')
+def partition_partnerships(job, years_ahead=None):
+    output = io.StringIO()
+    call_command('partition_partnerships', years_ahead=years_ahead, stdout=output)
+    return {'output': output.getvalue()}
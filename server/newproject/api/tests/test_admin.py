@@ -0,0 +1,69 @@
+from django.db import connection
+from django.test import TestCase
+
+from api.admin import estimated_count
+from api.models import AuditLog, College, Partnerships, User
+
+from .utils import CacheClearMixin, make_college, make_department, make_partnership, make_user
+
+
+class AdminTests(CacheClearMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.root = User.objects.create_superuser('root', 'root@example.com', 'pass-12345', role=User.SUPERADMIN)
+        self.client.force_login(self.root)
+        self.college = make_college('CCS')
+        self.department = make_department(self.college, 'IT')
+        self.partnerships = [make_partnership(self.department, title=f'DOST {i}') for i in range(3)]
+
+    def test_changelists_load(self):
+        for url in ('/admin/api/user/', '/admin/api/college/', '/admin/api/department/', '/admin/api/partnerships/'):
+            self.assertEqual(self.client.get(url).status_code, 200, url)
+
+    def test_user_search_is_exact_username_or_email(self):
+        make_user('maria.santos', email='Maria@Example.com')
+        make_user('mariano')
+
+        def found(term):
+            response = self.client.get('/admin/api/user/', {'q': term})
+            return sorted(user.username for user in response.context['cl'].result_list)
+
+        self.assertEqual(found('MARIA.SANTOS'), ['maria.santos'])
+        self.assertEqual(found('maria@example.com'), ['maria.santos'])
+        self.assertEqual(found('maria'), [])
+
+    def test_autocomplete_finds_colleges_by_code(self):
+        make_college('COE')
+        response = self.client.get('/admin/autocomplete/', {
+            'app_label': 'api', 'model_name': 'user', 'field_name': 'college', 'term': 'ccs',
+        })
+        self.assertEqual([row['id'] for row in response.json()['results']], [str(self.college.pk)])
+
+    def test_partnership_search_by_id(self):
+        target = self.partnerships[1]
+        response = self.client.get('/admin/api/partnerships/', {'q': str(target.pk)})
+        self.assertEqual(list(response.context['cl'].result_list), [target])
+
+    def test_mark_inactive_adjusts_counters_and_audits(self):
+        response = self.client.post('/admin/api/partnerships/', {
+            'action': 'mark_inactive', '_selected_action': [p.pk for p in self.partnerships[:2]],
+        })
+        self.assertEqual(response.status_code, 302)
+
+        self.department.refresh_from_db()
+        self.assertEqual(self.department.active_partnership_count, 1)
+        self.assertEqual(Partnerships.objects.filter(status=Partnerships.STATUS_INACTIVE).count(), 2)
+        self.assertEqual(AuditLog.objects.filter(changes__status=['active', 'inactive']).count(), 2)
+
+    def test_deactivate_never_locks_yourself_out(self):
+        other = make_user('other')
+        self.client.post('/admin/api/user/', {'action': 'deactivate_users', '_selected_action': [self.root.pk, other.pk]})
+        self.root.refresh_from_db()
+        other.refresh_from_db()
+        self.assertTrue(self.root.is_active)
+        self.assertFalse(other.is_active)
+
+    def test_no_estimate_for_filtered_changelists(self):
+        self.assertIsNone(estimated_count(College.objects.filter(code='CCS')))
+        if connection.vendor != 'postgresql':
+            self.assertIsNone(estimated_count(College.objects.all()))
@@ -0,0 +1,117 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from api import archive, jobs
+from api.models import ArchivedPartnership, AuditLog, Partnerships, User
+
+from .utils import CacheClearMixin, client_for, day, make_college, make_department, make_partnership, make_user
+
+
+class ArchiveRoundTripTests(CacheClearMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.college = make_college()
+        self.department = make_department(self.college)
+        self.ended = make_partnership(
+            self.department, title='Ended', status=Partnerships.STATUS_INACTIVE,
+            date_started=day(2015), date_ended=day(2018), contact_email='old@example.com',
+        )
+        self.running = make_partnership(self.department, title='Running', date_started=day(2024))
+
+    def counts(self):
+        self.department.refresh_from_db()
+        self.college.refresh_from_db()
+        return self.department.partnership_count, self.college.partnership_count
+
+    def test_archive_then_restore(self):
+        self.assertEqual(self.counts(), (2, 2))
+
+        self.assertEqual(archive.archive(day(2020)), [self.ended.pk])
+        self.assertFalse(Partnerships.objects.filter(pk=self.ended.pk).exists())
+        archived = ArchivedPartnership.objects.get(pk=self.ended.pk)
+        self.assertEqual((archived.title, archived.college_id, archived.contact_email),
+                         ('Ended', self.college.pk, 'old@example.com'))
+        self.assertEqual(self.counts(), (1, 1))
+
+        self.assertEqual(archive.restore([self.ended.pk, 999]), [self.ended.pk])
+        restored = Partnerships.objects.get(pk=self.ended.pk)
+        self.assertEqual((restored.title, restored.date_ended), ('Ended', day(2018)))
+        self.assertFalse(ArchivedPartnership.objects.exists())
+        self.assertEqual(self.counts(), (2, 2))
+
+    def test_restore_refuses_ids_in_use(self):
+        archive.archive(day(2020))
+        # Same id back in the hot table (e.g. a second copy of an old backup)
+        make_partnership(self.department, id=self.ended.pk, title='Squatter')
+
+        with self.assertRaisesMessage(ValueError, str(self.ended.pk)):
+            archive.restore([self.ended.pk])
+        self.assertTrue(ArchivedPartnership.objects.filter(pk=self.ended.pk).exists())
+
+        with self.assertRaises(CommandError):
+            call_command('archive_partnerships', restore=[self.ended.pk], stdout=StringIO())
+
+    def test_moves_are_in_the_partnership_history(self):
+        admin = make_user('root', role=User.SUPERADMIN)
+        AuditLog.objects.all().delete()
+
+        jobs.enqueue('archive_partnerships', created_by=admin, older_than_days=(day(2026) - day(2020)).days)
+        jobs.run(jobs.claim('w1'))
+        archive.restore([self.ended.pk], actor=admin)
+
+        entries = AuditLog.objects.filter(model='partnerships', object_id=self.ended.pk).order_by('pk')
+        self.assertEqual(
+            [(entry.actor_id, entry.action, entry.changes) for entry in entries],
+            [(admin.pk, AuditLog.ACTION_UPDATE, {'archived': [False, True]}),
+             (admin.pk, AuditLog.ACTION_UPDATE, {'archived': [True, False]})],
+        )
+        self.assertEqual(entries[0].object_repr, 'Ended')
+
+
+class IncludeArchivedListTests(CacheClearMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        department = make_department(make_college())
+        start = timezone.now() - timedelta(days=30)
+        self.expected = []
+        for i in range(8):
+            partnership = make_partnership(
+                department, title=f'P{i}', date_ended=day(2010) if i % 3 == 0 else None,
+            )
+            # Two rows share a created_at: the id breaks the tie
+            Partnerships.objects.filter(pk=partnership.pk).update(created_at=start + timedelta(days=min(i, 6)))
+            self.expected.append(f'P{i}')
+        self.expected.reverse()
+        archive.archive(day(2020))
+        self.client = client_for(make_user('guest'))
+
+    def test_pages_walk_both_tables_newest_first(self):
+        url = '/api/partnerships/?include_archived=true&page_size=3'
+        titles, archived, pages = [], set(), 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response.data['results']), 3)
+            titles += [row['title'] for row in response.data['results']]
+            archived |= {row['title'] for row in response.data['results'] if row['archived']}
+            url, pages = response.data['next'], pages + 1
+
+        self.assertEqual(titles, self.expected)
+        self.assertEqual(archived, {'P0', 'P3', 'P6'})
+        self.assertEqual(pages, 3)
+
+    def test_each_page_reads_a_bounded_number_of_rows(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/partnerships/?include_archived=true&page_size=2')
+        limits = [q['sql'] for q in queries.captured_queries if 'LIMIT 3' in q['sql']]
+        self.assertEqual(len(limits), 2)
+
+    def test_bad_cursor(self):
+        response = self.client.get('/api/partnerships/?include_archived=true&before=yesterday')
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,141 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from api import audit
+from api.models import AuditLog, User
+
+from .utils import CacheClearMixin, client_for, day, make_college, make_department, make_partnership, make_user
+
+
+class HistoryPermissionTests(CacheClearMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.college = make_college('CCS')
+        self.department = make_department(self.college, 'IT')
+        self.partnership = make_partnership(self.department, contact_email='secret@x.com')
+        self.superadmin = make_user('root', User.SUPERADMIN)
+
+        client_for(self.superadmin).patch(
+            f'/api/partnerships/{self.partnership.pk}/', {'contact_email': 'new@x.com'}, format='json',
+        )
+        audit.flush()
+        self.url = f'/api/partnerships/{self.partnership.pk}/history/'
+
+    def test_update_is_recorded(self):
+        entry = AuditLog.objects.get(model='partnerships', object_id=self.partnership.pk)
+        self.assertEqual(entry.action, AuditLog.ACTION_UPDATE)
+        self.assertEqual(entry.changes['contact_email'], ['secret@x.com', 'new@x.com'])
+        self.assertEqual(entry.actor, self.superadmin)
+
+    def test_anonymous_and_guests_cannot_read_history(self):
+        self.assertIn(client_for().get(self.url).status_code, (401, 403))
+        guest = make_user('guest', User.GUEST)
+        self.assertEqual(client_for(guest).get(self.url).status_code, 403)
+
+    def test_superadmin_reads_history(self):
+        response = client_for(self.superadmin).get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'][0]['changes']['contact_email'], ['secret@x.com', 'new@x.com'])
+
+    def test_owning_admins_only(self):
+        own_college = make_user('ca', User.COLLEGE_ADMIN, college=self.college)
+        own_department = make_user('da', User.DEPARTMENT_ADMIN, department=self.department)
+        other_college = make_college('COE')
+        other = make_user('ca2', User.COLLEGE_ADMIN, college=other_college)
+        other_department = make_user('da2', User.DEPARTMENT_ADMIN, department=make_department(other_college, 'CE'))
+
+        self.assertEqual(client_for(own_college).get(self.url).status_code, 200)
+        self.assertEqual(client_for(own_department).get(self.url).status_code, 200)
+        self.assertIn(client_for(other).get(self.url).status_code, (403, 404))
+        self.assertIn(client_for(other_department).get(self.url).status_code, (403, 404))
+
+    def test_college_history_for_its_admin(self):
+        url = f'/api/colleges/{self.college.pk}/history/'
+        own = make_user('ca', User.COLLEGE_ADMIN, college=self.college)
+        department_admin = make_user('da', User.DEPARTMENT_ADMIN, department=self.department)
+        self.assertEqual(client_for(own).get(url).status_code, 200)
+        self.assertEqual(client_for(department_admin).get(url).status_code, 403)
+
+
+class DiffTests(SimpleTestCase):
+    def test_changed_fields_only_and_secrets_masked(self):
+        before = {'title': 'Old', 'status': 'active', 'password': 'a'}
+        after = {'title': 'New', 'status': 'active', 'password': 'b', 'logo': 'x.png'}
+        self.assertEqual(audit.diff(before, after), {
+            'title': ['Old', 'New'], 'password': ['***', '***'], 'logo': [None, 'x.png'],
+        })
+        self.assertEqual(audit.diff(before, {}), {'title': ['Old', None], 'status': ['active', None], 'password': ['***', '***']})
+
+
+class MutationAuditTests(CacheClearMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.department = make_department(make_college('CCS'), 'IT')
+        self.superadmin = make_user('root', User.SUPERADMIN)
+        self.client = client_for(self.superadmin)
+
+    def entries(self):
+        audit.flush()
+        return list(AuditLog.objects.order_by('pk').values_list('action', 'object_id', 'changes'))
+
+    def test_create_and_delete(self):
+        response = self.client.post('/api/partnerships/', {
+            'department': self.department.pk, 'title': 'DOST', 'description': 'MOA', 'date_started': '2025-01-01',
+        }, format='json')
+        self.assertEqual(response.status_code, 201, response.data)
+        pk = response.data['id']
+        self.client.delete(f'/api/partnerships/{pk}/')
+
+        (created, created_id, created_changes), (deleted, deleted_id, deleted_changes) = self.entries()
+        self.assertEqual((created, created_id, deleted, deleted_id), (AuditLog.ACTION_CREATE, pk, AuditLog.ACTION_DELETE, pk))
+        self.assertEqual(created_changes['department'], [None, self.department.pk])
+        self.assertEqual(created_changes['date_started'], [None, str(day(2025))])
+        self.assertEqual(deleted_changes['title'], ['DOST', None])
+
+    def test_no_op_update_is_not_recorded(self):
+        partnership = make_partnership(self.department)
+        self.client.patch(f'/api/partnerships/{partnership.pk}/', {'title': partnership.title}, format='json')
+        self.assertEqual(self.entries(), [])
+
+
+@override_settings(AUDIT_BUFFER_SIZE=2, AUDIT_FLUSH_SECONDS=60)
+class AuditBufferTests(TestCase):
+    def setUp(self):
+        # No exit hook and no flusher thread: these tests flush by hand
+        patcher = mock.patch.object(audit, 'atexit')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.buffer = audit.AuditBuffer()
+        self.addCleanup(setattr, self.buffer, 'pending', [])   # nothing left for an exit flush
+        patcher = mock.patch.object(self.buffer, '_ensure_thread')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def entry(self, object_id):
+        return AuditLog(action=AuditLog.ACTION_UPDATE, model='college', object_id=object_id, changes={})
+
+    def test_a_full_buffer_wakes_the_flusher(self):
+        self.buffer.add(self.entry(1))
+        self.assertFalse(self.buffer.wakeup.is_set())
+        self.buffer.add(self.entry(2))
+        self.assertTrue(self.buffer.wakeup.is_set())
+        self.buffer._ensure_thread.assert_called()
+
+    def test_failed_writes_are_kept_for_the_next_flush(self):
+        self.buffer.pending = [self.entry(1), self.entry(2)]
+        with mock.patch.object(AuditLog.objects, 'bulk_create', side_effect=RuntimeError('db down')), \
+                self.assertLogs('api.audit', 'ERROR'):
+            self.buffer.flush()
+        self.assertEqual([e.object_id for e in self.buffer.pending], [1, 2])
+
+        self.buffer.flush()
+        self.assertEqual(self.buffer.pending, [])
+        self.assertEqual(sorted(AuditLog.objects.values_list('object_id', flat=True)), [1, 2])
+
+    def test_a_forked_worker_starts_empty(self):
+        self.buffer.pending = [self.entry(1)]
+        self.buffer.pid = -1   # as seen from a child process
+        self.buffer.add(self.entry(2))
+        self.assertEqual([e.object_id for e in self.buffer.pending], [2])
@@ -0,0 +1,67 @@
+from django.test import TransactionTestCase, override_settings
+
+from api import audit
+from api.models import Partnerships, User
+
+from .utils import CacheClearMixin, client_for, make_college, make_department, make_partnership, make_user
+
+
+class BatchTests(CacheClearMixin, TransactionTestCase):
+    # Reads run on the batch thread pool, which must see these rows
+    def setUp(self):
+        super().setUp()
+        self.college = make_college('CCS')
+        self.department = make_department(self.college, 'IT')
+        self.partnership = make_partnership(self.department)
+        self.admin = make_user('root', role=User.SUPERADMIN)
+        # Write the buffered audit rows before the tables are flushed
+        self.addCleanup(audit.flush)
+
+    def batch(self, requests, user=None):
+        return client_for(user or self.admin).post('/api/batch/', {'requests': requests}, format='json')
+
+    def test_responses_come_back_in_order(self):
+        response = self.batch([
+            {'id': 'college', 'path': f'/api/colleges/{self.college.pk}/'},
+            {'id': 'departments', 'path': f'/api/departments/?college={self.college.pk}'},
+            {'id': 'missing', 'path': '/api/colleges/999/'},
+            {'path': '/api/viewing/partnerships/'},
+        ])
+        self.assertEqual(response.status_code, 200)
+        responses = response.json()['responses']
+
+        self.assertEqual([(r['id'], r['status']) for r in responses],
+                         [('college', 200), ('departments', 200), ('missing', 404), (3, 200)])
+        self.assertEqual(responses[0]['body']['code'], 'CCS')
+
+    def test_a_write_is_seen_by_the_reads_after_it(self):
+        url = f'/api/partnerships/{self.partnership.pk}/'
+        responses = self.batch([
+            {'path': url},
+            {'method': 'PATCH', 'path': url, 'body': {'status': Partnerships.STATUS_INACTIVE}},
+            {'path': url},
+        ]).json()['responses']
+
+        self.assertEqual([r['status'] for r in responses], [200, 200, 200])
+        self.assertEqual([responses[0]['body']['status'], responses[2]['body']['status']],
+                         [Partnerships.STATUS_ACTIVE, Partnerships.STATUS_INACTIVE])
+
+    def test_sub_requests_check_their_own_permissions(self):
+        responses = self.batch([
+            {'path': '/api/viewing/colleges/'},
+            {'method': 'DELETE', 'path': f'/api/partnerships/{self.partnership.pk}/'},
+        ], user=make_user('guest')).json()['responses']
+
+        self.assertEqual([r['status'] for r in responses], [200, 403])
+        self.assertTrue(Partnerships.objects.filter(pk=self.partnership.pk).exists())
+
+    @override_settings(BATCH_MAX_REQUESTS=2)
+    def test_rejects_bad_envelopes(self):
+        for requests in (
+            [],
+            [{'path': '/api/colleges/'}] * 3,
+            [{'method': 'OPTIONS', 'path': '/api/colleges/'}],
+            [{'path': '/admin/'}],
+            [{'path': '/api/batch/'}],
+        ):
+            self.assertEqual(self.batch(requests).status_code, 400, requests)
@@ -0,0 +1,108 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api import cdn
+
+from .utils import CacheClearMixin, client_for, make_college, make_department, make_partnership, make_user
+
+
+POLICIES = {
+    'default': {'max_age': 60, 's_maxage': 300, 'stale_while_revalidate': 30},
+    'viewing-partnerships': {'max_age': 0, 's_maxage': 120},
+}
+
+
+@override_settings(CDN_CACHE_POLICIES=POLICIES)
+class CacheHeaderTests(CacheClearMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.college = make_college('CCS')
+        self.department = make_department(self.college, 'IT')
+        self.partnership = make_partnership(self.department)
+
+    def test_anonymous_list_is_public_and_tagged(self):
+        response = client_for().get('/api/viewing/colleges/')
+        self.assertEqual(
+            set(response['Cache-Control'].split(', ')),
+            {'public', 'max-age=60', 's-maxage=300', 'stale-while-revalidate=30'},
+        )
+        self.assertEqual(response['Surrogate-Key'], f'colleges college-{self.college.pk}')
+        self.assertEqual(response['Cache-Tag'], f'colleges,college-{self.college.pk}')
+
+    def test_policy_per_route(self):
+        response = client_for().get('/api/viewing/partnerships/')
+        self.assertEqual(set(response['Cache-Control'].split(', ')), {'public', 'max-age=0', 's-maxage=120'})
+
+    def test_requests_with_credentials_are_private(self):
+        token = AccessToken.for_user(make_user('guest'))
+        response = client_for().get('/api/viewing/colleges/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('private', response['Cache-Control'])
+        self.assertFalse(response.has_header('Surrogate-Key'))
+
+    @override_settings(CDN_MAX_SURROGATE_KEYS=1)
+    def test_long_lists_use_the_collection_key_only(self):
+        make_partnership(self.department, title='Second')
+        self.assertEqual(client_for().get('/api/viewing/partnerships/')['Surrogate-Key'], 'partnerships')
+
+
+class PurgeTests(CacheClearMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.college = make_college('CCS')
+        self.department = make_department(self.college, 'IT')
+        # TestCase never commits: drop what setUp queued and what earlier tests purged
+        cdn._pending.keys = set()
+        cdn.get_purger().purged.clear()
+
+    def purged(self):
+        return [set(keys) for keys in cdn.get_purger().purged]
+
+    def test_changes_purge_the_row_and_its_parents_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            partnership = make_partnership(self.department)
+        self.assertEqual(self.purged(), [])   # nothing before commit
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.purged(), [{
+            'partnerships', f'partnership-{partnership.pk}',
+            f'department-{self.department.pk}', f'college-{self.college.pk}',
+        }])
+
+    def test_moves_purge_the_previous_parents_too(self):
+        coe = make_college('COE')
+        ce = make_department(coe, 'CE')
+        partnership = make_partnership(self.department)
+        cdn._pending.keys = set()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            partnership.department = ce
+            partnership.save()
+        self.assertTrue({f'department-{self.department.pk}', f'college-{self.college.pk}',
+                         f'department-{ce.pk}', f'college-{coe.pk}'} <= self.purged()[-1])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ce.college = self.college
+            ce.save()
+        self.assertTrue({f'college-{coe.pk}', f'college-{self.college.pk}'} <= self.purged()[-1])
+
+    def test_one_purge_per_transaction(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            make_partnership(self.department, title='One')
+            make_partnership(self.department, title='Two')
+        self.assertEqual(len(self.purged()), 1)
+
+    def test_failed_purges_are_logged_not_raised(self):
+        purger = mock.Mock()
+        purger.purge.side_effect = RuntimeError('CDN down')
+        with self.assertLogs('api.cdn', 'ERROR'):
+            cdn._send(purger, ['partnerships'])
+
+    def test_instance_keys(self):
+        self.assertEqual(cdn.instance_keys(self.department), {
+            'departments', f'department-{self.department.pk}', f'college-{self.college.pk}',
+        })
+        self.assertEqual(set(cdn.all_keys()), {'colleges', 'departments', 'partnerships'})
@@ -0,0 +1,52 @@
+from django.test import TestCase
+
+from api import archive
+from api.counters import recount
+from api.models import ArchivedPartnership, Partnerships, User
+
+from .utils import CacheClearMixin, client_for, day, make_college, make_department, make_partnership, make_user
+
+
+class CollegeIdSyncTests(CacheClearMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.ccs = make_college('CCS')
+        self.coe = make_college('COE')
+        self.it = make_department(self.ccs, 'IT')
+        self.ce = make_department(self.coe, 'CE')
+
+    def test_set_from_the_department_on_save(self):
+        partnership = make_partnership(self.it)
+        self.assertEqual(partnership.college_id, self.ccs.pk)
+
+        partnership.department = self.ce
+        partnership.save(update_fields=['department'])   # college is saved along with it
+        self.assertEqual(Partnerships.objects.get(pk=partnership.pk).college_id, self.coe.pk)
+
+    def test_follows_a_department_to_another_college(self):
+        live = make_partnership(self.it)
+        old = make_partnership(self.it, title='Old', date_ended=day(2010))
+        archive.archive(day(2020))
+
+        self.it.college = self.coe
+        self.it.save()
+        self.assertEqual(Partnerships.objects.get(pk=live.pk).college_id, self.coe.pk)
+        self.assertEqual(ArchivedPartnership.objects.get(pk=old.pk).college_id, self.coe.pk)
+
+    def test_recount_repairs_drift(self):
+        partnership = make_partnership(self.it)
+        Partnerships.objects.filter(pk=partnership.pk).update(college=self.coe)
+
+        self.assertEqual(recount(dry_run=True)['Partnerships.college'], 1)
+        recount()
+        self.assertEqual(Partnerships.objects.get(pk=partnership.pk).college_id, self.ccs.pk)
+        self.ccs.refresh_from_db()
+        self.assertEqual(self.ccs.partnership_count, 1)
+
+    def test_college_admin_list_is_scoped_by_college_id(self):
+        mine = make_partnership(self.it, title='Mine')
+        make_partnership(self.ce, title='Theirs')
+        admin = make_user('ccs-admin', role=User.COLLEGE_ADMIN, college=self.ccs)
+
+        response = client_for(admin).get('/api/partnerships/')
+        self.assertEqual([row['id'] for row in response.data], [mine.pk])
@@ -0,0 +1,85 @@
+import gzip
+import json
+from unittest import mock, skipIf
+
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase
+
+from api.middleware import CompressionMiddleware, accepted_encodings, brotli, choose_encoding
+
+from .utils import CacheClearMixin
+
+
+needs_brotli = skipIf(brotli is None, 'brotli is not installed')
+
+
+@needs_brotli
+class ChooseEncodingTests(SimpleTestCase):
+    def choose(self, header):
+        return choose_encoding(RequestFactory().get('/', HTTP_ACCEPT_ENCODING=header))
+
+    def test_parses_q_values(self):
+        self.assertEqual(accepted_encodings('gzip, br;q=0.5, *;q=0'), {'gzip': 1.0, 'br': 0.5, '*': 0.0})
+        self.assertEqual(accepted_encodings('br;q=oops'), {'br': 0.0})
+
+    def test_highest_q_wins(self):
+        self.assertEqual(self.choose('br;q=0.1, gzip;q=1'), 'gzip')
+        self.assertEqual(self.choose('gzip;q=0.2, br;q=0.8'), 'br')
+
+    def test_ties_prefer_brotli(self):
+        self.assertEqual(self.choose('gzip, deflate, br'), 'br')
+        self.assertEqual(self.choose('*'), 'br')
+
+    def test_refused_or_unknown(self):
+        self.assertIsNone(self.choose(''))
+        self.assertIsNone(self.choose('identity'))
+        self.assertIsNone(self.choose('br;q=0, gzip;q=0'))
+        self.assertEqual(self.choose('*;q=0.5, br;q=0'), 'gzip')
+
+    def test_without_brotli_installed(self):
+        with mock.patch('api.middleware.brotli', None):
+            self.assertEqual(self.choose('br'), None)
+            self.assertEqual(self.choose('br, gzip;q=0.1'), 'gzip')
+
+
+@needs_brotli
+class CompressionMiddlewareTests(CacheClearMixin, SimpleTestCase):
+    body = {'results': [{'title': f'Partnership {i}', 'status': 'active'} for i in range(100)]}
+
+    def call(self, view, header='br, gzip', path='/api/partnerships/'):
+        request = RequestFactory().get(path, HTTP_ACCEPT_ENCODING=header)
+        return CompressionMiddleware(view)(request)
+
+    def test_json_is_compressed_and_etag_weakened(self):
+        def view(request):
+            response = JsonResponse(self.body)
+            response['ETag'] = '"abc"'
+            return response
+
+        response = self.call(view)
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(response['ETag'], 'W/"abc"')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(json.loads(brotli.decompress(response.content)), self.body)
+
+        response = self.call(view, header='gzip')
+        self.assertEqual(json.loads(gzip.decompress(response.content)), self.body)
+
+    def test_small_binary_and_no_transform_are_left_alone(self):
+        self.assertFalse(self.call(lambda r: JsonResponse({'ok': True})).has_header('Content-Encoding'))
+        self.assertFalse(self.call(lambda r: HttpResponse(b'x' * 5000, content_type='image/png')).has_header('Content-Encoding'))
+
+        def no_transform(request):
+            response = JsonResponse(self.body)
+            response['Cache-Control'] = 'no-transform'
+            return response
+        self.assertFalse(self.call(no_transform).has_header('Content-Encoding'))
+
+    def test_streaming_is_compressed_chunk_by_chunk(self):
+        chunks = [b'{"rows": [', *(b'"row %d",' % i for i in range(200)), b'"end"]}']
+        response = self.call(
+            lambda r: StreamingHttpResponse(iter(chunks), content_type='application/json'), header='br'
+        )
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertFalse(response.has_header('Content-Length'))
+        self.assertEqual(brotli.decompress(b''.join(response.streaming_content)), b''.join(chunks))
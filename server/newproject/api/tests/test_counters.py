@@ -0,0 +1,107 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from api.counters import recount
+from api.models import College, Department, Partnerships
+
+from .utils import CacheClearMixin, make_college, make_department, make_partnership
+
+
+class CounterSignalTests(CacheClearMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.ccs = make_college('CCS')
+        self.coe = make_college('COE')
+        self.it = make_department(self.ccs, 'IT')
+        self.ce = make_department(self.coe, 'CE')
+
+    def counts(self, obj):
+        obj.refresh_from_db()
+        fields = ('department_count',) if isinstance(obj, College) else ()
+        return tuple(getattr(obj, name) for name in fields + ('partnership_count', 'active_partnership_count'))
+
+    def test_create_status_flip_and_delete(self):
+        partnership = make_partnership(self.it)
+        make_partnership(self.it, title='Inactive', status=Partnerships.STATUS_INACTIVE)
+        self.assertEqual(self.counts(self.it), (2, 1))
+        self.assertEqual(self.counts(self.ccs), (1, 2, 1))
+
+        partnership.status = Partnerships.STATUS_INACTIVE
+        partnership.save()
+        self.assertEqual(self.counts(self.it), (2, 0))
+
+        partnership.delete()
+        self.assertEqual(self.counts(self.it), (1, 0))
+        self.assertEqual(self.counts(self.ccs), (1, 1, 0))
+
+    def test_partnership_moves_department_and_college(self):
+        partnership = make_partnership(self.it)
+        partnership.department = self.ce
+        partnership.save()
+
+        self.assertEqual(self.counts(self.it), (0, 0))
+        self.assertEqual(self.counts(self.ce), (1, 1))
+        self.assertEqual(self.counts(self.ccs), (1, 0, 0))
+        self.assertEqual(self.counts(self.coe), (1, 1, 1))
+
+    def test_department_moves_college_with_its_partnerships(self):
+        make_partnership(self.it)
+        make_partnership(self.it, title='Second')
+        self.it.college = self.coe
+        self.it.save()
+
+        self.assertEqual(self.counts(self.ccs), (0, 0, 0))
+        self.assertEqual(self.counts(self.coe), (2, 2, 2))
+
+        self.it.delete()
+        self.assertEqual(self.counts(self.coe), (1, 0, 0))
+
+    def test_saving_a_stale_instance_keeps_the_counters(self):
+        # Counter fields are left out of save(): a stale copy can't overwrite them
+        stale = Department.objects.get(pk=self.it.pk)
+        make_partnership(self.it)
+        stale.name = 'Information Technology'
+        stale.save()
+        self.assertEqual(self.counts(self.it), (1, 1))
+
+    def test_counters_never_go_negative(self):
+        partnership = make_partnership(self.it)
+        Department.objects.filter(pk=self.it.pk).update(partnership_count=0, active_partnership_count=0)
+        partnership.delete()
+        self.assertEqual(self.counts(self.it), (0, 0))
+
+
+class RecountTests(CacheClearMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.college = make_college()
+        self.department = make_department(self.college)
+        make_partnership(self.department)
+        # bulk_create skips the signals: counters drift
+        Partnerships.objects.bulk_create([Partnerships(
+            department=self.department, college=self.college, title='Bulk', description='Bulk',
+        )])
+
+    def test_dry_run_reports_and_recount_repairs(self):
+        drifted = recount(dry_run=True)
+        self.assertEqual((drifted['Department'], drifted['College']), (1, 1))
+        self.department.refresh_from_db()
+        self.assertEqual(self.department.partnership_count, 1)
+
+        recount()
+        self.department.refresh_from_db()
+        self.college.refresh_from_db()
+        self.assertEqual((self.department.partnership_count, self.department.active_partnership_count), (2, 2))
+        self.assertEqual((self.college.department_count, self.college.partnership_count), (1, 2))
+        self.assertFalse(any(recount(dry_run=True).values()))
+
+    def test_command_output(self):
+        out = StringIO()
+        call_command('recount', stdout=out)
+        self.assertIn('Department: 1 row(s) fixed', out.getvalue())
+
+        out = StringIO()
+        call_command('recount', stdout=out)
+        self.assertIn('✅ College: in sync', out.getvalue())
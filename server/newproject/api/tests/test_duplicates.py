@@ -0,0 +1,74 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from api import duplicates
+from api.models import User
+
+from .utils import client_for, make_college, make_department, make_partnership, make_user
+
+
+class SimilarityTests(TestCase):
+    def test_matches_pg_trgm(self):
+        # SELECT similarity('word', 'two words') → 0.363636
+        self.assertAlmostEqual(duplicates.similarity('word', 'two words'), 4 / 11)
+        self.assertEqual(duplicates.similarity('DOST Region XI', 'dost region xi'), 1.0)
+        self.assertEqual(duplicates.similarity('', 'anything'), 0.0)
+
+
+class FindSimilarTests(TestCase):
+    def setUp(self):
+        department = make_department(make_college())
+        self.dost = make_partnership(department, title='DOST Region XI', contact_email='info@dost.gov.ph')
+        self.dost_davao = make_partnership(department, title='DOST Region XI Davao Office')
+        self.other = make_partnership(department, title='Bureau of Fisheries', contact_email='INFO@DOST.GOV.PH')
+
+    def test_title_and_email_matches(self):
+        found = duplicates.find_similar(title='Dost region 11', email='info@dost.gov.ph')
+        matches = {p.pk: p.match for p in found}
+
+        self.assertEqual(matches[self.dost.pk], 'title+email')
+        self.assertEqual(matches[self.other.pk], 'email')
+        self.assertEqual(found[0].similarity, 1.0)
+
+    def test_exclude_and_limit(self):
+        found = duplicates.find_similar(title='DOST Region XI', exclude_id=self.dost.pk, limit=1)
+        self.assertEqual([p.pk for p in found], [self.dost_davao.pk])
+
+    @override_settings(DUPLICATE_SIMILARITY_THRESHOLD=0.2)
+    def test_threshold_below_the_pg_trgm_default(self):
+        # similarity ≈ 0.27: under pg_trgm's default 0.3, over ours
+        title = 'Department of Science DOST Region 11 Davao'
+        self.assertLess(duplicates.similarity(title, self.dost.title), 0.3)
+        self.assertIn(self.dost.pk, [p.pk for p in duplicates.find_similar(title=title)])
+
+    def test_endpoint(self):
+        client = client_for(make_user('admin', role=User.SUPERADMIN))
+        response = client.get('/api/partnerships/similar/', {'title': 'DOST Region XI'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]['id'], self.dost.pk)
+        self.assertEqual(client.get('/api/partnerships/similar/').status_code, 400)
+
+
+class PostgresThresholdTests(TestCase):
+    def test_threshold_is_set_for_the_query_only(self):
+        queries = []
+
+        class Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute(self, sql, params=None):
+                queries.append((sql, params))
+
+        fake = mock.Mock(vendor='postgresql', ops=connection.ops, cursor=Cursor)
+        queryset = mock.MagicMock(db='default')
+        with mock.patch('api.duplicates.connections', {'default': fake}), \
+                override_settings(DUPLICATE_SIMILARITY_THRESHOLD=0.2):
+            duplicates._title_matches_postgres(queryset, 'DOST', 5)
+
+        self.assertEqual(queries, [("SELECT set_config('pg_trgm.similarity_threshold', %s, true)", ['0.2'])])
@@ -0,0 +1,99 @@
+import base64
+import io
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from PIL import Image
+
+from api.images import ORIENTATION, image_metadata
+from api.models import College
+
+from .utils import CacheClearMixin, make_college
+
+
+def image_file(size=(40, 20), color=(200, 30, 30), mode='RGB', fmt='PNG', exif=None):
+    buffer = io.BytesIO()
+    image = Image.new(mode, size, color)
+    if exif is not None:
+        image.save(buffer, fmt, exif=exif)
+    else:
+        image.save(buffer, fmt)
+    buffer.seek(0)
+    return buffer
+
+
+class ImageMetadataTests(SimpleTestCase):
+    def test_size_colour_and_placeholder(self):
+        metadata = image_metadata(image_file())
+        self.assertEqual((metadata['logo_width'], metadata['logo_height']), (40, 20))
+        self.assertEqual(metadata['logo_color'], '#c81e1e')
+
+        prefix = 'data:image/jpeg;base64,'
+        self.assertTrue(metadata['logo_placeholder'].startswith(prefix))
+        with Image.open(io.BytesIO(base64.b64decode(metadata['logo_placeholder'][len(prefix):]))) as preview:
+            self.assertEqual(preview.size, (16, 8))
+
+    def test_rotated_jpeg_reports_the_displayed_size(self):
+        exif = Image.Exif()
+        exif[ORIENTATION] = 6   # rotate 90° on display
+        metadata = image_metadata(image_file(fmt='JPEG', exif=exif))
+        self.assertEqual((metadata['logo_width'], metadata['logo_height']), (20, 40))
+
+    def test_transparency_sits_on_white(self):
+        metadata = image_metadata(image_file(color=(0, 0, 0, 0), mode='RGBA'))
+        self.assertEqual(metadata['logo_color'], '#ffffff')
+
+    def test_leaves_the_file_rewound(self):
+        file = image_file()
+        image_metadata(file)
+        self.assertEqual(file.tell(), 0)
+
+
+class LogoUploadTests(CacheClearMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        storage = override_settings(MEDIA_ROOT=media_root, MEDIA_URL='/media/', STORAGES={
+            'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+            'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+        })
+        storage.enable()
+        self.addCleanup(storage.disable)
+
+    def upload(self, **kwargs):
+        return SimpleUploadedFile('logo.png', image_file(**kwargs).read(), content_type='image/png')
+
+    def test_measured_on_upload_and_cleared_with_the_logo(self):
+        college = make_college(logo=self.upload())
+        self.assertEqual((college.logo_width, college.logo_height, college.logo_color), (40, 20, '#c81e1e'))
+
+        college.name = 'Renamed'
+        college.save()   # same file: not measured again
+        self.assertEqual(College.objects.get(pk=college.pk).logo_width, 40)
+
+        college.logo = None
+        college.save()
+        self.assertIsNone(College.objects.get(pk=college.pk).logo_width)
+
+    def test_unreadable_logo_does_not_block_the_save(self):
+        college = make_college(logo=SimpleUploadedFile('logo.png', b'not an image', content_type='image/png'))
+        self.assertIsNone(College.objects.get(pk=college.pk).logo_color)
+
+    def test_backfill_measures_unmeasured_logos(self):
+        college = make_college(logo=self.upload(size=(30, 30)))
+        College.objects.filter(pk=college.pk).update(logo_width=None, logo_height=None, logo_color=None)
+
+        out = StringIO()
+        call_command('backfill_logos', workers=1, stdout=out)
+        self.assertIn('1 row(s) updated', out.getvalue())
+        college.refresh_from_db()
+        self.assertEqual((college.logo_width, college.logo_height), (30, 30))
+
+        out = StringIO()
+        call_command('backfill_logos', workers=1, stdout=out)
+        self.assertIn('All logos already have metadata', out.getvalue())
@@ -0,0 +1,131 @@
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from api import jobs
+from api.models import Job, User
+
+from .utils import client_for, make_user
+
+
+def echo(job, value, times=1):
+    return [value] * times
+
+
+def fail(job):
+    raise RuntimeError('boom')
+
+
+def setUpModule():
+    patch = mock.patch.dict(jobs.TASKS, {'test_echo': echo, 'test_fail': fail})
+    patch.start()
+    unittest.addModuleCleanup(patch.stop)
+
+
+class EnqueueTests(TestCase):
+    def test_kwargs_are_checked_against_the_task(self):
+        job = jobs.enqueue('test_echo', value='x', times=2)
+        self.assertEqual(job.kwargs, {'value': 'x', 'times': 2})
+
+        with self.assertRaises(TypeError):
+            jobs.enqueue('test_echo', times=2)              # missing value
+        with self.assertRaises(TypeError):
+            jobs.enqueue('test_echo', value='x', colour=1)  # unknown kwarg
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_api_rejects_bad_kwargs(self):
+        client = client_for(make_user('root', role=User.SUPERADMIN))
+
+        response = client.post('/api/jobs/', {'name': 'test_echo', 'kwargs': {'colour': 1}}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('kwargs', response.data)
+
+        response = client.post('/api/jobs/', {'name': 'test_echo', 'kwargs': {'value': 1}}, format='json')
+        self.assertEqual(response.status_code, 202)
+
+
+class ClaimAndRunTests(TestCase):
+    def test_claim_marks_running_once(self):
+        job = jobs.enqueue('test_echo', value='x')
+
+        claimed = jobs.claim('w1')
+        self.assertEqual(claimed.pk, job.pk)
+        self.assertEqual(claimed.status, Job.STATUS_RUNNING)
+        self.assertEqual(claimed.attempts, 1)
+        self.assertIsNotNone(claimed.heartbeat_at)
+        self.assertIsNone(jobs.claim('w2'))
+
+    def test_future_jobs_are_not_claimed(self):
+        jobs.enqueue('test_echo', value='x', run_at=timezone.now() + timedelta(minutes=5))
+        self.assertIsNone(jobs.claim('w1'))
+
+    def test_success_stores_the_result(self):
+        jobs.enqueue('test_echo', value='x', times=2)
+        job = jobs.run(jobs.claim('w1'))
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.STATUS_DONE)
+        self.assertEqual(job.result, ['x', 'x'])
+        self.assertEqual(job.progress, 100)
+
+    @override_settings(JOB_BACKOFF_SECONDS=10, JOB_BACKOFF_MAX_SECONDS=60)
+    def test_failures_back_off_then_give_up(self):
+        jobs.enqueue('test_fail', max_attempts=2)
+
+        before = timezone.now()
+        job = jobs.run(jobs.claim('w1'))
+        self.assertEqual(job.status, Job.STATUS_QUEUED)
+        self.assertGreaterEqual(job.run_at, before + timedelta(seconds=7.5))
+        self.assertIn('boom', job.error)
+
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        job = jobs.run(jobs.claim('w1'))
+        self.assertEqual(job.status, Job.STATUS_FAILED)
+        self.assertIsNotNone(job.finished_at)
+
+    @override_settings(JOB_BACKOFF_SECONDS=10, JOB_BACKOFF_MAX_SECONDS=60)
+    def test_backoff_doubles_and_is_capped(self):
+        with mock.patch('api.jobs.random.uniform', return_value=1):
+            self.assertEqual([jobs.backoff(n) for n in (1, 2, 3, 4, 5)], [10, 20, 40, 60, 60])
+
+    def test_progress_refreshes_the_heartbeat(self):
+        jobs.enqueue('test_echo', value='x')
+        job = jobs.claim('w1')
+        Job.objects.filter(pk=job.pk).update(heartbeat_at=timezone.now() - timedelta(hours=1))
+
+        job.set_progress(50, 'Halfway')
+        job.refresh_from_db()
+        self.assertEqual(job.progress, 50)
+        self.assertGreater(job.heartbeat_at, timezone.now() - timedelta(minutes=1))
+
+
+@override_settings(JOB_STALE_SECONDS=300)
+class RequeueStaleTests(TestCase):
+    def running(self, started, heartbeat, attempts=1, max_attempts=3):
+        return Job.objects.create(
+            name='test_echo', kwargs={'value': 'x'}, status=Job.STATUS_RUNNING, locked_by='w1',
+            attempts=attempts, max_attempts=max_attempts, started_at=started, heartbeat_at=heartbeat,
+        )
+
+    def test_long_job_with_a_recent_heartbeat_is_left_alone(self):
+        now = timezone.now()
+        alive = self.running(now - timedelta(hours=3), now - timedelta(seconds=30))
+
+        self.assertEqual(jobs.requeue_stale(), 0)
+        alive.refresh_from_db()
+        self.assertEqual(alive.status, Job.STATUS_RUNNING)
+
+    def test_silent_jobs_are_requeued_or_failed(self):
+        now = timezone.now()
+        dead = self.running(now - timedelta(minutes=20), now - timedelta(minutes=10))
+        last_try = self.running(now - timedelta(minutes=20), now - timedelta(minutes=10), attempts=3)
+        legacy = self.running(now - timedelta(minutes=20), None)   # claimed before heartbeats existed
+
+        self.assertEqual(jobs.requeue_stale(), 2)
+        for job in (dead, last_try, legacy):
+            job.refresh_from_db()
+        self.assertEqual(dead.status, Job.STATUS_QUEUED)
+        self.assertEqual(legacy.status, Job.STATUS_QUEUED)
+        self.assertEqual(last_try.status, Job.STATUS_FAILED)
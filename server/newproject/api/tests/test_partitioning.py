@@ -0,0 +1,57 @@
+from unittest import skipUnless
+
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase
+
+from api import partitioning
+from api.models import Partnerships
+
+from .utils import day, make_college, make_department, make_partnership
+
+
+@skipUnless(connection.vendor == 'postgresql', 'partitioning is PostgreSQL-only')
+class PartitioningTests(TestCase):
+    def setUp(self):
+        self.department = make_department(make_college())
+        self.old = make_partnership(self.department, title='Old', date_started=day(2019, 6))
+        self.undated = make_partnership(self.department, title='Undated')
+
+        with connection.cursor() as cursor:
+            if not partitioning.is_partitioned(cursor):
+                partitioning.rebuild(cursor, partitioned=True, ahead=0)
+
+    def test_rows_land_in_their_year(self):
+        with connection.cursor() as cursor:
+            counts = partitioning.row_counts(cursor)
+        self.assertEqual(counts[partitioning.partition_name(2019)], 1)
+        self.assertEqual(counts[partitioning.DEFAULT_PARTITION], 1)
+        self.assertEqual(Partnerships.objects.filter(date_started__year=2019).get(), self.old)
+
+    def test_ids_continue_and_stay_unique(self):
+        new = make_partnership(self.department, title='New', date_started=day(2019, 7))
+        self.assertGreater(new.pk, self.undated.pk)
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Partnerships.objects.bulk_create([Partnerships(
+                pk=self.old.pk, department=self.department, college_id=self.department.college_id,
+                title='Copy', description='Copy', date_started=day(2019, 8),
+            )])
+
+    def test_new_partition_takes_rows_from_default_and_gets_a_unique_id(self):
+        moved = make_partnership(self.department, title='Far future', date_started=day(2040, 1))
+        with connection.cursor() as cursor:
+            self.assertEqual(partitioning.create_partitions(cursor, [2040]), [partitioning.partition_name(2040)])
+            counts = partitioning.row_counts(cursor)
+            cursor.execute("SELECT indexdef FROM pg_indexes WHERE tablename = %s", [partitioning.partition_name(2040)])
+            definitions = [definition for definition, in cursor.fetchall()]
+
+        self.assertEqual(counts[partitioning.partition_name(2040)], 1)
+        self.assertTrue(any('UNIQUE' in definition and '(id)' in definition for definition in definitions))
+        self.assertEqual(Partnerships.objects.get(pk=moved.pk).title, 'Far future')
+
+    def test_unpartition_restores_the_primary_key(self):
+        with connection.cursor() as cursor:
+            partitioning.rebuild(cursor, partitioned=False)
+            self.assertFalse(partitioning.is_partitioned(cursor))
+        self.assertEqual(Partnerships.objects.count(), 2)
+        self.assertGreater(make_partnership(self.department, title='After').pk, self.undated.pk)
@@ -0,0 +1,56 @@
+import json
+import os
+import subprocess
+import sys
+from unittest import mock
+
+from django.db import connections
+from django.test import SimpleTestCase, TestCase
+
+from api.models import User
+
+from .utils import client_for, make_user
+
+
+class PoolModeSettingsTests(SimpleTestCase):
+    def default_database(self, **env):
+        environment = {k: v for k, v in os.environ.items() if not k.startswith(('DATABASE_', 'REDIS_URL'))}
+        environment.update(env, DJANGO_SETTINGS_MODULE='newproject.settings', DATABASE_URL='postgres://u@h/db')
+        result = subprocess.run(
+            [sys.executable, '-c', 'import json, django; django.setup(); from django.conf import settings; '
+                                   'print(json.dumps(settings.DATABASES["default"], default=str))'],
+            capture_output=True, text=True, env=environment,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+    def test_persistent_by_default(self):
+        config = self.default_database()
+        self.assertEqual((config['CONN_MAX_AGE'], config['CONN_HEALTH_CHECKS']), (600, True))
+        self.assertNotIn('pool', config['OPTIONS'])
+
+    def test_pool(self):
+        config = self.default_database(DATABASE_POOL_MODE='pool', DATABASE_POOL_MAX_SIZE='4')
+        self.assertEqual(config['CONN_MAX_AGE'], 0)
+        self.assertEqual(config['OPTIONS']['pool'], {'min_size': 2, 'max_size': 4, 'timeout': 10.0, 'max_idle': 300.0})
+
+    def test_pgbouncer(self):
+        config = self.default_database(DATABASE_POOL_MODE='pgbouncer')
+        self.assertEqual(config['CONN_MAX_AGE'], 0)
+        self.assertTrue(config['DISABLE_SERVER_SIDE_CURSORS'])
+
+
+class PoolStatsViewTests(TestCase):
+    def test_superadmin_only(self):
+        self.assertEqual(client_for(make_user('guest')).get('/api/db/pool/').status_code, 403)
+
+    def test_reports_each_pool_with_the_average_wait(self):
+        pool = mock.Mock()
+        pool.get_stats.return_value = {'pool_size': 4, 'requests_queued': 4, 'requests_wait_ms': 10}
+        root = make_user('root', role=User.SUPERADMIN)
+
+        with mock.patch.object(connections['default'], 'pool', pool, create=True):
+            response = client_for(root).get('/api/db/pool/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['pools']['default']['avg_wait_ms'], 2.5)
+        self.assertEqual(response.data['pid'], os.getpid())
@@ -0,0 +1,62 @@
+import datetime
+
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework import serializers
+
+from api.models import College, Department, Partnerships
+from api.projections import Projection
+from api.serializers import CollegeSerializer, DepartmentSerializer, PartnershipsSerializer
+
+from .utils import CacheClearMixin, client_for, day, make_college, make_department, make_partnership
+
+
+@override_settings(STORAGES={
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}, MEDIA_URL='/media/')
+class ProjectionTests(CacheClearMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        college = make_college('CCS')
+        self.department = make_department(college, 'IT')
+        make_partnership(
+            self.department, title='Full', date_started=day(2024, 2, 29), date_ended=day(2026),
+            contact_email='info@example.com',
+        )
+        make_partnership(self.department, title='Bare')
+        Partnerships.objects.filter(title='Full').update(
+            logo='partnership_logos/0123456789abcdef0123456789abcdef.png',
+            created_at=datetime.datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc),
+        )
+        College.objects.update(logo='college_logos/ccs.png')
+        self.request = RequestFactory().get('/api/viewing/partnerships/', HTTP_HOST='testserver')
+
+    def assertSameAsSerializer(self, serializer_class, queryset):
+        expected = serializer_class(queryset, many=True, context={'request': self.request}).data
+        projected = Projection.for_serializer(serializer_class).rows(queryset, self.request)
+        self.assertEqual(projected, [dict(row) for row in expected])
+        self.assertEqual([list(row) for row in projected], [list(row) for row in expected])   # key order too
+
+    def test_rows_match_the_serializers(self):
+        self.assertSameAsSerializer(PartnershipsSerializer, Partnerships.objects.order_by('pk'))
+        self.assertSameAsSerializer(DepartmentSerializer, Department.objects.all())
+        self.assertSameAsSerializer(CollegeSerializer, College.objects.all())
+
+    def test_viewing_endpoint_matches_the_serializer(self):
+        response = client_for().get('/api/viewing/partnerships/', {'department': self.department.pk})
+        expected = PartnershipsSerializer(
+            Partnerships.objects.filter(department=self.department), many=True,
+            context={'request': response.wsgi_request},
+        ).data
+        self.assertEqual(response.json(), [dict(row) for row in expected])
+
+    def test_unsupported_fields_are_refused(self):
+        class Nested(serializers.ModelSerializer):
+            college_code = serializers.CharField(source='college.code')
+
+            class Meta:
+                model = Department
+                fields = ['id', 'college_code']
+
+        with self.assertRaises(TypeError):
+            Projection.for_serializer(Nested)
@@ -0,0 +1,60 @@
+from django.test import TestCase
+
+from api import rankings
+from api.models import Partnerships, User
+
+from .utils import CacheClearMixin, client_for, day, make_college, make_department, make_partnership, make_user
+
+
+class PeriodTests(TestCase):
+    def test_bounds(self):
+        self.assertEqual(rankings.period_bounds('year', day(2025, 6, 15)), (day(2025), day(2026), day(2024)))
+        self.assertEqual(rankings.period_bounds('quarter', day(2025, 2, 10)), (day(2025), day(2025, 4), day(2024, 10)))
+        self.assertEqual(rankings.period_bounds('month', day(2025, 1, 31)), (day(2025), day(2025, 2), day(2024, 12)))
+
+
+class RankingsTests(CacheClearMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.ccs = make_college('CCS')
+        self.coe = make_college('COE')
+        self.it = make_department(self.ccs, 'IT')
+        self.cs = make_department(self.ccs, 'CS')
+        self.ce = make_department(self.coe, 'CE')
+
+        for i in range(3):
+            make_partnership(self.it, title=f'IT {i}', date_started=day(2025, 3))
+        make_partnership(self.cs, title='CS 2024', date_started=day(2024, 3))
+        make_partnership(self.ce, title='CE old', date_started=day(2024, 5), status=Partnerships.STATUS_INACTIVE)
+
+    def get(self, user=None, **params):
+        response = client_for(user).get('/api/partnerships/rankings/', {'date': '2025-06-01', **params})
+        self.assertEqual(response.status_code, 200, response.data)
+        return {row['code']: row for row in response.data['results']}
+
+    def test_ranks_deltas_and_percentiles(self):
+        rows = self.get(level='department')
+        self.assertEqual([rows[code]['rank'] for code in ('IT', 'CS', 'CE')], [1, 2, 3])
+        self.assertEqual((rows['IT']['started'], rows['IT']['delta']), (3, 3))
+        self.assertEqual((rows['CS']['previous'], rows['CS']['delta']), (1, -1))
+        self.assertEqual(rows['IT']['percentile'], 100.0)
+
+        colleges = self.get(level='college')
+        self.assertEqual((colleges['CCS']['active'], colleges['COE']['active']), (4, 0))
+
+    def test_department_admin_sees_only_their_own_rows(self):
+        admin = make_user('it-admin', role=User.DEPARTMENT_ADMIN, department=self.it)   # user.college unset
+
+        self.assertEqual(list(self.get(admin, level='department')), ['IT'])
+        colleges = self.get(admin, level='college')
+        self.assertEqual(list(colleges), ['CCS'])
+        self.assertEqual(colleges['CCS']['rank'], 1)
+
+    def test_college_admin_is_ranked_within_their_college(self):
+        admin = make_user('ccs-admin', role=User.COLLEGE_ADMIN, college=self.ccs)
+        self.assertEqual(sorted(self.get(admin, level='department')), ['CS', 'IT'])
+        self.assertEqual(list(self.get(admin, level='college')), ['CCS'])
+
+    def test_bad_parameters(self):
+        response = client_for().get('/api/partnerships/rankings/', {'level': 'planet'})
+        self.assertEqual(response.status_code, 400)
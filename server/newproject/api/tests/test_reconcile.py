@@ -0,0 +1,52 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from api.models import Partnerships, StatusReconciliation
+from api.reconcile import expiring_partnerships, reconcile
+
+from .utils import CacheClearMixin, day, make_college, make_department, make_partnership
+
+
+class ReconcileTests(CacheClearMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.department = make_department(make_college())
+        self.expired = [
+            make_partnership(self.department, title=f'Expired {i}', date_ended=day(2025, 5, 31)) for i in range(3)
+        ]
+        self.ending = make_partnership(self.department, title='Ending', date_ended=day(2025, 6, 20))
+        self.later = make_partnership(self.department, title='Later', date_ended=day(2025, 9))
+        self.ongoing = make_partnership(self.department, title='Ongoing')
+
+    def test_expired_rows_are_deactivated_in_batches(self):
+        record, expiring = reconcile(day(2025, 6), batch_size=2, expiring_days=30)
+
+        self.assertEqual(sorted(record.deactivated_ids), sorted(p.pk for p in self.expired))
+        self.assertEqual(record.deactivated_count, 3)
+        self.assertEqual([p.pk for p in expiring], [self.ending.pk])
+        self.assertEqual(
+            set(Partnerships.objects.filter(status=Partnerships.STATUS_ACTIVE).values_list('title', flat=True)),
+            {'Ending', 'Later', 'Ongoing'},
+        )
+
+        # Counters adjusted by hand (QuerySet.update() skips the signals)
+        self.department.refresh_from_db()
+        self.assertEqual((self.department.partnership_count, self.department.active_partnership_count), (6, 3))
+
+    def test_second_run_has_nothing_to_do(self):
+        reconcile(day(2025, 6))
+        record, _ = reconcile(day(2025, 6))
+        self.assertEqual(record.deactivated_count, 0)
+        self.assertEqual(StatusReconciliation.objects.count(), 2)
+
+    def test_ending_today_is_still_expiring_not_expired(self):
+        expiring = expiring_partnerships(day(2025, 6, 20), 0)
+        self.assertEqual(list(expiring), [self.ending])
+
+    def test_command_prints_the_digest(self):
+        out = StringIO()
+        call_command('reconcile_status', stdout=out)   # today: every dated row above has ended
+        self.assertIn('5 expired partnership(s) set to inactive', out.getvalue())
+        self.assertIn('Ending within 30 days: 0', out.getvalue())
@@ -0,0 +1,60 @@
+import datetime
+import decimal
+import json
+import uuid
+from io import BytesIO
+from unittest import skipIf
+
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api.renderers import FastJSONParser, FastJSONRenderer, orjson
+
+
+@skipIf(orjson is None, 'orjson is not installed')
+class FastJSONRendererTests(SimpleTestCase):
+    def assertSameAsDRF(self, data, **context):
+        self.assertEqual(
+            FastJSONRenderer().render(data, 'application/json', context),
+            JSONRenderer().render(data, 'application/json', context),
+        )
+
+    def test_output_is_byte_identical(self):
+        self.assertSameAsDRF({
+            'when': datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+            'day': datetime.date(2025, 1, 2),
+            'amount': decimal.Decimal('12.50'),
+            'id': uuid.UUID(int=1),
+            'text': 'ñandú — “quoted”',
+            'nested': [1, 2.5, None, True, {'a': []}],
+            1: 'int key',
+        })
+
+    def test_line_separators_are_escaped(self):
+        self.assertSameAsDRF({'text': 'a\u2028b\u2029c'})
+        self.assertIn(b'\\u2028', FastJSONRenderer().render({'text': '\u2028'}))
+
+    def test_fallbacks(self):
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+        self.assertSameAsDRF({'big': 2 ** 70})   # wider than 64 bits
+        self.assertSameAsDRF({'a': 1}, indent=2)
+
+
+@skipIf(orjson is None, 'orjson is not installed')
+class FastJSONParserTests(SimpleTestCase):
+    def parse(self, body, parser=FastJSONParser, encoding='utf-8'):
+        return parser().parse(BytesIO(body), 'application/json', {'encoding': encoding})
+
+    def test_same_result_as_drf(self):
+        body = json.dumps({'title': 'ñandú', 'ids': [1, 2], 'ok': True}).encode()
+        self.assertEqual(self.parse(body), self.parse(body, JSONParser))
+
+    def test_other_encodings_use_the_stock_parser(self):
+        body = '{"title": "ñandú"}'.encode('latin-1')
+        self.assertEqual(self.parse(body, encoding='latin-1'), {'title': 'ñandú'})
+
+    def test_invalid_json(self):
+        with self.assertRaises(ParseError):
+            self.parse(b'{"title": ')
@@ -0,0 +1,138 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from api import db_router
+
+
+class FakeCursor:
+    def __init__(self, row):
+        self.row = row
+        self.sql = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.sql = sql
+
+    def fetchone(self):
+        return self.row
+
+
+class FakeConnection:
+    def __init__(self, vendor, row=(0,)):
+        self.vendor = vendor
+        self.cursor_ = FakeCursor(row)
+
+    def cursor(self):
+        return self.cursor_
+
+
+class ReplicaLagTests(SimpleTestCase):
+    def setUp(self):
+        db_router._lag_cache.update(checked_at=0.0, healthy=False)
+
+    def lag(self, connection):
+        with mock.patch.object(db_router, 'connections', {db_router.REPLICA_ALIAS: connection}):
+            return db_router.replica_lag_seconds()
+
+    def test_non_postgres_replica_counts_as_in_sync(self):
+        self.assertEqual(self.lag(FakeConnection('sqlite')), 0.0)
+
+    def test_postgres_lag_only_counts_unreplayed_wal(self):
+        connection = FakeConnection('postgresql', (2.5,))
+        self.assertEqual(self.lag(connection), 2.5)
+        # Idle primary: a replica that replayed everything it received is not lagging
+        self.assertIn('pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0', connection.cursor_.sql)
+        self.assertIsNone(self.lag(FakeConnection('postgresql', (None,))))
+
+    @override_settings(DATABASE_REPLICA_MAX_LAG=10)
+    def test_health_uses_max_lag_and_is_cached(self):
+        with mock.patch.object(db_router, 'replica_lag_seconds', return_value=3.0) as lag:
+            self.assertTrue(db_router.replica_is_healthy())
+            self.assertTrue(db_router.replica_is_healthy())
+            self.assertEqual(lag.call_count, 1)   # checked at most every LAG_CHECK_INTERVAL
+
+        db_router._lag_cache.update(checked_at=0.0)
+        with mock.patch.object(db_router, 'replica_lag_seconds', return_value=30.0):
+            self.assertFalse(db_router.replica_is_healthy())
+
+        db_router._lag_cache.update(checked_at=0.0)
+        with mock.patch.object(db_router, 'replica_lag_seconds', side_effect=OSError):
+            self.assertFalse(db_router.replica_is_healthy())
+
+
+class ReplicaRoutingMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        from django.http import HttpResponse
+        from django.test import RequestFactory
+
+        from api.middleware import ReplicaRoutingMiddleware
+
+        cache.clear()
+        self.factory = RequestFactory()
+        self.routed = []
+
+        def view(request):
+            self.routed.append(db_router._use_replica.get())
+            return HttpResponse(status=201 if request.method == 'POST' else 200)
+
+        self.middleware = ReplicaRoutingMiddleware(view)
+        patches = [
+            mock.patch('api.middleware.replica_configured', return_value=True),
+            mock.patch('api.middleware.replica_is_healthy', return_value=True),
+        ]
+        self.healthy = patches[1]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def get(self, path, **headers):
+        self.middleware(self.factory.get(path, **headers))
+        return self.routed[-1]
+
+    def test_only_listed_read_paths_use_the_replica(self):
+        self.assertTrue(self.get('/api/viewing/colleges/'))
+        self.assertTrue(self.get('/api/partnerships/growth/'))
+        self.assertFalse(self.get('/api/partnerships/'))
+        self.middleware(self.factory.post('/api/viewing/colleges/'))
+        self.assertFalse(self.routed[-1])
+        self.assertFalse(db_router._use_replica.get())   # reset after the request
+
+    def test_writer_is_pinned_to_the_primary(self):
+        auth = {'HTTP_AUTHORIZATION': 'Bearer abc'}
+        self.middleware(self.factory.post('/api/partnerships/', **auth))
+        self.assertFalse(self.get('/api/viewing/colleges/', **auth))
+        self.assertTrue(self.get('/api/viewing/colleges/', HTTP_AUTHORIZATION='Bearer other'))
+
+    def test_unhealthy_replica_falls_back_to_the_primary(self):
+        with mock.patch('api.middleware.replica_is_healthy', return_value=False):
+            self.assertFalse(self.get('/api/viewing/colleges/'))
+
+
+class ReplicaSettingsTests(SimpleTestCase):
+    def settings_databases(self, **env):
+        import os
+        import subprocess
+        import sys
+
+        environment = {k: v for k, v in os.environ.items() if k not in ('REDIS_URL', 'DATABASE_REPLICA_URL')}
+        environment.update(env, DJANGO_SETTINGS_MODULE='newproject.settings', DATABASE_URL='postgres://u@h/db')
+        return subprocess.run(
+            [sys.executable, '-c', 'import django; django.setup(); from django.conf import settings; print(sorted(settings.DATABASES))'],
+            capture_output=True, text=True, env=environment,
+        )
+
+    def test_replica_without_shared_cache_is_refused(self):
+        result = self.settings_databases(DATABASE_REPLICA_URL='postgres://u@replica/db')
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn('needs REDIS_URL', result.stderr)
+
+        result = self.settings_databases(DATABASE_REPLICA_URL='postgres://u@replica/db', REDIS_URL='redis://localhost:6379/0')
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("'replica'", result.stdout)
@@ -0,0 +1,107 @@
+import itertools
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import mock
+
+from django.core.files.storage import FileSystemStorage
+from django.test import TestCase, override_settings
+
+from api import jobs, reports
+from api.models import CollegeReport, Job, User
+
+from .utils import CacheClearMixin, client_for, day, make_college, make_department, make_partnership, make_user
+
+
+class RenamingStorage(FileSystemStorage):
+    """Like Cloudinary: the stored name gets a prefix and a unique suffix."""
+    counter = itertools.count()
+
+    def _save(self, name, content):
+        return super()._save(f'media/{name}_{next(self.counter)}', content)
+
+
+MEDIA = tempfile.mkdtemp()
+
+
+@override_settings(STORAGES={
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage', 'OPTIONS': {'location': MEDIA}},
+    'reports': {'BACKEND': 'api.tests.test_reports.RenamingStorage', 'OPTIONS': {'location': MEDIA}},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+})
+class ReportTests(CacheClearMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.college = make_college('CCS', name='Computing & Science')
+        department = make_department(self.college, 'IT')
+        make_partnership(department, title='R&D <lab>', date_started=day(2024, 3, 5), contact_email='a@x.com')
+        make_partnership(department, title='Inactive one', status='inactive')
+        self.admin = make_user('root', User.SUPERADMIN)
+        self.url = f'/api/colleges/{self.college.pk}/report/xlsx/'
+
+    def test_stored_name_is_the_one_the_storage_returned(self):
+        saved = reports.generate(self.college.pk, 'xlsx')
+        self.assertTrue(saved.startswith('media/reports/'))
+        self.assertTrue(reports.storage().exists(saved))
+        self.assertEqual(CollegeReport.objects.get(college=self.college, kind='xlsx').name, saved)
+        # Same data → same file, nothing rendered again
+        self.assertEqual(reports.generate(self.college.pk, 'xlsx'), saved)
+
+    def test_new_data_replaces_the_previous_file(self):
+        first = reports.generate(self.college.pk, 'pdf')
+        make_partnership(self.college.departments.get(), title='Another')
+        second = reports.generate(self.college.pk, 'pdf')
+        self.assertNotEqual(first, second)
+        self.assertFalse(reports.storage().exists(first))
+        self.assertTrue(reports.storage().exists(second))
+        self.assertEqual(CollegeReport.objects.filter(college=self.college).count(), 1)
+
+    def test_concurrent_job_keeps_the_recorded_file(self):
+        first = reports.generate(self.college.pk, 'xlsx')
+        # A second job checked before the first recorded its file, then rendered the same data
+        with mock.patch.object(reports, 'current', return_value=None), \
+                mock.patch.object(reports.storage(), 'delete', wraps=reports.storage().delete) as delete:
+            self.assertEqual(reports.generate(self.college.pk, 'xlsx'), first)
+        self.assertTrue(reports.storage().exists(first))
+        (discarded,), _ = delete.call_args
+        self.assertNotEqual(discarded, first)
+        self.assertFalse(reports.storage().exists(discarded))
+
+    def test_download_flow(self):
+        client = client_for(self.admin)
+        response = client.get(self.url)
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(Job.objects.filter(name='college_report').count(), 1)
+        client.get(self.url)   # same data: no second job
+        self.assertEqual(Job.objects.filter(name='college_report').count(), 1)
+
+        job = jobs.run(jobs.claim('test'))
+        self.assertEqual(job.status, Job.STATUS_DONE, job.error)
+
+        response = client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        body = b''.join(response.streaming_content)
+        self.assertTrue(body.startswith(b'PK'))   # xlsx is a zip
+        etag = response['ETag']
+        self.assertEqual(client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_other_colleges_admin_is_refused(self):
+        other = make_user('ca', User.COLLEGE_ADMIN, college=make_college('COE'))
+        self.assertIn(client_for(other).get(self.url).status_code, (403, 404))
+        guest = make_user('guest', User.GUEST)
+        self.assertEqual(client_for(guest).get(self.url).status_code, 403)
+
+
+class LazyImportTests(TestCase):
+    def test_report_libraries_not_loaded_with_the_urlconf(self):
+        code = (
+            "import django, sys; django.setup(); import newproject.urls; "
+            "print(','.join(m for m in ('openpyxl', 'reportlab') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, env=os.environ.copy(),
+            cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip().splitlines()[-1] if result.stdout.strip() else '', '')
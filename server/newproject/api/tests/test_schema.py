@@ -0,0 +1,49 @@
+import json
+import os
+import tempfile
+from unittest import mock
+
+from django.http import JsonResponse
+from django.test import SimpleTestCase, override_settings
+
+from api import schema
+
+
+class SchemaViewTests(SimpleTestCase):
+    def setUp(self):
+        self.static_root = tempfile.mkdtemp()
+        settings = override_settings(DEBUG=False, STATIC_ROOT=self.static_root, STATIC_URL='/static/')
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        for patch in (
+            mock.patch.object(schema, '_schema_url', None),
+            mock.patch.object(schema, '_dynamic_schema_view', lambda request: JsonResponse({'openapi': 'live'})),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def build(self, filename):
+        os.makedirs(schema.schema_root(), exist_ok=True)
+        with open(os.path.join(schema.schema_root(), schema.MANIFEST_NAME), 'w') as manifest:
+            json.dump({'current': filename}, manifest)
+
+    def test_built_schema_is_a_redirect(self):
+        self.build('openapi-1.0-abc.json')
+        schema.load_schema_url()   # ApiConfig.ready()
+        response = self.client.get('/api/schema/')
+        self.assertRedirects(response, '/static/schema/openapi-1.0-abc.json', fetch_redirect_response=False)
+
+    def test_generated_until_a_restart_when_built_late(self):
+        schema.load_schema_url()
+        self.assertEqual(self.client.get('/api/schema/').json(), {'openapi': 'live'})
+
+        # WhiteNoise indexed STATIC_ROOT at start-up: this file isn't served yet
+        self.build('openapi-1.0-abc.json')
+        self.assertEqual(self.client.get('/api/schema/').json(), {'openapi': 'live'})
+
+    def test_debug_always_generates(self):
+        self.build('openapi-1.0-abc.json')
+        schema.load_schema_url()
+        with override_settings(DEBUG=True):
+            self.assertEqual(self.client.get('/api/schema/').json(), {'openapi': 'live'})
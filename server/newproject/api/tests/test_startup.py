@@ -0,0 +1,53 @@
+import json
+import os
+import subprocess
+import sys
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+
+from api import lazy
+
+
+class LazyViewTests(SimpleTestCase):
+    def test_imported_once_on_first_request(self):
+        view_class = mock.Mock()
+        view_class.as_view.return_value = lambda request: HttpResponse('docs')
+
+        with mock.patch.object(lazy, 'import_string', return_value=view_class) as import_string:
+            view = lazy.lazy_view('some.heavy.View', url_name='schema')
+            import_string.assert_not_called()
+
+            for _ in range(2):
+                self.assertEqual(view(RequestFactory().get('/api/docs/')).content, b'docs')
+        import_string.assert_called_once_with('some.heavy.View')
+        view_class.as_view.assert_called_once_with(url_name='schema')
+
+    def test_docs_page(self):
+        self.assertEqual(self.client.get('/api/docs/').status_code, 200)
+
+
+class WorkerBootTests(SimpleTestCase):
+    def test_heavy_packages_wait_for_first_use(self):
+        environment = {k: v for k, v in os.environ.items() if k not in ('REDIS_URL', 'DATABASE_REPLICA_URL')}
+        environment.update(DJANGO_SETTINGS_MODULE='newproject.settings', DATABASE_URL='postgres://u@h/db')
+        result = subprocess.run(
+            [sys.executable, '-c', 'import sys, newproject.wsgi; print(sorted(m for m in '
+                                   '("cloudinary", "drf_spectacular.views", "drf_spectacular.generators") '
+                                   'if m in sys.modules))'],
+            capture_output=True, text=True, env=environment,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], '[]')
+
+    def test_startup_profile_json(self):
+        out = StringIO()
+        call_command('startup_profile', target='json', json=True, limit=3, stdout=out)
+        report = json.loads(out.getvalue())
+        self.assertEqual(report['target'], 'json')
+        self.assertGreater(report['modules'], 0)
+        self.assertEqual((len(report['packages']), len(report['slowest'])), (3, 3))
+        self.assertGreaterEqual(report['slowest'][0]['cumulative_ms'], report['slowest'][-1]['cumulative_ms'])
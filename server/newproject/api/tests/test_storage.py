@@ -0,0 +1,91 @@
+import itertools
+import os
+import tempfile
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.test import TestCase
+
+from api.models import College, StoredFile
+from api.storage import ContentAddressedStorage, content_digest
+
+from .utils import make_college, make_department
+
+
+class CloudinaryLikeStorage(FileSystemStorage):
+    """Stores under "media/<name>_<random>", as MediaCloudinaryStorage does."""
+    counter = itertools.count()
+
+    def _save(self, name, content):
+        stem, ext = os.path.splitext(name)
+        return super()._save(f'media/{stem}_{next(self.counter)}{ext}', content)
+
+
+class ContentAddressedStorageTests(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.storage = ContentAddressedStorage(
+            backend='api.tests.test_storage.CloudinaryLikeStorage',
+            backend_options={'location': self.root},
+        )
+
+    def files(self):
+        return sorted(
+            os.path.relpath(os.path.join(folder, name), self.root)
+            for folder, _, names in os.walk(self.root) for name in names
+        )
+
+    def test_same_bytes_are_stored_once(self):
+        first = self.storage.save('partnership_logos/logo.png', ContentFile(b'same bytes'))
+        second = self.storage.save('partnership_logos/other-name.PNG', ContentFile(b'same bytes'))
+
+        digest = content_digest(ContentFile(b'same bytes'))
+        self.assertEqual(first, second)
+        self.assertTrue(first.startswith(f'media/partnership_logos/{digest}_'))
+        self.assertEqual(len(self.files()), 1)
+        self.assertEqual(StoredFile.objects.get(key=f'partnership_logos/{digest}').name, first)
+
+    def test_lookup_is_one_indexed_query(self):
+        self.storage.save('partnership_logos/logo.png', ContentFile(b'bytes'))
+        with self.assertNumQueries(1):
+            self.storage.save('partnership_logos/again.png', ContentFile(b'bytes'))
+
+    def test_directories_and_contents_are_kept_apart(self):
+        a = self.storage.save('college_logos/logo.png', ContentFile(b'one'))
+        b = self.storage.save('department_logos/logo.png', ContentFile(b'one'))
+        c = self.storage.save('college_logos/logo.png', ContentFile(b'two'))
+        self.assertEqual(len({a, b, c}), 3)
+
+    def test_deleted_content_is_uploaded_again(self):
+        name = self.storage.save('college_logos/logo.png', ContentFile(b'bytes'))
+        self.storage.delete(name)
+        self.assertFalse(StoredFile.objects.exists())
+
+        again = self.storage.save('college_logos/logo.png', ContentFile(b'bytes'))
+        self.assertNotEqual(again, name)
+        self.assertTrue(self.storage.exists(again))
+
+    def test_shared_content_is_kept_while_a_row_uses_it(self):
+        name = self.storage.save('college_logos/logo.png', ContentFile(b'shared'))
+        ccs = make_college('CCS', logo=name)
+        make_department(make_college('COE', logo=name), 'CE', logo=name)
+
+        College.objects.filter(pk=ccs.pk).update(logo='')
+        self.storage.delete(name)   # CCS dropped the logo; COE and CE still show it
+        self.assertTrue(self.storage.exists(name))
+        self.assertTrue(StoredFile.objects.filter(name=name).exists())
+
+        College.objects.all().delete()   # cascades to the department
+        self.storage.delete(name)
+        self.assertFalse(self.storage.exists(name))
+        self.assertFalse(StoredFile.objects.exists())
+
+    def test_concurrent_upload_keeps_the_recorded_name(self):
+        digest = content_digest(ContentFile(b'race'))
+        original = self.storage.save('college_logos/logo.png', ContentFile(b'race'))
+        # Simulate losing the race: the lookup missed, another worker recorded first
+        self.storage.find = lambda stem: None
+        name = self.storage.save('college_logos/logo.png', ContentFile(b'race'))
+        self.assertEqual(name, original)
+        self.assertEqual(self.files(), [original])
+        self.assertEqual(StoredFile.objects.get(key=f'college_logos/{digest}').name, original)
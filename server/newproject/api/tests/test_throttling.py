@@ -0,0 +1,112 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TransactionTestCase, override_settings
+
+from api.middleware import ThrottleMiddleware, brotli
+from api.throttling import WARMUP_HEADER, parse_rate, scope_for, take_token, throttled_counts, warmup_token
+
+from .utils import CacheClearMixin, make_college, make_department
+
+
+class TokenBucketTests(CacheClearMixin, SimpleTestCase):
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate('30/min'), (30, 60))
+        self.assertEqual(parse_rate('5/hour'), (5, 3600))
+        self.assertIsNone(parse_rate(None))
+
+    def test_scopes(self):
+        factory = RequestFactory()
+        self.assertEqual(scope_for(factory.post('/api/token/')), 'login')
+        self.assertEqual(scope_for(factory.get('/api/viewing/colleges/')), 'viewing')
+        self.assertEqual(scope_for(factory.patch('/api/partnerships/1/')), 'admin_write')
+        self.assertIsNone(scope_for(factory.get('/api/partnerships/')))
+
+    def test_bucket_empties_then_refills(self):
+        with mock.patch('api.throttling.time.time', return_value=1000.0):
+            self.assertEqual([take_token('k', 2, 60)[0] for _ in range(3)], [True, True, False])
+            self.assertAlmostEqual(take_token('k', 2, 60)[1], 30.0)
+
+        with mock.patch('api.throttling.time.time', return_value=1030.0):   # one token back
+            self.assertEqual([take_token('k', 2, 60)[0] for _ in range(2)], [True, False])
+
+
+@override_settings(REST_FRAMEWORK={
+    'DEFAULT_THROTTLE_RATES': {'viewing': '2/min', 'login': '1/min', 'admin_write': '1/min'}, 'NUM_PROXIES': 0,
+})
+class ThrottleMiddlewareTests(CacheClearMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.middleware = ThrottleMiddleware(lambda request: HttpResponse('ok'))
+        self.factory = RequestFactory()
+
+    def get(self, **headers):
+        return self.middleware(self.factory.get('/api/viewing/colleges/', headers=headers))
+
+    def test_rejects_with_retry_after_and_counts(self):
+        statuses = [self.get().status_code for _ in range(3)]
+        self.assertEqual(statuses, [200, 200, 429])
+        self.assertEqual(self.get()['Retry-After'], '30')
+        self.assertEqual(throttled_counts()['viewing'], 2)
+
+    def test_warmup_token_is_not_limited(self):
+        statuses = [self.get(**{WARMUP_HEADER: warmup_token()}).status_code for _ in range(5)]
+        self.assertEqual(statuses, [200] * 5)
+        self.assertEqual(self.get(**{WARMUP_HEADER: 'guess'}).status_code, 200)
+        self.assertEqual(self.get(**{WARMUP_HEADER: 'guess'}).status_code, 200)
+        self.assertEqual(self.get(**{WARMUP_HEADER: 'guess'}).status_code, 429)
+
+    def test_login_is_limited_per_client_ip(self):
+        def login(ip):
+            return self.middleware(self.factory.post('/api/token/', REMOTE_ADDR=ip)).status_code
+
+        self.assertEqual([login('10.0.0.1'), login('10.0.0.1'), login('10.0.0.2')], [200, 429, 200])
+        self.assertEqual(throttled_counts()['login'], 1)
+
+    def test_admin_writes_are_limited_per_token(self):
+        def patch(token):
+            request = self.factory.patch('/api/partnerships/1/', headers={'Authorization': f'Bearer {token}'})
+            return self.middleware(request).status_code
+
+        self.assertEqual([patch('a'), patch('a'), patch('b')], [200, 429, 200])
+
+
+class WarmCachesTests(CacheClearMixin, TransactionTestCase):
+    # The command requests from its own threads, which must see these rows
+    def setUp(self):
+        super().setUp()
+        college = make_college()
+        for code in ('IT', 'CS', 'IS'):
+            make_department(college, code=code)
+
+    def test_process_local_cache_only_warns(self):
+        out = StringIO()
+        call_command('warm_caches', workers=1, stdout=out)
+        self.assertIn('only the database is warmed', out.getvalue())
+        self.assertIn('Warmed 16 endpoints (32 requests)', out.getvalue())
+
+    @override_settings(REST_FRAMEWORK={'DEFAULT_THROTTLE_RATES': {'viewing': '2/min'}, 'NUM_PROXIES': 0})
+    def test_warms_every_endpoint_past_the_viewing_limit(self):
+        out = StringIO()
+        with mock.patch('api.management.commands.warm_caches.PROCESS_LOCAL_CACHES', ()):
+            call_command('warm_caches', workers=1, stdout=out)
+        self.assertNotIn('per process', out.getvalue())
+        self.assertIn('Warmed 16 endpoints (32 requests)', out.getvalue())
+
+    @override_settings(COMPRESSION_MIN_SIZE=0)
+    def test_fills_the_compressed_body_and_rankings_caches(self):
+        call_command('warm_caches', workers=1, stdout=StringIO())
+        keys = list(cache._cache)   # LocMemCache: this process's cache is the one warmed
+        encodings = {key.split(':compressed:')[1].split(':')[0] for key in keys if ':compressed:' in key}
+        self.assertEqual(encodings, {'br', 'gzip'} if brotli is not None else {'gzip'})
+        self.assertEqual(len([key for key in keys if ':rankings:' in key]), 9)
+
+    def test_non_2xx_fails_the_command(self):
+        out = StringIO()
+        with mock.patch('api.management.commands.warm_caches.PROCESS_LOCAL_CACHES', ()), \
+                mock.patch('api.views.ViewingCollegeViewSet.list', side_effect=RuntimeError('down')):
+            with self.assertRaisesMessage(CommandError, '2 of 32 requests'):
+                call_command('warm_caches', workers=1, stdout=out)
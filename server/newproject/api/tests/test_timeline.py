@@ -0,0 +1,52 @@
+from django.test import TestCase
+
+from api import timeline
+from api.models import Partnerships
+
+from .utils import client_for, day, make_college, make_department, make_partnership
+
+
+class TimelineTests(TestCase):
+    def setUp(self):
+        department = make_department(make_college())
+        make_partnership(department, title='2023', date_started=day(2023, 1, 15), date_ended=day(2023, 3, 31))
+        make_partnership(department, title='Ongoing', date_started=day(2023, 3, 1))
+        make_partnership(department, title='Ends on the day', date_started=day(2022), date_ended=day(2023, 2, 1))
+        make_partnership(department, title='Undated')   # never counted
+        # Bad data, never counted either (active_range is NULL for it on PostgreSQL)
+        make_partnership(department, title='Ends before it starts', date_started=day(2023, 4, 10), date_ended=day(2023, 4, 1))
+        self.client = client_for()
+
+    def titles(self, queryset):
+        return sorted(queryset.values_list('title', flat=True))
+
+    def test_active_on_includes_both_ends(self):
+        everything = Partnerships.objects.all()
+        self.assertEqual(self.titles(timeline.active_on(everything, day(2023, 2, 1))), ['2023', 'Ends on the day'])
+        self.assertEqual(self.titles(timeline.active_on(everything, day(2023, 2, 2))), ['2023'])
+        self.assertEqual(self.titles(timeline.active_on(everything, day(2030))), ['Ongoing'])
+
+    def test_overlapping_span(self):
+        spans = timeline.overlapping(Partnerships.objects.all(), day(2023, 3, 31), day(2023, 4, 30))
+        self.assertEqual(self.titles(spans), ['2023', 'Ongoing'])
+
+    def test_monthly_series(self):
+        series = timeline.monthly_series(Partnerships.objects.all(), day(2022, 12, 10), day(2023, 4, 2))
+        self.assertEqual(series, [
+            {'month': '2022-12', 'active': 1},
+            {'month': '2023-01', 'active': 2},
+            {'month': '2023-02', 'active': 2},
+            {'month': '2023-03', 'active': 2},
+            {'month': '2023-04', 'active': 1},
+        ])
+
+    def test_endpoints(self):
+        response = self.client.get('/api/partnerships/as-of/', {'date': '2023-02-01'})
+        self.assertEqual(response.data, {'date': '2023-02-01', 'active': 2})
+
+        response = self.client.get('/api/partnerships/', {'active_from': '2023-04-01', 'active_to': '2023-04-30'})
+        self.assertEqual([row['title'] for row in response.data], ['Ongoing'])
+
+        response = self.client.get('/api/partnerships/timeline/', {'from': '2023-05-01', 'to': '2023-01-01'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.client.get('/api/partnerships/as-of/', {'date': 'soon'}).status_code, 400)
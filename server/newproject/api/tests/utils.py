@@ -0,0 +1,44 @@
+import datetime
+
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from api.models import College, Department, Partnerships, User
+
+
+def make_college(code='CCS', **kwargs):
+    kwargs.setdefault('name', f'College {code}')
+    return College.objects.create(code=code, **kwargs)
+
+
+def make_department(college, code='IT', **kwargs):
+    kwargs.setdefault('name', f'Department {code}')
+    return Department.objects.create(college=college, code=code, **kwargs)
+
+
+def make_partnership(department, title='DOST Region XI', **kwargs):
+    kwargs.setdefault('description', 'Memorandum of agreement.')
+    return Partnerships.objects.create(department=department, title=title, **kwargs)
+
+
+def make_user(username, role=User.GUEST, **kwargs):
+    return User.objects.create_user(username=username, password='pass-12345', role=role, **kwargs)
+
+
+def client_for(user=None):
+    client = APIClient()
+    if user is not None:
+        client.force_authenticate(user)
+    return client
+
+
+def day(year, month=1, dom=1):
+    return datetime.date(year, month, dom)
+
+
+class CacheClearMixin:
+    """Throttle buckets, rankings, flags... live in the cache: start every test empty."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
@@ -0,0 +1,87 @@
+import time
+
+from django.core.cache import cache
+from django.utils.crypto import constant_time_compare, salted_hmac
+from rest_framework.throttling import BaseThrottle
+
+
+# (scope, methods, path, exact match?) — first match wins
+SCOPES = (
+    ('login', ('POST',), '/api/token/', True),
+    ('registration', ('POST',), '/api/register/guest/', True),
+    ('viewing', ('GET', 'HEAD'), '/api/viewing/', False),
+    ('admin_write', ('POST', 'PUT', 'PATCH', 'DELETE'), '/api/', False),
+)
+
+DURATIONS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate):
+    """'30/min' → (30, 60). Same format as DRF's DEFAULT_THROTTLE_RATES."""
+    if not rate:
+        return None
+    num, period = rate.split('/')
+    return int(num), DURATIONS[period[0]]
+
+
+def client_ip(request):
+    # DRF's logic, honouring REST_FRAMEWORK['NUM_PROXIES'] (X-Forwarded-For can be spoofed)
+    return BaseThrottle().get_ident(request)
+
+
+# `manage.py warm_caches` sends this header: its burst of requests all comes
+# from one IP and would otherwise run into the viewing limit
+WARMUP_HEADER = 'X-Warmup-Token'
+
+
+def warmup_token():
+    """Derived from SECRET_KEY, so only code running with the app's settings knows it."""
+    return salted_hmac('api.throttling.warmup', 'warm_caches').hexdigest()
+
+
+def is_warmup(request):
+    token = request.headers.get(WARMUP_HEADER)
+    return bool(token) and constant_time_compare(token, warmup_token())
+
+
+def scope_for(request):
+    for scope, methods, path, exact in SCOPES:
+        if request.method in methods and (request.path == path if exact else request.path.startswith(path)):
+            return scope
+    return None
+
+
+def take_token(key, capacity, per_seconds):
+    """
+    Token bucket stored in the cache: `capacity` tokens, refilled at
+    capacity/per_seconds per second. Returns (allowed, seconds until next token).
+
+    Read-modify-write without a lock: under a burst of truly simultaneous
+    requests a few extra may slip through, which is fine for abuse protection.
+    """
+    now = time.time()
+    tokens, last = cache.get(key) or (capacity, now)
+    tokens = min(capacity, tokens + (now - last) * capacity / per_seconds)
+
+    if tokens < 1:
+        cache.set(key, (tokens, now), per_seconds)
+        return False, (1 - tokens) * per_seconds / capacity
+
+    cache.set(key, (tokens - 1, now), per_seconds)
+    return True, 0
+
+
+def count_throttled(scope):
+    key = f'throttled-count:{scope}'
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:  # evicted between add and incr
+        cache.set(key, 1, None)
+
+
+def throttled_counts():
+    return {
+        scope: cache.get(f'throttled-count:{scope}', 0)
+        for scope, _, _, _ in SCOPES
+    }
@@ -0,0 +1,107 @@
+import datetime
+
+from django.db import connections
+from django.db.models import BooleanField, Count, F, Q
+from django.db.models.functions import TruncMonth
+from django.db.models.expressions import RawSQL
+
+from .models import Partnerships
+
+
+# =========================================================
+# 🗓️ Timeline / as-of queries
+# A partnership is "in effect" on every day of [date_started, date_ended]
+# (no date_ended = ongoing; no date_started = never counted, like growth).
+#
+# PostgreSQL: migration 0021 adds a generated `active_range daterange` column
+# with a GiST index, so overlap tests are one `&&` index probe.
+# Other databases: the same test on the two date columns (partnership_dates_idx).
+# =========================================================
+
+RANGE_COLUMN = 'active_range'
+MAX_MONTHS = 120
+
+
+def uses_range_column(queryset):
+    # ArchivedPartnership has the same date columns but no active_range
+    return queryset.model is Partnerships and connections[queryset.db].vendor == 'postgresql'
+
+
+def overlap_q(start, end):
+    """
+    Date-column version: in effect at some point between start and end (inclusive).
+    Rows that end before they start never match, as with active_range (NULL for them).
+    """
+    return (
+        Q(date_started__isnull=False, date_started__lte=end)
+        & (Q(date_ended__isnull=True) | Q(date_ended__gte=start))
+        & (Q(date_ended__gte=F('date_started')) | Q(date_ended__isnull=True))
+    )
+
+
+def overlapping(queryset, start, end):
+    """Partnerships in effect at any point between start and end (inclusive)."""
+    if uses_range_column(queryset):
+        table = connections[queryset.db].ops.quote_name(Partnerships._meta.db_table)
+        return queryset.filter(RawSQL(
+            f"{table}.{RANGE_COLUMN} && daterange(%s, %s, '[]')",
+            (start, end),
+            output_field=BooleanField(),
+        ), date_started__lte=end)   # implied by the overlap; lets a partitioned table skip later years
+    return queryset.filter(overlap_q(start, end))
+
+
+def active_on(queryset, day):
+    return overlapping(queryset, day, day)
+
+
+def month_starts(start, end):
+    """First day of every month from start's month to end's month."""
+    month = start.replace(day=1)
+    months = []
+    while month <= end and len(months) < MAX_MONTHS:
+        months.append(month)
+        month = (month + datetime.timedelta(days=32)).replace(day=1)
+    return months
+
+
+def monthly_series(queryset, start, end):
+    """
+    [{"month": "2023-01", "active": n}, ...] — partnerships in effect at any
+    point in each month. One query: the whole window is narrowed through the
+    index, then each month is a conditional COUNT over those rows.
+    """
+    months = month_starts(start, end)
+    if not months:
+        return []
+
+    last_day = (months[-1] + datetime.timedelta(days=32)).replace(day=1) - datetime.timedelta(days=1)
+    bounds = [
+        (month, (month + datetime.timedelta(days=32)).replace(day=1) - datetime.timedelta(days=1))
+        for month in months
+    ]
+
+    counts = overlapping(queryset, months[0], last_day).aggregate(**{
+        f'm{i}': Count('pk', filter=overlap_q(first, last))
+        for i, (first, last) in enumerate(bounds)
+    })
+
+    return [
+        {'month': month.strftime('%Y-%m'), 'active': counts[f'm{i}']}
+        for i, month in enumerate(months)
+    ]
+
+
+def started_per_month(queryset):
+    """[{"month": "2023-01", "count": n}, ...] — partnerships started each month (growth)."""
+    data = (
+        queryset.exclude(date_started__isnull=True)
+        .annotate(month=TruncMonth('date_started'))
+        .values('month')
+        .annotate(count=Count('id'))
+        .order_by('month')
+    )
+    return [
+        {'month': item['month'].strftime('%Y-%m'), 'count': item['count']}
+        for item in data if item['month']
+    ]
@@ -2,8 +2,10 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import CollegeViewSet, DepartmentViewSet, PartnershipsViewSet, UserViewSet, GuestRegisterViewSet, ViewingCollegeViewSet, ViewingDepartmentViewSet, ViewingPartnershipViewSet
 from rest_framework_simplejwt.views import TokenRefreshView
-from .views import MyTokenObtainPairView
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+from .views import MyTokenObtainPairView, DatabasePoolStatsView, AuditLogViewSet, ThrottleStatsView, JobViewSet, ArchivedPartnershipViewSet
+from .batch import BatchView
+from .lazy import lazy_view
+from .schema import schema_view
 
 router = DefaultRouter()
 router.register(r'colleges', CollegeViewSet)
@@ -13,13 +15,21 @@ router.register(r'users', UserViewSet)
 router.register(r'viewing/colleges', ViewingCollegeViewSet, basename='viewing-colleges')
 router.register(r'viewing/departments', ViewingDepartmentViewSet, basename='viewing-departments')
 router.register(r'viewing/partnerships', ViewingPartnershipViewSet, basename='viewing-partnerships')
+router.register(r'audit', AuditLogViewSet, basename='audit')
+router.register(r'jobs', JobViewSet, basename='jobs')
+router.register(r'archive/partnerships', ArchivedPartnershipViewSet, basename='archived-partnerships')
 
 urlpatterns = [
     path('token/', MyTokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('register/guest/', GuestRegisterViewSet.as_view({'post': 'create'}), name='guest-register'),
+    path('db/pool/', DatabasePoolStatsView.as_view(), name='db-pool-stats'),
+    path('throttle/stats/', ThrottleStatsView.as_view(), name='throttle-stats'),
+    path('batch/', BatchView.as_view(), name='batch'),
     path('', include(router.urls)),
-    path('schema/', SpectacularAPIView.as_view(), name='schema'),
-    path('docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
+    # Pre-built before the server starts (manage.py build_schema); otherwise generated live
+    path('schema/', schema_view, name='schema'),
+    # drf_spectacular is only imported when the docs are first opened
+    path('docs/', lazy_view('drf_spectacular.views.SpectacularSwaggerView', url_name='schema'), name='swagger-ui'),
     
 ]
\ No newline at end of file
@@ -1,18 +1,209 @@
 from django.shortcuts import render
-from rest_framework import viewsets, permissions
+import csv
+import datetime
+import heapq
+import os
+from collections import Counter
+
+from rest_framework import mixins, status, viewsets, permissions
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-
-from django.db.models import Count
-from django.db.models.functions import TruncMonth, TruncYear
+from rest_framework.views import APIView
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils.http import quote_etag
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework.parsers import MultiPartParser, FormParser
-
-from .models import College, Department, Partnerships, User
-from .serializers import CollegeSerializer, DepartmentSerializer, PartnershipsSerializer, UserSerializer, GuestUserSerializer
-from .permissions import IsGuestOrReadOnly, IsDepartmentAdmin, IsCollegeAdmin, IsSuperAdmin, CanManageUsers
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.utils.urls import replace_query_param
+
+from . import audit, duplicates, jobs, rankings, reports, timeline
+from .models import College, Department, Partnerships, ArchivedPartnership, User, AuditLog, Job
+from .serializers import CollegeSerializer, DepartmentSerializer, PartnershipsSerializer, ArchivedPartnershipSerializer, UserSerializer, GuestUserSerializer, AuditLogSerializer, JobSerializer
+from .projections import ProjectedListMixin
+from .cdn import CdnCacheMixin
+from .throttling import throttled_counts
+from .permissions import IsGuestOrReadOnly, IsDepartmentAdmin, IsCollegeAdmin, IsSuperAdmin, CanManageUsers, CanViewHistory, CanViewReports
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
+class ActivityOrderingMixin:
+    """
+    Sort/filter colleges and departments by their stored counters (no COUNT joins):
+      ?ordering=-active_partnership_count
+      ?min_active=3
+    """
+    ordering_fields = ('name', 'partnership_count', 'active_partnership_count')
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        params = self.request.query_params
+
+        ordering = params.get('ordering')
+        if ordering and ordering.lstrip('-') in self.ordering_fields:
+            queryset = queryset.order_by(ordering, 'pk')
+
+        min_active = params.get('min_active')
+        if min_active and min_active.isdigit():
+            queryset = queryset.filter(active_partnership_count__gte=int(min_active))
+
+        return queryset
+
+
+class StatusFilterMixin:
+    """
+    ?status=active / ?status=inactive — a plain indexed equality lookup, since
+    `manage.py reconcile_status` keeps status in step with date_ended.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+
+        status = self.request.query_params.get('status')
+        if status in (Partnerships.STATUS_ACTIVE, Partnerships.STATUS_INACTIVE):
+            queryset = queryset.filter(status=status)
+
+        return queryset
+
+
+def date_param(request, name, default=None):
+    """?name=YYYY-MM-DD → date (400 if malformed), or `default` when absent."""
+    value = request.query_params.get(name)
+    if not value:
+        return default
+    try:
+        day = parse_date(value)
+    except ValueError:
+        day = None
+    if day is None:
+        raise ValidationError({name: 'Use YYYY-MM-DD.'})
+    return day
+
+
+def scope_partnerships(queryset, user):
+    """Role-based visibility, shared by live and archived partnerships."""
+    if not user.is_authenticated:
+        return queryset
+
+    if user.role == 'SUPERADMIN':
+        return queryset
+
+    if user.role == 'COLLEGE_ADMIN':
+        return queryset.filter(college_id=user.college_id)
+
+    if user.role == 'DEPARTMENT_ADMIN':
+        return queryset.filter(department_id=user.department_id)
+
+    if user.role == 'GUEST':
+        return queryset
+
+    return queryset.none()
+
+
+def include_archived(request):
+    """?include_archived=true: also read ArchivedPartnership (api/archive.py)."""
+    return request.query_params.get('include_archived', '').lower() in ('1', 'true', 'yes')
+
+
+def keyset_param(request, name):
+    """?before=<created_at ISO>|<id> → (datetime, id), or None when absent."""
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    created_at, _, pk = value.rpartition('|')
+    try:
+        moment = parse_datetime(created_at)
+    except ValueError:
+        moment = None
+    if moment is None or not pk.isdigit():
+        raise ValidationError({name: 'Use the "next" link of the previous page.'})
+    return moment, int(pk)
+
+
+class TimelineFilterMixin:
+    """
+    Partnerships in effect on a day or during a span (see api/timeline.py):
+      ?active_on=2023-08-14
+      ?active_from=2023-08-01&active_to=2023-12-15   (either end may be omitted)
+      ?year=2023   (started that year; a single partition when partitioned, see api/partitioning.py)
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+
+        year = self.request.query_params.get('year')
+        if year:
+            if not year.isdigit():
+                raise ValidationError({'year': 'Expected a year, e.g. 2023.'})
+            queryset = queryset.filter(date_started__year=int(year))
+
+        active_on = date_param(self.request, 'active_on')
+        if active_on:
+            queryset = timeline.active_on(queryset, active_on)
+
+        active_from = date_param(self.request, 'active_from')
+        active_to = date_param(self.request, 'active_to')
+        if active_from or active_to:
+            queryset = timeline.overlapping(
+                queryset, active_from or datetime.date.min, active_to or datetime.date.max,
+            )
+
+        return queryset
+
+
+class AuditPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class AuditMixin:
+    """
+    Records field-level diffs of every create/update/delete (see api/audit.py;
+    rows are buffered and written in batches) and adds
+    GET /<resource>/<id>/history/ — paginated, newest first; SUPERADMIN or
+    the college/department admin of the object (CanViewHistory).
+    """
+
+    def audit(self, action, instance, changes, object_id=None):
+        audit.record(self.request.user, action, instance, changes, object_id=object_id)
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        self.audit(AuditLog.ACTION_CREATE, serializer.instance, audit.diff({}, audit.snapshot(serializer.instance)))
+
+    def perform_update(self, serializer):
+        before = audit.snapshot(serializer.instance)
+        super().perform_update(serializer)
+        changes = audit.diff(before, audit.snapshot(serializer.instance))
+        if changes:
+            self.audit(AuditLog.ACTION_UPDATE, serializer.instance, changes)
+
+    def perform_destroy(self, instance):
+        object_id = instance.pk
+        before = audit.snapshot(instance)
+        super().perform_destroy(instance)
+        self.audit(AuditLog.ACTION_DELETE, instance, audit.diff(before, {}), object_id=object_id)
+
+    @action(detail=True, methods=['get'], url_path='history', permission_classes=[CanViewHistory])
+    def history(self, request, pk=None):
+        obj = self.get_object()   # visibility of retrieve, but only for the admins who own the object
+        audit.flush()             # include this worker's not-yet-written rows
+
+        entries = (
+            AuditLog.objects.filter(model=obj._meta.model_name, object_id=obj.pk)
+            .select_related('actor')
+        )
+        paginator = AuditPagination()
+        page = paginator.paginate_queryset(entries, request, view=self)
+        return paginator.get_paginated_response(AuditLogSerializer(page, many=True).data)
+
+
 # Create your views here.
 class GuestRegisterViewSet(viewsets.ModelViewSet):
     queryset = User.objects.filter(role='GUEST')
@@ -23,9 +214,10 @@ class GuestRegisterViewSet(viewsets.ModelViewSet):
         serializer.save(role='GUEST')   
 
 
-class CollegeViewSet(viewsets.ModelViewSet):
+class CollegeViewSet(AuditMixin, ActivityOrderingMixin, viewsets.ModelViewSet):
     queryset = College.objects.all()
     serializer_class = CollegeSerializer
+    ordering_fields = ActivityOrderingMixin.ordering_fields + ('department_count',)
     parser_classes = (MultiPartParser, FormParser)
     permission_classes = [IsGuestOrReadOnly | IsSuperAdmin | IsCollegeAdmin]
 
@@ -55,9 +247,52 @@ class CollegeViewSet(viewsets.ModelViewSet):
         serializer = DepartmentSerializer(departments, many=True)
         return Response(serializer.data)
 
+    # -------------------------------------------
+    # 📊 REPORT (api/reports.py)
+    # /api/colleges/3/report/xlsx/  or  .../report/pdf/
+    # 200 + file when the current data has been rendered already,
+    # otherwise 202 + the queued job: retry the same URL after Retry-After.
+    # -------------------------------------------
+    @action(detail=True, methods=['GET'], url_path=r'report/(?P<kind>xlsx|pdf)', permission_classes=[CanViewReports])
+    def report(self, request, pk=None, kind=None):
+        college = self.get_object()
+        key = reports.fingerprint(college)
+        stored = reports.current(college, kind, key)
+        etag = quote_etag(f'{kind}-{key}')
+
+        if stored is not None:
+            if etag in request.headers.get('If-None-Match', ''):
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+            response = FileResponse(
+                reports.storage().open(stored.name, 'rb'),
+                as_attachment=True,
+                filename=reports.download_name(college, kind),
+                content_type=reports.FORMATS[kind],
+            )
+            response['ETag'] = etag
+            response['Cache-Control'] = 'private, no-cache'
+            return response
+
+        # One job per version of the data, however many people ask for it
+        job = Job.objects.filter(
+            name='college_report',
+            status__in=[Job.STATUS_QUEUED, Job.STATUS_RUNNING],
+            kwargs__college=college.pk,
+            kwargs__kind=kind,
+            kwargs__fingerprint=key,
+        ).first()
+        if job is None:
+            job = jobs.enqueue('college_report', created_by=request.user, college=college.pk, kind=kind, fingerprint=key)
+
+        return Response(
+            {'detail': 'The report is being generated.', 'job': JobSerializer(job).data},
+            status=status.HTTP_202_ACCEPTED,
+            headers={'Retry-After': str(getattr(settings, 'REPORT_RETRY_SECONDS', 5))},
+        )
+
 
 
-class DepartmentViewSet(viewsets.ModelViewSet):
+class DepartmentViewSet(AuditMixin, ActivityOrderingMixin, viewsets.ModelViewSet):
     queryset = Department.objects.all()
     serializer_class = DepartmentSerializer
     permission_classes = [IsGuestOrReadOnly | IsCollegeAdmin | IsSuperAdmin | IsDepartmentAdmin]
@@ -102,35 +337,88 @@ class DepartmentViewSet(viewsets.ModelViewSet):
 
 
 
-class PartnershipsViewSet(viewsets.ModelViewSet):
+class PartnershipsViewSet(AuditMixin, TimelineFilterMixin, StatusFilterMixin, viewsets.ModelViewSet):
     queryset = Partnerships.objects.all()
     serializer_class = PartnershipsSerializer
     permission_classes = [IsGuestOrReadOnly | IsDepartmentAdmin | IsCollegeAdmin | IsSuperAdmin]
 
     # Filter by department for frontend filtering
     def get_queryset(self):
-        user = self.request.user
-        queryset = Partnerships.objects.all()
-
-        if not user.is_authenticated:
-            return queryset
-        
-        if user.role == 'SUPERADMIN':
-            return queryset
-
-        if user.role == 'COLLEGE_ADMIN':
-            return queryset.filter(department__college_id=user.college_id)
-
-        if user.role == 'DEPARTMENT_ADMIN':
-            return queryset.filter(department_id=user.department_id)
-
-        if user.role == 'GUEST':
-            return queryset
-
-        return queryset.none()
+        return scope_partnerships(Partnerships.objects.all(), self.request.user)
+
+    def list(self, request, *args, **kwargs):
+        if not include_archived(request):
+            return super().list(request, *args, **kwargs)
+
+        # ?include_archived=true: live rows + archived rows, newest first, one page at a time.
+        # Keyset pages (?before=<created_at>|<id> from "next"): each table reads at most
+        # page_size + 1 rows off its (-created_at, -id) order, however deep the page.
+        size = AuditPagination().get_page_size(request)
+        before = keyset_param(request, 'before')
+
+        sources = []
+        for queryset in (self.get_queryset(), scope_partnerships(ArchivedPartnership.objects.all(), request.user)):
+            queryset = self.filter_queryset(queryset).order_by('-created_at', '-pk')
+            if before is not None:
+                created_at, pk = before
+                queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk))
+            sources.append(list(queryset[:size + 1]))
+
+        merged = list(heapq.merge(*sources, key=lambda p: (p.created_at, p.pk), reverse=True))
+        page, more = merged[:size], len(merged) > size
+
+        context = self.get_serializer_context()
+        live = [p for p in page if isinstance(p, Partnerships)]
+        archived = [p for p in page if isinstance(p, ArchivedPartnership)]
+        rows = {('live', p.pk): {**row, 'archived': False}
+                for p, row in zip(live, PartnershipsSerializer(live, many=True, context=context).data)}
+        rows.update({('archived', p.pk): row
+                     for p, row in zip(archived, ArchivedPartnershipSerializer(archived, many=True, context=context).data)})
+
+        next_url = None
+        if more:
+            last = page[-1]
+            next_url = replace_query_param(
+                request.build_absolute_uri(), 'before', f'{last.created_at.isoformat()}|{last.pk}'
+            )
+        return Response({
+            'next': next_url,
+            'results': [rows['live' if isinstance(p, Partnerships) else 'archived', p.pk] for p in page],
+        })
 
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
+        self.audit(AuditLog.ACTION_CREATE, serializer.instance, audit.diff({}, audit.snapshot(serializer.instance)))
+
+    def create(self, request, *args, **kwargs):
+        response = super().create(request, *args, **kwargs)
+        # Not blocking: the new row is saved, the client decides whether to merge/delete it
+        response.data['possible_duplicates'] = duplicates.describe(duplicates.find_similar(
+            title=response.data.get('title'),
+            email=response.data.get('contact_email'),
+            exclude_id=response.data.get('id'),
+        ))
+        return response
+
+    # -------------------------------------------
+    # 👯 LIKELY DUPLICATES (trigram index, see api/duplicates.py)
+    # /api/partnerships/similar/?title=DOST Region XI&email=info@dost.gov.ph
+    # -------------------------------------------
+    @action(detail=False, methods=['GET'], url_path='similar')
+    def similar(self, request):
+        title = request.GET.get('title', '').strip()
+        email = request.GET.get('email', '').strip()
+        if not title and not email:
+            raise ValidationError({'detail': 'Pass ?title= and/or ?email=.'})
+
+        exclude = request.GET.get('exclude')
+        matches = duplicates.find_similar(
+            title=title,
+            email=email,
+            exclude_id=int(exclude) if exclude and exclude.isdigit() else None,
+            limit=min(int(request.GET['limit']), 20) if request.GET.get('limit', '').isdigit() else 5,
+        )
+        return Response(duplicates.describe(matches))
 
     # -------------------------------------------
     # 📈 NEW ANALYTICS ENDPOINT
@@ -141,44 +429,95 @@ class PartnershipsViewSet(viewsets.ModelViewSet):
         month = request.GET.get("month")
         college_id = request.GET.get("college")  # <-- FIXED
 
-        # Start with all data (before filtering)
-        qs = Partnerships.objects.all()
+        # Start with all data (before filtering); archived rows only with ?include_archived=true
+        sources = [Partnerships.objects.all()]
+        if include_archived(request):
+            sources.append(ArchivedPartnership.objects.all())
 
-        # Filter by ?college=ID if provided
-        if college_id:
-            qs = qs.filter(department__college_id=college_id)
-        else:
-            # fallback to role-based filter
-            qs = self.get_queryset()
-
-        # Must have a date_started
-        qs = qs.exclude(date_started__isnull=True)
+        counts = Counter()
+        for qs in sources:
+            # Filter by ?college=ID if provided
+            if college_id:
+                qs = qs.filter(college_id=college_id)
+            else:
+                # fallback to role-based filter
+                qs = scope_partnerships(qs, request.user)
 
-        # Optional filters
-        if year:
-            qs = qs.filter(date_started__year=year)
+            # Optional filters
+            if year:
+                qs = qs.filter(date_started__year=year)
 
-        if month:
-            qs = qs.filter(date_started__month=month)
+            if month:
+                qs = qs.filter(date_started__month=month)
 
-        # Group by month
-        data = (
-            qs.annotate(month=TruncMonth('date_started'))
-            .values('month')
-            .annotate(count=Count('id'))
-            .order_by('month')
-        )
+            # Group by month (same series as the college reports, see api/reports.py)
+            for item in timeline.started_per_month(qs):
+                counts[item['month']] += item['count']
 
-        response = [
-            {
-                "month": item["month"].strftime("%Y-%m"),
-                "count": item["count"]
-            }
-            for item in data if item["month"]
-        ]
+        response = [{'month': month, 'count': counts[month]} for month in sorted(counts)]
 
         return Response(response)
 
+    # -------------------------------------------
+    # 🗓️ AS-OF / TIMELINE (date ranges, see api/timeline.py)
+    # /api/partnerships/as-of/?date=2023-08-14
+    # /api/partnerships/timeline/?from=2023-01-01&to=2023-12-31
+    # -------------------------------------------
+    @action(detail=False, methods=['GET'], url_path='as-of')
+    def get_as_of(self, request):
+        day = date_param(request, 'date', timezone.localdate())
+        queryset = timeline.active_on(self.filter_queryset(self.get_queryset()), day)
+        return Response({'date': day.isoformat(), 'active': queryset.count()})
+
+    @action(detail=False, methods=['GET'], url_path='timeline')
+    def get_timeline(self, request):
+        end = date_param(request, 'to', timezone.localdate())
+        start = date_param(request, 'from', end.replace(year=end.year - 1, day=1))
+        if start > end:
+            raise ValidationError({'from': "Must not be after 'to'."})
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(timeline.monthly_series(queryset, start, end))
+
+    # -------------------------------------------
+    # 🏆 RANKINGS (window functions, see api/rankings.py)
+    # /api/partnerships/rankings/?level=department&period=year&date=2025-06-01
+    # -------------------------------------------
+    @action(detail=False, methods=['GET'], url_path='rankings')
+    def get_rankings(self, request):
+        level = request.GET.get('level', 'department')
+        period = request.GET.get('period', 'year')
+        if level not in rankings.LEVELS or period not in rankings.PERIODS:
+            raise ValidationError({'detail': f"level must be one of {list(rankings.LEVELS)}, period one of {list(rankings.PERIODS)}"})
+
+        day = date_param(request, 'date')
+
+        # Role scoping: admins are ranked against their peers but only see their own rows
+        user = request.user
+        role = user.role if user.is_authenticated else None
+        college_id = request.GET.get('college')
+        visible = None
+
+        if role in ('COLLEGE_ADMIN', 'DEPARTMENT_ADMIN'):
+            # A department admin's college is their department's (user.college is often unset)
+            own_college = user.college_id if role == 'COLLEGE_ADMIN' else getattr(user.department, 'college_id', None)
+            if level == 'college':
+                visible = {own_college}
+            else:
+                college_id = own_college
+                if role == 'DEPARTMENT_ADMIN':
+                    visible = {user.department_id}
+        elif role not in (None, 'SUPERADMIN', 'GUEST'):
+            return Response({'detail': 'Not allowed.'}, status=403)
+
+        if college_id and not str(college_id).isdigit():
+            raise ValidationError({'college': 'Must be an id.'})
+
+        data = rankings.rankings(level, period, day, college_id)
+        if visible is not None:
+            data = {**data, 'results': [row for row in data['results'] if row['id'] in visible]}
+        return Response(data)
+
     # /api/partnerships/growth/<college_id>/
     # @action(detail=False, methods=["GET"], url_path="growth/(?P<college_id>[^/.]+)")
     # def college_growth(self, request, college_id=None):
@@ -207,7 +546,7 @@ class PartnershipsViewSet(viewsets.ModelViewSet):
     #     return Response(formatted)
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(AuditMixin, viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [CanManageUsers]
@@ -223,22 +562,23 @@ class UserViewSet(viewsets.ModelViewSet):
 
 
 # =========================================================
-# Viewing Section (read-only for everyone)
+# Viewing Section (read-only for everyone, cacheable by a CDN — see api/cdn.py)
 # =========================================================
 
-class ViewingCollegeViewSet(viewsets.ReadOnlyModelViewSet):
+class ViewingCollegeViewSet(CdnCacheMixin, ProjectedListMixin, ActivityOrderingMixin, viewsets.ReadOnlyModelViewSet):
     queryset = College.objects.all()
     serializer_class = CollegeSerializer
+    ordering_fields = ActivityOrderingMixin.ordering_fields + ('department_count',)
     permission_classes = [permissions.AllowAny]
 
 
-class ViewingDepartmentViewSet(viewsets.ReadOnlyModelViewSet):
+class ViewingDepartmentViewSet(CdnCacheMixin, ProjectedListMixin, ActivityOrderingMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Department.objects.all()
     serializer_class = DepartmentSerializer
     permission_classes = [permissions.AllowAny]
 
 
-class ViewingPartnershipViewSet(viewsets.ReadOnlyModelViewSet):
+class ViewingPartnershipViewSet(CdnCacheMixin, ProjectedListMixin, StatusFilterMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = PartnershipsSerializer
     permission_classes = [permissions.AllowAny]
 
@@ -253,6 +593,166 @@ class ViewingPartnershipViewSet(viewsets.ReadOnlyModelViewSet):
         return queryset
 
 
+# =========================================================
+# 🗄️ Archived partnerships (read-only, see api/archive.py)
+# /api/archive/partnerships/?search=DOST&college=3&status=inactive
+# /api/archive/partnerships/export/?search=DOST   → CSV of every match
+# =========================================================
+
+class Echo:
+    """File-like object for csv.writer that hands each line back instead of storing it."""
+    def write(self, value):
+        return value
+
+
+class ArchivedPartnershipViewSet(TimelineFilterMixin, StatusFilterMixin, viewsets.ReadOnlyModelViewSet):
+    serializer_class = ArchivedPartnershipSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = AuditPagination
+
+    EXPORT_COLUMNS = (
+        ('id', 'ID'),
+        ('title', 'Title'),
+        ('college__code', 'College'),
+        ('department__name', 'Department'),
+        ('status', 'Status'),
+        ('contact_person', 'Contact person'),
+        ('contact_email', 'Email'),
+        ('contact_phone', 'Phone'),
+        ('date_started', 'Started'),
+        ('date_ended', 'Ended'),
+        ('archived_at', 'Archived'),
+    )
+
+    def get_queryset(self):
+        queryset = scope_partnerships(ArchivedPartnership.objects.all(), self.request.user)
+        params = self.request.query_params
+
+        search = params.get('search', '').strip()
+        if search:
+            queryset = queryset.filter(
+                Q(title__icontains=search)
+                | Q(contact_person__icontains=search)
+                | Q(contact_email__icontains=search)
+            )
+
+        department = params.get('department')
+        if department and department.isdigit():
+            queryset = queryset.filter(department_id=department)
+
+        college = params.get('college')
+        if college and college.isdigit():
+            queryset = queryset.filter(college_id=college)
+
+        return queryset
+
+    @action(detail=False, methods=['GET'], url_path='export')
+    def export(self, request):
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = queryset.values_list(*(field for field, _ in self.EXPORT_COLUMNS)).iterator(chunk_size=2000)
+        writer = csv.writer(Echo())
+
+        def lines():
+            yield writer.writerow([label for _, label in self.EXPORT_COLUMNS])
+            for row in rows:
+                yield writer.writerow(row)
+
+        response = StreamingHttpResponse(lines(), content_type='text/csv')
+        response['Content-Disposition'] = f'attachment; filename="archived-partnerships-{timezone.localdate():%Y-%m-%d}.csv"'
+        return response
+
+
+# =========================================================
+# Audit trail (SUPERADMIN only) — includes deleted objects
+# =========================================================
+
+class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
+    serializer_class = AuditLogSerializer
+    permission_classes = [IsSuperAdmin]
+    pagination_class = AuditPagination
+
+    def get_queryset(self):
+        audit.flush()
+        queryset = AuditLog.objects.select_related('actor')
+
+        model = self.request.query_params.get('model')
+        object_id = self.request.query_params.get('object_id')
+        if model:
+            queryset = queryset.filter(model=model)
+        if model and object_id and object_id.isdigit():
+            queryset = queryset.filter(object_id=object_id)
+
+        return queryset
+
+
+# =========================================================
+# Background jobs (api/jobs.py, run by `manage.py run_workers`)
+# POST /api/jobs/ {"name": "recount", "kwargs": {"dry_run": true}}  → 202, SUPERADMIN
+# GET  /api/jobs/<id>/                                             → status/progress
+# =========================================================
+
+class JobViewSet(mixins.CreateModelMixin, viewsets.ReadOnlyModelViewSet):
+    serializer_class = JobSerializer
+    pagination_class = AuditPagination
+
+    def get_permissions(self):
+        if self.action == 'create':
+            return [IsSuperAdmin()]
+        return [permissions.IsAuthenticated()]
+
+    def get_queryset(self):
+        user = self.request.user
+        if user.role == 'SUPERADMIN':
+            return Job.objects.all()
+        return Job.objects.filter(created_by=user)
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        job = jobs.enqueue(serializer.validated_data['name'], created_by=request.user, **serializer.validated_data.get('kwargs', {}))
+        return Response(self.get_serializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+
+# =========================================================
+# Database pool metrics (SUPERADMIN only)
+# =========================================================
+
+class DatabasePoolStatsView(APIView):
+    """
+    Connection pool stats for THIS worker process (each gunicorn worker has its own pool).
+    Only meaningful with DATABASE_POOL_MODE=pool.
+    """
+    permission_classes = [IsSuperAdmin]
+    schema = None  # ops endpoint, not part of the public API docs
+
+    def get(self, request):
+        pools = {}
+
+        for alias in connections:
+            pool = getattr(connections[alias], 'pool', None)
+            if pool is None:
+                continue
+
+            stats = pool.get_stats()
+            queued = stats.get('requests_queued', 0)
+            pools[alias] = {
+                **stats,
+                # Average time a request waited for a connection when none was free
+                'avg_wait_ms': round(stats.get('requests_wait_ms', 0) / queued, 2) if queued else 0,
+            }
+
+        return Response({'pid': os.getpid(), 'pools': pools})
+
+
+class ThrottleStatsView(APIView):
+    """How many requests each throttle scope has rejected (per cache, see REDIS_URL)."""
+    permission_classes = [IsSuperAdmin]
+    schema = None  # ops endpoint, not part of the public API docs
+
+    def get(self, request):
+        return Response({'throttled': throttled_counts()})
+
+
 class MyTokenObtainPairSerializer(TokenObtainPairSerializer):
     @classmethod
     def get_token(cls, user):
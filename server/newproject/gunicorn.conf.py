@@ -0,0 +1,50 @@
+# Picked up automatically when gunicorn is started from this folder.
+import os
+
+# GUNICORN_PRELOAD=True loads Django once in the master process and forks the
+# workers from it (faster worker recycles, shared memory for imported code).
+preload_app = os.getenv("GUNICORN_PRELOAD", "False") == "True"
+
+
+def post_fork(server, worker):
+    if not server.cfg.preload_app:
+        return
+
+    # Nothing touches the database at import time, but never let a forked worker
+    # reuse a socket inherited from the master. Pools (DATABASE_POOL_MODE=pool)
+    # are opened lazily, so each worker opens its own.
+    from django.db import connections
+    connections.close_all()
+
+
+def when_ready(server):
+    # WARM_CACHES_ON_START=True → once the workers are up, request the hot
+    # endpoints through the server itself so the first visitors don't pay for it.
+    if os.getenv("WARM_CACHES_ON_START", "False") != "True":
+        return
+    if not os.getenv("REDIS_URL"):
+        # Per-worker locmem caches: only whichever workers happen to answer get warm
+        server.log.warning("WARM_CACHES_ON_START needs REDIS_URL (a shared cache), skipping")
+        return
+
+    import subprocess
+    import sys
+
+    address = server.address[0] if server.address else None
+    if not isinstance(address, tuple):
+        return  # unix socket: nothing to connect to over HTTP
+
+    port = address[1]
+    subprocess.Popen(
+        [sys.executable, "manage.py", "warm_caches", "--base-url", f"http://127.0.0.1:{port}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+
+
+def worker_exit(server, worker):
+    # Write any buffered audit rows before the worker goes away
+    try:
+        from api import audit
+    except Exception:
+        return  # Django never finished loading in this worker
+    audit.flush()
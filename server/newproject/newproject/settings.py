@@ -14,9 +14,7 @@ from pathlib import Path
 import os
 from dotenv import load_dotenv
 import dj_database_url
-import cloudinary
-import cloudinary.uploader
-import cloudinary.api
+from django.core.exceptions import ImproperlyConfigured
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -63,7 +61,6 @@ INSTALLED_APPS = [
     'rest_framework',
     'drf_spectacular',
     'cloudinary_storage',
-    'cloudinary',
 
     # Local apps
     'api',
@@ -76,19 +73,16 @@ INSTALLED_APPS = [
 #     MIDDLEWARE.insert(0, 'debug_toolbar.middleware.DebugToolbarMiddleware')
 #     INTERNAL_IPS = ['127.0.0.1']
 
+# Cloudinary is configured lazily: cloudinary_storage reads this dict (and calls
+# cloudinary.config with secure URLs) the first time the media storage is used,
+# so the SDK isn't imported at worker start-up.
 CLOUDINARY_STORAGE = {
     'CLOUD_NAME': os.getenv('CLOUDINARY_CLOUD_NAME'),
     'API_KEY': os.getenv('CLOUDINARY_API_KEY'),
     'API_SECRET': os.getenv('CLOUDINARY_API_SECRET'),
+    'SECURE': True,
 }
 
-cloudinary.config(
-    cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
-    api_key=os.getenv("CLOUDINARY_API_KEY"),
-    api_secret=os.getenv("CLOUDINARY_API_SECRET"),
-    secure=True,
-)
-
 # print("Cloudinary:",
 #       os.getenv("CLOUDINARY_CLOUD_NAME"),
 #       os.getenv("CLOUDINARY_API_KEY"),
@@ -100,13 +94,18 @@ AUTH_USER_MODEL = 'api.User'
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'api.middleware.CompressionMiddleware',
+    'django.middleware.http.ConditionalGetMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    'api.middleware.ThrottleMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'api.middleware.ReplicaRoutingMiddleware',
 ]
 
 ROOT_URLCONF = 'newproject.urls'
@@ -140,18 +139,183 @@ WSGI_APPLICATION = 'newproject.wsgi.application'
 #     }
 # }
 
-# PRODUCTION
-DATABASES = {
-    'default': dj_database_url.config(
-        default=os.getenv("DATABASE_URL"),
+# CONNECTION MODE
+# "persistent" → one long-lived connection per worker thread (old behaviour)
+# "pool"       → psycopg 3 connection pool shared by the worker's threads
+# "pgbouncer"  → behind a transaction-mode external pooler (PgBouncer, Supavisor, ...)
+DATABASE_POOL_MODE = os.getenv("DATABASE_POOL_MODE", "persistent")
+
+
+def database_config(env):
+    """Build a DATABASES entry from the URL in `env`, according to DATABASE_POOL_MODE."""
+    if DATABASE_POOL_MODE == "pool":
+        # Pooled connections can't also be persistent (CONN_MAX_AGE must be 0)
+        config = dj_database_url.config(env=env, ssl_require=True)
+        if config:
+            config.setdefault("OPTIONS", {})["pool"] = {
+                "min_size": int(os.getenv("DATABASE_POOL_MIN_SIZE", "2")),
+                "max_size": int(os.getenv("DATABASE_POOL_MAX_SIZE", "10")),
+                # Seconds a request waits for a free connection before erroring
+                "timeout": float(os.getenv("DATABASE_POOL_TIMEOUT", "10")),
+                # Seconds an idle connection above min_size is kept open
+                "max_idle": float(os.getenv("DATABASE_POOL_MAX_IDLE", "300")),
+            }
+        return config
+
+    if DATABASE_POOL_MODE == "pgbouncer":
+        # Transaction pooling hands each transaction a different server connection,
+        # so server-side cursors (used by .iterator()) would break.
+        return dj_database_url.config(
+            env=env,
+            conn_max_age=0,
+            disable_server_side_cursors=True,
+            ssl_require=True,
+        )
+
+    return dj_database_url.config(
+        env=env,
         conn_max_age=600,
         conn_health_checks=True,
         ssl_require=True,
-        )
+    )
+
+
+# PRODUCTION
+DATABASES = {
+    'default': database_config("DATABASE_URL"),
     }
 
 # DATABASES['default'] = dj_database_url.parse(os.getenv('DATABASE_URL'))
 
+# CACHE
+# Throttle buckets, replica pins and compressed bodies live here. Per-process
+# memory by default; set REDIS_URL to share them between workers/instances.
+if os.getenv("REDIS_URL"):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv("REDIS_URL"),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# READ REPLICA (optional)
+# Public viewing pages and growth analytics read from the replica when
+# DATABASE_REPLICA_URL is set. Writes always go to the primary.
+# Needs REDIS_URL: the "pin to the primary after a write" flag must reach
+# whichever worker serves the client's next request.
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+
+if DATABASE_REPLICA_URL:
+    if not os.getenv("REDIS_URL"):
+        raise ImproperlyConfigured(
+            "DATABASE_REPLICA_URL needs REDIS_URL: with the per-process cache a client's "
+            "next request can land on another worker and read a stale replica after a write."
+        )
+    DATABASES['replica'] = database_config("DATABASE_REPLICA_URL")
+
+DATABASE_ROUTERS = ['api.db_router.ReplicaRouter']
+
+# Paths whose safe (GET/HEAD/OPTIONS) requests may be served by the replica
+DATABASE_REPLICA_PATHS = [
+    '/api/viewing/',
+    '/api/partnerships/growth/',
+]
+
+# Seconds a client stays on the primary after a write (read-your-writes)
+DATABASE_REPLICA_PIN_SECONDS = int(os.getenv("DATABASE_REPLICA_PIN_SECONDS", "15"))
+
+# Fall back to the primary when the replica is further behind than this (seconds)
+DATABASE_REPLICA_MAX_LAG = float(os.getenv("DATABASE_REPLICA_MAX_LAG", "10"))
+
+# RESPONSE COMPRESSION (api.middleware.CompressionMiddleware)
+# Bodies smaller than this aren't worth compressing (bytes)
+COMPRESSION_MIN_SIZE = 500
+# 4-6 is the sweet spot for on-the-fly brotli (11 is far too slow per request)
+COMPRESSION_BROTLI_QUALITY = 5
+# Anonymous GETs here reuse cached compressed bodies
+COMPRESSION_CACHE_PATHS = ['/api/viewing/']
+COMPRESSION_CACHE_SECONDS = 300
+
+# AUDIT TRAIL (api/audit.py)
+# Rows are buffered per worker and written in one bulk INSERT when this many
+# are waiting, or every AUDIT_FLUSH_SECONDS, whichever comes first.
+AUDIT_BUFFER_SIZE = int(os.getenv("AUDIT_BUFFER_SIZE", "100"))
+AUDIT_FLUSH_SECONDS = float(os.getenv("AUDIT_FLUSH_SECONDS", "5"))
+
+# Rankings (/api/partnerships/rankings/) are cached per level/period/college
+RANKINGS_CACHE_SECONDS = int(os.getenv("RANKINGS_CACHE_SECONDS", "300"))
+
+# Titles at least this similar (pg_trgm similarity, 0-1) are reported as likely duplicates
+DUPLICATE_SIMILARITY_THRESHOLD = float(os.getenv("DUPLICATE_SIMILARITY_THRESHOLD", "0.4"))
+
+# CDN caching of the public viewing endpoints (api/cdn.py), per route basename.
+# max_age → browsers, s_maxage → CDN; stale_while_revalidate lets the edge keep
+# answering while it refetches. Writes purge the affected surrogate keys.
+CDN_CACHE_POLICIES = {
+    'default': {'max_age': 60, 's_maxage': 600, 'stale_while_revalidate': 86400, 'stale_if_error': 86400},
+    'viewing-colleges': {'max_age': 300, 's_maxage': 3600, 'stale_while_revalidate': 86400, 'stale_if_error': 86400},
+    'viewing-departments': {'max_age': 300, 's_maxage': 3600, 'stale_while_revalidate': 86400, 'stale_if_error': 86400},
+}
+CDN_MAX_SURROGATE_KEYS = 1000
+
+# Who gets told to drop cached copies: api.cdn.NullPurger (no CDN), HttpPurger
+# (Varnish/nginx), FastlyPurger or CloudflarePurger
+if os.getenv("CDN_FASTLY_SERVICE_ID"):
+    CDN_PURGER = {
+        'BACKEND': 'api.cdn.FastlyPurger',
+        'OPTIONS': {'service_id': os.getenv("CDN_FASTLY_SERVICE_ID"), 'api_token': os.getenv("CDN_FASTLY_API_TOKEN")},
+    }
+elif os.getenv("CDN_CLOUDFLARE_ZONE_ID"):
+    CDN_PURGER = {
+        'BACKEND': 'api.cdn.CloudflarePurger',
+        'OPTIONS': {'zone_id': os.getenv("CDN_CLOUDFLARE_ZONE_ID"), 'api_token': os.getenv("CDN_CLOUDFLARE_API_TOKEN")},
+    }
+elif os.getenv("CDN_PURGE_URL"):
+    CDN_PURGER = {
+        'BACKEND': 'api.cdn.HttpPurger',
+        'OPTIONS': {'url': os.getenv("CDN_PURGE_URL"), 'header': os.getenv("CDN_PURGE_HEADER", "Surrogate-Key")},
+    }
+else:
+    CDN_PURGER = {'BACKEND': 'api.cdn.NullPurger'}
+
+# POST /api/batch/ (api/batch.py): sub-requests per call, and threads running
+# consecutive GETs concurrently (per process)
+BATCH_MAX_REQUESTS = int(os.getenv("BATCH_MAX_REQUESTS", "20"))
+BATCH_MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", "4"))
+
+# Background jobs (api/jobs.py): retries back off JOB_BACKOFF_SECONDS * 2^(n-1),
+# capped. Running jobs refresh heartbeat_at every JOB_HEARTBEAT_SECONDS; one
+# silent for JOB_STALE_SECONDS is assumed orphaned (its worker died)
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_BACKOFF_SECONDS = int(os.getenv("JOB_BACKOFF_SECONDS", "30"))
+JOB_BACKOFF_MAX_SECONDS = int(os.getenv("JOB_BACKOFF_MAX_SECONDS", "3600"))
+JOB_HEARTBEAT_SECONDS = int(os.getenv("JOB_HEARTBEAT_SECONDS", "30"))
+JOB_STALE_SECONDS = int(os.getenv("JOB_STALE_SECONDS", "300"))
+
+# College reports (api/reports.py): built by a job, kept in STORAGES["reports"];
+# clients polling GET /api/colleges/<id>/report/<xlsx|pdf>/ are told to retry after this many seconds
+REPORT_RETRY_SECONDS = int(os.getenv("REPORT_RETRY_SECONDS", "5"))
+
+# PostgreSQL: partition api_partnerships by date_started year (api/partitioning.py).
+# Applied by migration 0025 on new databases; existing ones: `manage.py partition_partnerships --enable`.
+# Yearly partitions are kept PARTITION_YEARS_AHEAD years ahead by `manage.py partition_partnerships`.
+PARTITION_PARTNERSHIPS = os.getenv("PARTITION_PARTNERSHIPS", "False") == "True"
+PARTITION_YEARS_AHEAD = int(os.getenv("PARTITION_YEARS_AHEAD", "2"))
+
+# Archive tier (api/archive.py): `manage.py archive_partnerships` moves partnerships
+# whose date_ended is more than ARCHIVE_AFTER_DAYS ago out of the hot table
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "1095"))
+
+# Django admin (api/admin.py): unfiltered changelists of tables bigger than this
+# show PostgreSQL's row estimate instead of running COUNT(*)
+ADMIN_EXACT_COUNT_LIMIT = int(os.getenv("ADMIN_EXACT_COUNT_LIMIT", "10000"))
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -189,13 +353,24 @@ USE_TZ = True
 STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+# Files built by `manage.py build_schema` have the schema's hash in their name,
+# so whitenoise can tell browsers/CDNs to cache them forever.
+WHITENOISE_IMMUTABLE_FILE_TEST = r'/schema/openapi-[^/]+-[0-9a-f]{12}\.json$'
+
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Media goes through api.storage.ContentAddressedStorage: files are named by a
+# hash of their bytes, so identical logos are stored (and uploaded) once.
 if DEBUG:
     # 🧪 Local storage for development
     STORAGES = {
         "default": {
+            "BACKEND": "api.storage.ContentAddressedStorage",
+            "OPTIONS": {"backend": "django.core.files.storage.FileSystemStorage"},
+        },
+        # 📊 Generated XLSX/PDF reports (api/reports.py)
+        "reports": {
             "BACKEND": "django.core.files.storage.FileSystemStorage",
         },
         "staticfiles": {
@@ -206,7 +381,12 @@ else:
     # ☁️ Cloudinary for production
     STORAGES = {
         "default": {
-            "BACKEND": "cloudinary_storage.storage.MediaCloudinaryStorage",
+            "BACKEND": "api.storage.ContentAddressedStorage",
+            "OPTIONS": {"backend": "cloudinary_storage.storage.MediaCloudinaryStorage"},
+        },
+        # 📊 Generated XLSX/PDF reports: not images → Cloudinary "raw" resources
+        "reports": {
+            "BACKEND": "cloudinary_storage.storage.RawMediaCloudinaryStorage",
         },
         "staticfiles": {
             "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
@@ -228,7 +408,28 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
+    # orjson-backed JSON (same output as DRF's JSONRenderer, see api/renderers.py)
+    'DEFAULT_RENDERER_CLASSES': (
+        'api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'api.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    # Token-bucket rates per scope, enforced by api.middleware.ThrottleMiddleware
+    # before authentication ("N/s", "N/min", "N/hour", "N/day"; empty = off)
+    'DEFAULT_THROTTLE_RATES': {
+        'viewing': os.getenv("THROTTLE_VIEWING", "120/min"),
+        'login': os.getenv("THROTTLE_LOGIN", "10/min"),
+        'registration': os.getenv("THROTTLE_REGISTRATION", "5/hour"),
+        'admin_write': os.getenv("THROTTLE_ADMIN_WRITE", "60/min"),
+    },
+    # Proxies in front of the app (Render's load balancer) → which X-Forwarded-For
+    # entry is the real client IP
+    'NUM_PROXIES': int(os.getenv("NUM_PROXIES", "1")),
 }
 
 SPECTACULAR_SETTINGS = {